@@ -24,7 +24,7 @@ if TYPE_CHECKING:
 @dataclass
 class NPC(Actor):
     role: str = "student"
-    schedule: List[Tuple[str, object]] = field(default_factory=list)
+    schedule: List[Tuple[int, object]] = field(default_factory=list)
     pending_schedule: Optional["ScheduledActivity"] = None
     pending_activity: Optional["Activity"] = None
     pending_activity_start_minutes: Optional[int] = None
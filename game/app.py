@@ -16,6 +16,7 @@ def main(
     profile: str | None = None,
     map_override: str | None = None,
     dump_daily_plan: str | None = None,
+    level_of_detail: bool = False,
 ):
     cfg = load_config(profile=profile)
     random.seed(cfg.get('random_seed', 1337))
@@ -23,7 +24,10 @@ def main(
     default_map = data_cfg.get('map_file', 'data/campus_map.json')
     map_path = resolve_map_file(map_override, default_map)
     simulation = Simulation(cfg, map_path=map_path)
+    if level_of_detail:
+        simulation.set_level_of_detail(True)
     simulation.advance(ticks)
+    simulation.close()
     snapshot = simulation.snapshot()
 
     if dump_daily_plan:
@@ -54,6 +58,11 @@ if __name__ == '__main__':
         dest='dump_daily_plan',
         help='Write the generated daily plan to CSV at the given path.',
     )
+    parser.add_argument(
+        '--lod',
+        action='store_true',
+        help='Let NPCs travel abstractly instead of walking tile by tile (no NPC is observed headless).',
+    )
     args = parser.parse_args()
     main(
         ticks=args.ticks,
@@ -61,4 +70,5 @@ if __name__ == '__main__':
         profile=args.profile,
         map_override=args.map_name,
         dump_daily_plan=args.dump_daily_plan,
+        level_of_detail=args.lod,
     )
@@ -18,6 +18,7 @@ class Room:
 
 class MapGrid:
     def __init__(self, path: str):
+        self.path = path
         with open(path, 'r', encoding='utf-8') as fh:
             data = json.load(fh)
         self.tile_size = data['tile_size']
@@ -38,6 +39,15 @@ class MapGrid:
                 room_data.get('default_activity'),
             )
         self.rooms = rooms
+        # Tile -> room name, so position lookups are O(1); earlier rooms win on overlap.
+        self._room_tiles: list[list[str | None]] = [[None] * self.width for _ in range(self.height)]
+        for room in rooms.values():
+            rx, ry, rw, rh = room.rect
+            for y in range(max(ry, 0), min(ry + rh, self.height)):
+                row = self._room_tiles[y]
+                for x in range(max(rx, 0), min(rx + rw, self.width)):
+                    if row[x] is None:
+                        row[x] = room.name
 
         spawns: Dict[str, Tuple[Tuple[int, int], ...]] = {}
         for key, points in data.get('spawns', {}).items():
@@ -88,11 +98,14 @@ class MapGrid:
                         return nx, ny
         return x, y
 
+    def room_id_at(self, x: int, y: int) -> str | None:
+        if not self.in_bounds(x, y):
+            return None
+        return self._room_tiles[y][x]
+
     def room_for_position(self, x: int, y: int):
-        for room in self.rooms.values():
-            if room.contains(x, y):
-                return room
-        return None
+        name = self.room_id_at(x, y)
+        return self.rooms[name] if name is not None else None
 
     def spawn_points(self, role: str | None = None) -> Tuple[Tuple[int, int], ...]:
         candidates: list[Tuple[int, int]] = []
@@ -1,4 +1,33 @@
 from dataclasses import dataclass
+from typing import Mapping
+
+
+def parse_hhmm(value: str) -> int:
+    hours, minutes = map(int, value.split(":"))
+    return hours * 60 + minutes
+
+
+def format_minutes(minutes: int) -> str:
+    minutes %= 24 * 60
+    hours, mins = divmod(minutes, 60)
+    return f"{hours:02d}:{mins:02d}"
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """Half-open ``[start, end)`` minutes of the day; wraps past midnight when ``end < start``."""
+
+    start_minute: int
+    end_minute: int
+
+    @classmethod
+    def from_config(cls, payload: Mapping[str, object]) -> "TimeWindow":
+        return cls(parse_hhmm(str(payload["start"])), parse_hhmm(str(payload["end"])))
+
+    def contains(self, minute_of_day: int) -> bool:
+        if self.start_minute <= self.end_minute:
+            return self.start_minute <= minute_of_day < self.end_minute
+        return minute_of_day >= self.start_minute or minute_of_day < self.end_minute
 
 @dataclass
 class GameClock:
@@ -7,11 +36,13 @@ class GameClock:
     minute: float = 8*60
     def tick(self):
         self.minute = (self.minute + self.minutes_per_tick) % self.day_length_minutes
+    @property
+    def minute_of_day(self) -> int:
+        return int(self.minute) % self.day_length_minutes
     def get_time_str(self) -> str:
-        m = int(self.minute) % self.day_length_minutes
-        h, mm = divmod(m, 60)
-        return f"{h:02d}:{mm:02d}"
-    def minutes_until(self, hhmm:str) -> float:
-        h,m = map(int, hhmm.split(":")); target=(h*60+m)%self.day_length_minutes
-        cur=int(self.minute)%self.day_length_minutes
-        return float((target-cur)%self.day_length_minutes)
+        return format_minutes(self.minute_of_day)
+    def minutes_until(self, target: "int | str") -> float:
+        if isinstance(target, str):
+            target = parse_hhmm(target)
+        target %= self.day_length_minutes
+        return float((target-self.minute_of_day)%self.day_length_minutes)
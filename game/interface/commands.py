@@ -38,10 +38,34 @@ class CommandDispatcher:
         raise CommandError(f"Unknown command '{head}'")
 
     def _handle_schedule(self, tokens: Sequence[str]) -> CommandResult:
+        if tokens and tokens[0].lower() == "who":
+            return self._handle_schedule_who(tokens[1:])
+        if tokens and tokens[0].lower() == "override-group":
+            return self._handle_schedule_override_group(tokens[1:])
         if len(tokens) < 2 or tokens[0].lower() != "override":
-            raise CommandError("Usage: schedule override <npc> key=value ...")
+            raise CommandError(
+                "Usage: schedule override <npc> key=value ... | schedule override-group <npc,npc,...> key=value ... "
+                "| schedule who <room> HH:MM [HH:MM]"
+            )
         npc_id = tokens[1]
-        block_tokens = tokens[2:]
+        overrides = [self._parse_override_block(tokens[2:])]
+        updated = self._controls.override_schedule(npc_id, overrides)
+        return CommandResult(message=f"Override applied to {npc_id} with {len(updated)} block(s)")
+
+    def _handle_schedule_override_group(self, tokens: Sequence[str]) -> CommandResult:
+        if not tokens:
+            raise CommandError("Usage: schedule override-group <npc,npc,...> key=value ...")
+        npc_ids = [name.strip() for name in tokens[0].split(",") if name.strip()]
+        if not npc_ids:
+            raise CommandError("Provide at least one NPC for the group override")
+        block = self._parse_override_block(tokens[1:])
+        try:
+            updated = self._controls.override_group({npc_id: [dict(block)] for npc_id in npc_ids})
+        except KeyError as exc:
+            raise CommandError(str(exc.args[0])) from exc
+        return CommandResult(message=f"Override applied to {len(updated)} NPC(s): {', '.join(updated)}")
+
+    def _parse_override_block(self, block_tokens: Sequence[str]) -> MutableMapping[str, object]:
         if not block_tokens:
             raise CommandError("Provide at least one key=value pair for the override block")
         block: MutableMapping[str, object] = {}
@@ -59,9 +83,24 @@ class CommandDispatcher:
                 metadata[key.split(".", 1)[1]] = value.strip()
             else:
                 raise CommandError(f"Unsupported override attribute '{key}'")
-        overrides = [block]
-        updated = self._controls.override_schedule(npc_id, overrides)
-        return CommandResult(message=f"Override applied to {npc_id} with {len(updated)} block(s)")
+        return block
+
+    def _handle_schedule_who(self, tokens: Sequence[str]) -> CommandResult:
+        if len(tokens) not in (2, 3):
+            raise CommandError("Usage: schedule who <room> HH:MM [HH:MM]")
+        room_id, start = tokens[0], tokens[1]
+        end = tokens[2] if len(tokens) == 3 else None
+        try:
+            blocks = self._controls.scheduled_in(room_id, start, end)
+        except KeyError as exc:
+            raise CommandError(str(exc.args[0])) from exc
+        except ValueError as exc:
+            raise CommandError("Times must use HH:MM format") from exc
+        window = f"{start}-{end}" if end else start
+        if not blocks:
+            return CommandResult(message=f"Nobody is scheduled in {room_id} at {window}")
+        names = ", ".join(sorted({block.actor_id for block in blocks}))
+        return CommandResult(message=f"Scheduled in {room_id} at {window}: {names}")
 
     def _handle_summon(self, tokens: Sequence[str]) -> CommandResult:
         if len(tokens) < 2:
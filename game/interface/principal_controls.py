@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Mapping, MutableMapping, Sequence, TYPE_CHECKING
+from typing import Dict, Iterable, List, Mapping, MutableMapping, Sequence, TYPE_CHECKING
 
 from ..actors.base_actor import NPCState
-from ..simulation.schedule_generator import DailySchedule, format_minutes
+from ..simulation.schedule_generator import DailySchedule, format_minutes, parse_hhmm
+from ..simulation.schedule_store import ScheduleRow
 from ..systems.schedule_system import ScheduledActivity
 
 if TYPE_CHECKING:
@@ -15,6 +16,11 @@ if False:  # pragma: no cover - type checking helper
     from ..simulation import Simulation
 
 
+def _detached(blocks: Sequence[DailySchedule]) -> List[DailySchedule]:
+    # Store rows are recycled once a later override releases them, so history keeps copies.
+    return [block.to_block() if isinstance(block, ScheduleRow) else block for block in blocks]
+
+
 @dataclass
 class OverrideRecord:
     npc_id: str
@@ -41,16 +47,61 @@ class PrincipalControls:
         *,
         reason: str = "principal_override",
     ) -> List[DailySchedule]:
+        updated = self._apply_overrides({npc_id: new_blocks}, reason=reason, action="override_schedule")
+        return updated[npc_id]
+
+    def override_group(
+        self,
+        overrides: Mapping[str, Sequence[Mapping[str, object]]],
+        *,
+        reason: str = "principal_override",
+    ) -> Dict[str, List[DailySchedule]]:
+        """Override several NPCs at once with a single re-planning pass."""
+
+        return self._apply_overrides(overrides, reason=reason, action="override_group")
+
+    def _apply_overrides(
+        self,
+        overrides: Mapping[str, Sequence[Mapping[str, object]]],
+        *,
+        reason: str,
+        action: str,
+    ) -> Dict[str, List[DailySchedule]]:
         schedule_system = self._simulation.schedule_system
-        updated = schedule_system.override_plan(npc_id, new_blocks, source=reason)
-        current_minutes = int(self._simulation.clock.minute) % self._simulation.clock.day_length_minutes
-        record = OverrideRecord(
-            npc_id=npc_id,
-            blocks=list(updated),
-            reason=reason,
-            timestamp=format_minutes(current_minutes),
+        updated = schedule_system.override_plans(overrides, source=reason)
+        current_minutes = self._simulation.clock.minute_of_day
+        for npc_id, blocks in updated.items():
+            self._record_override(npc_id, blocks, reason=reason, current_minutes=current_minutes)
+        self._simulation.event_logger.log_principal_action(
+            current_minutes,
+            action=action,
+            subject=",".join(updated),
+            details={
+                "npcs": list(updated),
+                "blocks": {npc_id: [block.activity_id for block in blocks] for npc_id, blocks in updated.items()},
+            },
+        )
+        schedule_system.update(current_minutes)
+        return updated
+
+    def _record_override(
+        self,
+        npc_id: str,
+        blocks: Sequence[DailySchedule],
+        *,
+        reason: str,
+        current_minutes: int,
+    ) -> None:
+        """Keep the override in history and interrupt whatever the NPC was doing."""
+
+        self._history.append(
+            OverrideRecord(
+                npc_id=npc_id,
+                blocks=_detached(blocks),
+                reason=reason,
+                timestamp=format_minutes(current_minutes),
+            )
         )
-        self._history.append(record)
         npc = self._simulation.get_npc(npc_id)
         if npc and npc.current_activity:
             self._simulation.activity_system.interrupt(
@@ -58,14 +109,15 @@ class PrincipalControls:
                 reason="override",
                 current_minutes=current_minutes,
             )
-        self._simulation.event_logger.log_principal_action(
-            format_minutes(current_minutes),
-            action="override_schedule",
-            subject=npc_id,
-            details={"blocks": [block.activity_id for block in updated]},
-        )
-        schedule_system.update(self._simulation.clock.get_time_str())
-        return updated
+
+    def scheduled_in(self, room_id: str, start: str, end: str | None = None) -> List[DailySchedule]:
+        """Blocks planned in ``room_id`` at ``start`` (HH:MM) or between ``start`` and ``end``."""
+
+        if room_id not in self._simulation.grid.rooms:
+            raise KeyError(f"Unknown room '{room_id}'")
+        start_minutes = parse_hhmm(start)
+        end_minutes = parse_hhmm(end) if end is not None else None
+        return self._simulation.schedule_system.scheduled_in(room_id, start_minutes, end_minutes)
 
     def summon_student(
         self,
@@ -77,7 +129,7 @@ class PrincipalControls:
         npc = self._simulation.get_npc(npc_id)
         if npc is None:
             raise ValueError(f"Unknown NPC '{npc_id}'")
-        current_minutes = int(self._simulation.clock.minute) % self._simulation.clock.day_length_minutes
+        current_minutes = self._simulation.clock.minute_of_day
         if npc.current_activity:
             self._simulation.activity_system.interrupt(
                 npc,
@@ -103,8 +155,9 @@ class PrincipalControls:
         npc.pending_destination = destination
         npc.set_target(*destination)
         npc.state = NPCState.MOVING
+        self._simulation.mark_npc_dirty(npc)
         self._simulation.event_logger.log_principal_action(
-            format_minutes(current_minutes),
+            current_minutes,
             action="summon_student",
             subject=npc_id,
             details={"room": target_room_id},
@@ -112,22 +165,22 @@ class PrincipalControls:
         return activity
 
     def mark_alert_resolved(self, alert_id: str) -> None:
-        current_minutes = int(self._simulation.clock.minute) % self._simulation.clock.day_length_minutes
+        current_minutes = self._simulation.clock.minute_of_day
         alert = self.alert_bus.acknowledge(alert_id, minute_stamp=current_minutes)
         self._simulation.event_logger.log_principal_action(
-            alert.acknowledged_at or alert.created_at,
+            current_minutes,
             action="resolve_alert",
             subject=alert_id,
             details={"category": alert.category},
         )
 
     def broadcast_message(self, message: str, audience_filter: Mapping[str, object] | None = None) -> None:
-        current_minutes = int(self._simulation.clock.minute) % self._simulation.clock.day_length_minutes
+        current_minutes = self._simulation.clock.minute_of_day
         payload: MutableMapping[str, object] = {"message": message}
         if audience_filter:
             payload["audience"] = dict(audience_filter)
         self._simulation.event_logger.log_principal_action(
-            format_minutes(current_minutes),
+            current_minutes,
             action="broadcast",
             subject="principal",
             details=payload,
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, Iterable, List, Mapping, Optional
 
+from ..core.time_clock import format_minutes
+
 
 @dataclass
 class ActivityEvent:
-    """Structured entry for activity lifecycle and principal changes."""
+    """Structured entry for activity lifecycle and principal changes.
+
+    ``minute`` is the in-game minute of day; the ``HH:MM`` form is only
+    produced on demand through :attr:`timestamp` and :meth:`to_dict`.
+    """
 
     kind: str
-    timestamp: str
+    minute: int
     npc: str
     activity: str
     room: str
     state: Dict[str, Any]
 
+    @property
+    def timestamp(self) -> str:
+        return format_minutes(self.minute)
+
+    def to_dict(self) -> dict:
+        payload = asdict(self)
+        payload["timestamp"] = self.timestamp
+        return payload
+
 
 class EventLogger:
     """Collects activity lifecycle events for analysis and debugging."""
@@ -24,40 +39,40 @@ class EventLogger:
 
     def log_activity_start(
         self,
-        timestamp: str,
+        minute_stamp: int,
         *,
         npc: str,
         activity: str,
         room: str,
         state: Optional[Dict[str, Any]] = None,
     ) -> None:
-        self._append("activity_start", timestamp, npc=npc, activity=activity, room=room, state=state)
+        self._append("activity_start", minute_stamp, npc=npc, activity=activity, room=room, state=state)
 
     def log_activity_end(
         self,
-        timestamp: str,
+        minute_stamp: int,
         *,
         npc: str,
         activity: str,
         room: str,
         state: Optional[Dict[str, Any]] = None,
     ) -> None:
-        self._append("activity_end", timestamp, npc=npc, activity=activity, room=room, state=state)
+        self._append("activity_end", minute_stamp, npc=npc, activity=activity, room=room, state=state)
 
     def log_activity_interrupt(
         self,
-        timestamp: str,
+        minute_stamp: int,
         *,
         npc: str,
         activity: str,
         room: str,
         state: Optional[Dict[str, Any]] = None,
     ) -> None:
-        self._append("activity_interrupt", timestamp, npc=npc, activity=activity, room=room, state=state)
+        self._append("activity_interrupt", minute_stamp, npc=npc, activity=activity, room=room, state=state)
 
     def log_principal_action(
         self,
-        timestamp: str,
+        minute_stamp: int,
         *,
         action: str,
         subject: str,
@@ -70,7 +85,7 @@ class EventLogger:
                 room = room_value
         self._append(
             "principal_action",
-            timestamp,
+            minute_stamp,
             npc=subject,
             activity=action,
             room=room,
@@ -86,7 +101,7 @@ class EventLogger:
     def _append(
         self,
         kind: str,
-        timestamp: str,
+        minute_stamp: int,
         *,
         npc: str,
         activity: str,
@@ -95,7 +110,7 @@ class EventLogger:
     ) -> None:
         payload = ActivityEvent(
             kind=kind,
-            timestamp=timestamp,
+            minute=minute_stamp,
             npc=npc,
             activity=activity,
             room=room,
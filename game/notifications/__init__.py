@@ -1,8 +1,11 @@
 """Notification primitives for principal workflows."""
 
 from .alerts import Alert, AlertBus
+from .delivery import BACKPRESSURE_POLICIES, AlertDeliveryQueue
 
 __all__ = [
     "Alert",
     "AlertBus",
+    "AlertDeliveryQueue",
+    "BACKPRESSURE_POLICIES",
 ]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 import uuid
-from dataclasses import dataclass, field
-from typing import Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Callable, Deque, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple
 
 from ..simulation.schedule_generator import format_minutes
+from .delivery import BACKPRESSURE_POLICIES, AlertDeliveryQueue
 
 
 @dataclass(slots=True)
@@ -19,27 +21,130 @@ class Alert:
     created_at: str
     acknowledged_at: Optional[str] = None
     metadata: Mapping[str, object] = field(default_factory=dict)
+    count: int = 1
 
     def acknowledged(self) -> bool:
         return self.acknowledged_at is not None
 
 
+_CooldownKey = Tuple[str, Optional[str], Tuple[str, ...]]
+
+
+class _Aggregate:
+    """Open aggregation window for one ``(category, room)`` pair."""
+
+    __slots__ = ("alert_id", "opened_at", "window", "message", "members", "grown")
+
+    def __init__(self, alert: Alert, opened_at: int, window: int) -> None:
+        self.alert_id = alert.id
+        self.opened_at = opened_at
+        self.window = window
+        self.message = alert.message
+        self.members: Set[str] = set(alert.npc_ids)
+        self.grown = False
+
+
 class AlertBus:
-    """Simple pub/sub channel for simulation alerts with cooldown support."""
+    """Simple pub/sub channel for simulation alerts with cooldown support.
+
+    The last alert per cooldown key, the unacknowledged alerts and the latest
+    alert per category are indexed, so publishing and the usual queries do
+    not scan the history. The history keeps the newest ``history_limit``
+    alerts (``None`` keeps everything). Unacknowledged alerts stay queryable
+    until they are acknowledged, even after they leave the history.
+    Cooldowns are independent of the history: each key stays suppressed
+    until ``cooldown_minutes`` have passed, however many alerts were raised
+    meanwhile, and expired keys are pruned on the next publish.
+
+    Minute stamps are minutes of the day. With ``day_length_minutes`` set,
+    cooldowns and aggregation windows measure elapsed time modulo the day,
+    so windows opened just before midnight still close just after it.
+
+    Subscribers registered with ``asynchronous=True`` are called from an
+    :class:`AlertDeliveryQueue` worker instead of inside :meth:`publish` /
+    :meth:`acknowledge`, so slow consumers (disk, UI) do not stretch the
+    tick. They receive a copy of the alert as it was when it was queued,
+    never the live object the bus keeps mutating. The queue holds ``delivery_queue_size`` alerts and applies the
+    ``backpressure`` policy when full; call :meth:`flush` or :meth:`close`
+    before exiting so queued alerts are delivered.
+
+    Categories listed in ``aggregation_windows`` (category -> minutes) fold
+    every alert for the same room raised within that many minutes of the
+    first into one aggregate alert, growing its ``npc_ids`` and ``count``.
+    A fold is O(1) and does not notify anyone; :meth:`flush_aggregates`
+    (called once per tick by the simulation) refreshes each grown aggregate
+    and notifies subscribers once. Acknowledging an aggregate closes it.
+    """
 
-    def __init__(self, *, cooldown_minutes: int = 10) -> None:
+    def __init__(
+        self,
+        *,
+        cooldown_minutes: int = 10,
+        history_limit: int | None = 1000,
+        delivery_queue_size: int = 1024,
+        backpressure: str = "drop_oldest",
+        aggregation_windows: Mapping[str, int] | None = None,
+        day_length_minutes: int | None = None,
+    ) -> None:
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"backpressure must be one of {BACKPRESSURE_POLICIES}")
         self._cooldown_minutes = max(0, cooldown_minutes)
+        self._history_limit = None if history_limit is None else max(1, int(history_limit))
+        self._day_length = int(day_length_minutes) if day_length_minutes else None
         self._alerts: MutableMapping[str, Alert] = {}
         self._subscribers: List[Callable[[Alert], None]] = []
-        self._cooldowns: Dict[Tuple[str, Optional[str], Tuple[str, ...]], int] = {}
-        self._history: List[str] = []
+        self._async_subscribers: List[Callable[[Alert], None]] = []
+        self._delivery_queue_size = max(1, int(delivery_queue_size))
+        self._backpressure = backpressure
+        self._delivery: Optional[AlertDeliveryQueue] = None
+        self._aggregation_windows = {
+            category: int(minutes) for category, minutes in (aggregation_windows or {}).items() if int(minutes) > 0
+        }
+        self._aggregates: Dict[Tuple[str, Optional[str]], _Aggregate] = {}
+        self._grown_aggregates: Dict[str, _Aggregate] = {}
+        self._cooldowns: Dict[_CooldownKey, int] = {}
+        self._cooldown_order: Deque[Tuple[int, _CooldownKey]] = deque()
+        self._last_by_key: Dict[_CooldownKey, Alert] = {}
+        self._active: Dict[str, Alert] = {}
+        self._latest_by_category: Dict[str, str] = {}
+        self._history: Deque[str] = deque()
+        self._evicted: Set[str] = set()
 
-    def subscribe(self, callback: Callable[[Alert], None]) -> None:
-        self._subscribers.append(callback)
+    def subscribe(self, callback: Callable[[Alert], None], *, asynchronous: bool = False) -> None:
+        if asynchronous:
+            self._async_subscribers.append(callback)
+        else:
+            self._subscribers.append(callback)
 
     def unsubscribe(self, callback: Callable[[Alert], None]) -> None:
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        for subscribers in (self._subscribers, self._async_subscribers):
+            if callback in subscribers:
+                subscribers.remove(callback)
+
+    @property
+    def cooldown_minutes(self) -> int:
+        return self._cooldown_minutes
+
+    @property
+    def delivery(self) -> Optional[AlertDeliveryQueue]:
+        """The running asynchronous delivery queue, if any subscriber needed one."""
+
+        return self._delivery
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for queued asynchronous deliveries; ``False`` on timeout."""
+
+        return self._delivery.flush(timeout) if self._delivery is not None else True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Deliver queued alerts and stop the delivery worker.
+
+        Publishing afterwards starts a new worker if asynchronous subscribers
+        remain.
+        """
+
+        delivery, self._delivery = self._delivery, None
+        return delivery.close(timeout) if delivery is not None else True
 
     def publish(
         self,
@@ -56,20 +161,12 @@ class AlertBus:
 
         normalized_npc_ids = tuple(sorted(npc_ids or ()))
         cooldown_key = (category, room_id, normalized_npc_ids)
-        last_minute = self._cooldowns.get(cooldown_key)
-        if last_minute is not None and minute_stamp - last_minute < self._cooldown_minutes:
-            existing_id = next(
-                (
-                    alert_id
-                    for alert_id in reversed(self._history)
-                    if self._alerts[alert_id].category == category
-                    and self._alerts[alert_id].room_id == room_id
-                    and self._alerts[alert_id].npc_ids == normalized_npc_ids
-                ),
-                None,
-            )
-            if existing_id is not None:
-                return self._alerts[existing_id]
+        self._prune_cooldowns(minute_stamp)
+        if cooldown_key in self._cooldowns:
+            return self._last_by_key[cooldown_key]
+        aggregate = self._open_aggregate(category, room_id, minute_stamp)
+        if aggregate is not None:
+            return self._fold(aggregate, cooldown_key, minute_stamp)
         alert_id = str(uuid.uuid4())
         alert = Alert(
             id=alert_id,
@@ -82,38 +179,146 @@ class AlertBus:
             metadata=dict(metadata or {}),
         )
         self._alerts[alert_id] = alert
+        self._active[alert_id] = alert
+        self._latest_by_category[category] = alert_id
         self._history.append(alert_id)
-        self._cooldowns[cooldown_key] = minute_stamp
-        for subscriber in tuple(self._subscribers):
-            subscriber(alert)
+        self._start_cooldown(cooldown_key, alert, minute_stamp)
+        window = self._aggregation_windows.get(category)
+        if window:
+            self._aggregates[(category, room_id)] = _Aggregate(alert, minute_stamp, window)
+        self._trim_history()
+        self._notify(alert)
         return alert
 
     def acknowledge(self, alert_id: str, *, minute_stamp: Optional[int] = None) -> Alert:
         alert = self._alerts[alert_id]
+        grown = self._grown_aggregates.pop(alert_id, None)
+        if grown is not None:
+            self._refresh_aggregate(alert, grown)
         if alert.acknowledged_at is None:
             alert.acknowledged_at = (
                 format_minutes(minute_stamp) if minute_stamp is not None else alert.created_at
             )
-            for subscriber in tuple(self._subscribers):
-                subscriber(alert)
+            self._active.pop(alert_id, None)
+            if alert_id in self._evicted:
+                self._evicted.discard(alert_id)
+                del self._alerts[alert_id]
+            self._notify(alert)
         return alert
 
+    def flush_aggregates(self) -> int:
+        """Refresh aggregates that grew since the last flush and notify subscribers once each."""
+
+        grown, self._grown_aggregates = self._grown_aggregates, {}
+        for alert_id, aggregate in grown.items():
+            alert = self._alerts.get(alert_id)
+            if alert is not None:
+                self._refresh_aggregate(alert, aggregate)
+                self._notify(alert)
+        return len(grown)
+
+    def get(self, alert_id: str) -> Optional[Alert]:
+        return self._alerts.get(alert_id)
+
     def active_alerts(self) -> List[Alert]:
-        return [self._alerts[alert_id] for alert_id in self._history if not self._alerts[alert_id].acknowledged()]
+        return list(self._active.values())
 
     def iter_history(self) -> Iterable[Alert]:
         for alert_id in self._history:
             yield self._alerts[alert_id]
 
     def latest_by_category(self, category: str) -> Optional[Alert]:
-        for alert_id in reversed(self._history):
-            alert = self._alerts[alert_id]
-            if alert.category == category:
-                return alert
-        return None
+        alert_id = self._latest_by_category.get(category)
+        return self._alerts.get(alert_id) if alert_id is not None else None
 
     def clear(self) -> None:
         self._alerts.clear()
         self._history.clear()
         self._cooldowns.clear()
+        self._cooldown_order.clear()
+        self._last_by_key.clear()
+        self._active.clear()
+        self._latest_by_category.clear()
+        self._evicted.clear()
+        self._aggregates.clear()
+        self._grown_aggregates.clear()
+
+    def _open_aggregate(self, category: str, room_id: Optional[str], minute_stamp: int) -> Optional[_Aggregate]:
+        aggregate = self._aggregates.get((category, room_id))
+        if aggregate is None:
+            return None
+        alert = self._alerts.get(aggregate.alert_id)
+        expired = self._elapsed(aggregate.opened_at, minute_stamp) >= aggregate.window
+        if alert is None or alert.acknowledged() or expired:
+            del self._aggregates[(category, room_id)]
+            return None
+        return aggregate
+
+    def _fold(self, aggregate: _Aggregate, cooldown_key: _CooldownKey, minute_stamp: int) -> Alert:
+        alert = self._alerts[aggregate.alert_id]
+        alert.count += 1
+        for npc_id in cooldown_key[2]:
+            if npc_id not in aggregate.members:
+                aggregate.members.add(npc_id)
+                aggregate.grown = True
+        # Folded keys share the aggregate's cooldown, as if they had raised it.
+        self._start_cooldown(cooldown_key, alert, minute_stamp)
+        self._grown_aggregates[alert.id] = aggregate
+        return alert
 
+    def _refresh_aggregate(self, alert: Alert, aggregate: _Aggregate) -> None:
+        if aggregate.grown:
+            alert.npc_ids = tuple(sorted(aggregate.members))
+            aggregate.grown = False
+        alert.message = f"{aggregate.message} (+{alert.count - 1} more)"
+
+    def _elapsed(self, since: int, minute_stamp: int) -> int:
+        if self._day_length is None:
+            return minute_stamp - since
+        return (minute_stamp - since) % self._day_length
+
+    def _start_cooldown(self, key: _CooldownKey, alert: Alert, minute_stamp: int) -> None:
+        if self._cooldown_minutes <= 0:
+            return
+        self._cooldowns[key] = minute_stamp
+        self._last_by_key[key] = alert
+        self._cooldown_order.append((minute_stamp, key))
+
+    def _prune_cooldowns(self, minute_stamp: int) -> None:
+        order = self._cooldown_order
+        while order and self._elapsed(order[0][0], minute_stamp) >= self._cooldown_minutes:
+            started, key = order.popleft()
+            # A key restarted later has a newer entry further down the queue.
+            if self._cooldowns.get(key) == started:
+                del self._cooldowns[key]
+                del self._last_by_key[key]
+
+    def _notify(self, alert: Alert) -> None:
+        for subscriber in tuple(self._subscribers):
+            subscriber(alert)
+        if self._async_subscribers:
+            if self._delivery is None:
+                self._delivery = AlertDeliveryQueue(
+                    self._deliver_async,
+                    maxsize=self._delivery_queue_size,
+                    policy=self._backpressure,
+                )
+            self._delivery.put(replace(alert))
+
+    def _deliver_async(self, alert: Alert) -> None:
+        for subscriber in tuple(self._async_subscribers):
+            subscriber(alert)
+
+    def _trim_history(self) -> None:
+        limit = self._history_limit
+        if limit is None:
+            return
+        while len(self._history) > limit:
+            alert_id = self._history.popleft()
+            alert = self._alerts[alert_id]
+            if self._latest_by_category.get(alert.category) == alert_id:
+                del self._latest_by_category[alert.category]
+            if alert.acknowledged():
+                del self._alerts[alert_id]
+            else:
+                self._evicted.add(alert_id)
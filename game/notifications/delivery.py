@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque
+
+if TYPE_CHECKING:
+    from .alerts import Alert
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ("drop_oldest", "block")
+
+
+class AlertDeliveryQueue:
+    """Bounded hand-off from the simulation thread to slow alert subscribers.
+
+    :meth:`put` only enqueues; a daemon worker thread calls ``deliver`` for
+    each alert in publish order. When ``maxsize`` alerts are pending,
+    ``drop_oldest`` discards the oldest one (counted in :attr:`dropped`) and
+    ``block`` makes the publisher wait for space. Alerts put from the worker
+    itself (a subscriber publishing) never wait, so ``block`` cannot
+    deadlock. Exceptions raised by ``deliver`` are logged and counted in
+    :attr:`failed` without stopping the worker.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[["Alert"], None],
+        *,
+        maxsize: int = 1024,
+        policy: str = "drop_oldest",
+        name: str = "alert-delivery",
+    ) -> None:
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"policy must be one of {BACKPRESSURE_POLICIES}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._deliver = deliver
+        self._pending: Deque["Alert"] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._dropped = 0
+        self._failed = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, alert: "Alert") -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Alert delivery queue is closed")
+            if len(self._pending) >= self.maxsize:
+                if self.policy == "drop_oldest":
+                    self._pending.popleft()
+                    self._dropped += 1
+                elif threading.current_thread() is not self._thread:
+                    self._condition.wait_for(lambda: len(self._pending) < self.maxsize or self._closed)
+                    if self._closed:
+                        raise RuntimeError("Alert delivery queue is closed")
+            self._pending.append(alert)
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued alert has been delivered; ``False`` on timeout."""
+
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Deliver what is queued, then stop the worker; ``False`` if that timed out."""
+
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed and not self._thread.is_alive()
+
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                alert = self._pending.popleft()
+                self._busy = True
+                condition.notify_all()
+            try:
+                self._deliver(alert)
+            except Exception:
+                self._failed += 1
+                _LOGGER.exception("Alert delivery failed for %s", alert.id)
+            finally:
+                with condition:
+                    self._busy = False
+                    condition.notify_all()
+
+
+__all__ = ["AlertDeliveryQueue", "BACKPRESSURE_POLICIES"]
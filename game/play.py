@@ -13,6 +13,7 @@ from .config import load_config
 from .core.map import MapGrid
 from .interface import PrincipalControls
 from .simulation import Simulation, resolve_map_file
+from .simulation.runner import PositionFrame, SimulationRunner
 from .systems.player_controller import InputState, PlayerController
 from .ui.principal_overlay import format_overlay
 
@@ -29,24 +30,36 @@ TEXT_COLOR = (235, 235, 235)
 BACKGROUND = (10, 12, 18)
 
 
-def _nearest_npc(player: Player, simulation: Simulation):
+def _nearest_npc(player: Player, npc_positions: dict[str, tuple[float, float]]):
     px, py = player.position
     closest = None
     best_dist = float('inf')
-    for npc in simulation.npcs:
-        nx, ny = npc.x + 0.5, npc.y + 0.5
-        dist = hypot(px - nx, py - ny)
+    for name, (x, y) in npc_positions.items():
+        dist = hypot(px - (x + 0.5), py - (y + 0.5))
         if dist < best_dist:
-            closest = npc
+            closest = name
             best_dist = dist
     return closest, best_dist
 
 
+def _visible_tiles(
+    grid: MapGrid, tile_size: int, offset_x: int, offset_y: int, width: int, height: int
+) -> tuple[int, int, int, int]:
+    """Tile rectangle ``(x, y, width, height)`` the camera currently shows."""
+
+    left = max(0, -offset_x // tile_size)
+    top = max(0, -offset_y // tile_size)
+    right = min(grid.width, -(-(width - offset_x) // tile_size))
+    bottom = min(grid.height, -(-(height - offset_y) // tile_size))
+    return left, top, max(0, right - left), max(0, bottom - top)
+
+
 def _draw_map(
     surface,
     grid: MapGrid,
     player: Player,
-    simulation: Simulation,
+    frame: PositionFrame,
+    npc_positions: dict[str, tuple[float, float]],
     font,
     prompt: Optional[str],
     message: Optional[str],
@@ -98,18 +111,18 @@ def _draw_map(
     )
     pygame.draw.rect(surface, PLAYER_COLOR, player_marker, border_radius=6)
 
-    for npc in simulation.npcs:
+    for name, (npc_x, npc_y) in npc_positions.items():
         marker = pygame.Rect(0, 0, tile_size * 0.5, tile_size * 0.5)
         marker.center = (
-            offset_x + (npc.x + 0.5) * tile_size,
-            offset_y + (npc.y + 0.5) * tile_size,
+            offset_x + (npc_x + 0.5) * tile_size,
+            offset_y + (npc_y + 0.5) * tile_size,
         )
         pygame.draw.rect(surface, NPC_COLOR, marker, border_radius=6)
-        label = font.render(f"{npc.name} ({npc.state.value})", True, TEXT_COLOR)
+        label = font.render(f"{name} ({frame.states.get(name, '')})", True, TEXT_COLOR)
         surface.blit(label, (marker.x, marker.y - 18))
 
     info_lines = [
-        f"Time: {simulation.clock.get_time_str()}",
+        f"Time: {frame.clock_text}",
         "Controls: WASD / Arrow Keys",
         "Esc to exit, E to interact",
         "Hold Tab: room activity overlay | Press P: principal console",
@@ -184,9 +197,16 @@ def run(profile: str | None = None, map_override: str | None = None) -> None:
     player.teleport_to_tile(spawn_x, spawn_y)
     controller = PlayerController(grid, cfg['movement']['pc_speed_tiles_per_sec'])
     simulation = Simulation(cfg, grid, map_path=map_path)
+    # NPCs inside the camera walk tile by tile; the rest travel abstractly.
+    viewport = _visible_tiles(grid, tile_size, offset_x, offset_y, target_width, target_height)
+    simulation.set_level_of_detail(True, viewport=viewport)
     principal_controls = PrincipalControls(simulation)
-    tick_rate = float(cfg['time']['tick_rate_hz'])
-    tick_accumulator = 0.0
+    runner = SimulationRunner(
+        simulation,
+        tick_rate_hz=float(cfg['time']['tick_rate_hz']),
+        max_catchup_ticks=int(cfg['time'].get('max_catchup_ticks', 5)),
+    )
+    runner.start()
 
     principal_overlay_visible = False
 
@@ -210,28 +230,33 @@ def run(profile: str | None = None, map_override: str | None = None) -> None:
                     principal_overlay_visible
                     and pygame.K_1 <= event.key <= pygame.K_9
                 ):
-                    alerts = simulation.alert_bus.active_alerts()
-                    index = event.key - pygame.K_1
-                    if index < len(alerts):
-                        principal_controls.mark_alert_resolved(alerts[index].id)
-                        message_text = f"Acknowledged {alerts[index].category}"
-                        message_timer = 2.0
+                    with runner.lock:
+                        alerts = simulation.alert_bus.active_alerts()
+                        index = event.key - pygame.K_1
+                        if index < len(alerts):
+                            principal_controls.mark_alert_resolved(alerts[index].id)
+                            message_text = f"Acknowledged {alerts[index].category}"
+                            message_timer = 2.0
                 elif (
                     principal_overlay_visible
                     and event.key == pygame.K_b
                     and pygame.key.get_mods() & pygame.KMOD_SHIFT
                 ):
-                    principal_controls.broadcast_message(
-                        "Reminder: adhere to quiet hours",
-                        {"scope": "campus"},
-                    )
+                    with runner.lock:
+                        principal_controls.broadcast_message(
+                            "Reminder: adhere to quiet hours",
+                            {"scope": "campus"},
+                        )
                     message_text = "Broadcast issued"
                     message_timer = 2.0
                 elif event.key == pygame.K_e:
-                    npc, dist = _nearest_npc(player, simulation)
-                    if npc and dist <= 1.5:
-                        message_text = simulation.interact_with(npc)
-                        message_timer = 3.0
+                    npc_name, dist = _nearest_npc(player, runner.interpolated_positions())
+                    if npc_name and dist <= 1.5:
+                        with runner.lock:
+                            npc = simulation.get_npc(npc_name)
+                            if npc is not None:
+                                message_text = simulation.interact_with(npc)
+                                message_timer = 3.0
 
         keys = pygame.key.get_pressed()
         input_state = InputState.from_axes(
@@ -242,31 +267,35 @@ def run(profile: str | None = None, map_override: str | None = None) -> None:
         )
         controller.update(player, input_state, delta_seconds)
 
-        tick_accumulator += delta_seconds * tick_rate
-        while tick_accumulator >= 1.0:
-            simulation.tick()
-            tick_accumulator -= 1.0
+        visible = _visible_tiles(grid, tile_size, offset_x, offset_y, target_width, target_height)
+        if visible != viewport:
+            viewport = visible
+            with runner.lock:
+                simulation.set_level_of_detail(True, viewport=viewport)
 
         if message_timer > 0.0:
             message_timer -= delta_seconds
             if message_timer <= 0.0:
                 message_text = None
 
-        npc, dist = _nearest_npc(player, simulation)
+        npc_positions = runner.interpolated_positions()
+        npc_name, dist = _nearest_npc(player, npc_positions)
         prompt = None
-        if npc and dist <= 1.5:
-            prompt = f"Press E to chat with {npc.name}"
+        if npc_name and dist <= 1.5:
+            prompt = f"Press E to chat with {npc_name}"
 
         activity_overlay = None
         if principal_overlay_visible:
-            alerts = simulation.alert_bus.active_alerts()
-            activity_overlay = format_overlay(alerts, principal_controls.recent_overrides())
+            with runner.lock:
+                alerts = simulation.alert_bus.active_alerts()
+                activity_overlay = format_overlay(alerts, principal_controls.recent_overrides())
         elif keys[pygame.K_TAB]:
             tile_x = int(player.position[0])
             tile_y = int(player.position[1])
             room = grid.room_for_position(tile_x, tile_y)
             if room:
-                snapshot = simulation.room_manager.snapshot(room.name)
+                with runner.lock:
+                    snapshot = simulation.room_manager.snapshot(room.name)
                 lines = [f"{room.name}: {len(snapshot.occupants)} occupants"]
                 if snapshot.activity_counts:
                     for label, count in sorted(snapshot.activity_counts.items()):
@@ -284,7 +313,8 @@ def run(profile: str | None = None, map_override: str | None = None) -> None:
             surface,
             grid,
             player,
-            simulation,
+            runner.latest_frame(),
+            npc_positions,
             font,
             prompt,
             message_text,
@@ -294,6 +324,8 @@ def run(profile: str | None = None, map_override: str | None = None) -> None:
         )
         pygame.display.flip()
 
+    runner.stop()
+    simulation.close()
     pygame.quit()
 
 
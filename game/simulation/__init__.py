@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import random
+from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 import yaml
 
@@ -13,11 +14,13 @@ from ..core.time_clock import GameClock
 from ..logging import EventLogger
 from ..systems.activity_system import ActivitySystem
 from ..systems.movement_system import MovementSystem
-from ..world import RoomManager
+from ..world import OccupancyRecorder, RoomManager
 from .activities import ActivityCatalog
+from .change_tracker import ChangeLog
+from .alert_rules import AlertRuleEngine
 
 if TYPE_CHECKING:
-    from ..notifications import AlertBus
+    from ..notifications import Alert, AlertBus
     from ..systems.schedule_system import ScheduleSystem
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -61,9 +64,10 @@ def resolve_map_file(map_option: str | Path | None, default: str | Path) -> Path
     return resolve_data_path(candidate)
 
 
-def _hhmm_to_minutes(hhmm: str) -> int:
-    hours, minutes = map(int, hhmm.split(':'))
-    return hours * 60 + minutes
+def _alert_payload(alert: 'Alert') -> dict:
+    payload = asdict(alert)
+    payload['npc_ids'] = list(alert.npc_ids)
+    return payload
 
 
 class Simulation:
@@ -83,6 +87,8 @@ class Simulation:
         resolved_map = resolve_map_file(map_path, default_map)
         schedule_source = schedule_path or data_cfg.get('npc_schedule_file', 'data/npc_schedules.json')
         resolved_schedule = resolve_data_path(schedule_source)
+        cache_source = data_cfg.get('schedule_cache_dir')
+        schedule_cache_dir = resolve_data_path(cache_source) if cache_source else None
         self.grid = grid or MapGrid(str(resolved_map))
         self.rng = random.Random(cfg.get('random_seed', 1337))
         time_cfg = cfg['time']
@@ -101,7 +107,15 @@ class Simulation:
         from ..systems.schedule_system import ScheduleSystem  # avoid circular import
 
         cooldown = int(notifications_cfg.get('alert_cooldown_minutes', 10))
-        self.alert_bus = AlertBus(cooldown_minutes=cooldown)
+        history_limit = notifications_cfg.get('alert_history_limit', 1000)
+        self.alert_bus = AlertBus(
+            cooldown_minutes=cooldown,
+            history_limit=int(history_limit) if history_limit is not None else None,
+            delivery_queue_size=int(notifications_cfg.get('delivery_queue_size', 1024)),
+            backpressure=str(notifications_cfg.get('delivery_backpressure', 'drop_oldest')),
+            aggregation_windows=notifications_cfg.get('aggregation_windows') or {},
+            day_length_minutes=int(time_cfg['day_length_minutes']),
+        )
 
         self.schedule_system = ScheduleSystem(
             self.grid,
@@ -109,13 +123,29 @@ class Simulation:
             day_length_minutes=time_cfg['day_length_minutes'],
             rng=self.rng,
             activity_catalog=self.activity_catalog,
+            cache_dir=schedule_cache_dir,
+            travel_workers=int((cfg.get('simulation', {}) or {}).get('travel_workers', 1)),
         )
         self.activity_system = ActivitySystem(
             catalog=self.activity_catalog,
             room_manager=self.room_manager,
             event_logger=self.event_logger,
         )
-        self.movement_system = MovementSystem(self.grid)
+        self.movement_system = MovementSystem(self.grid, room_manager=self.room_manager)
+        simulation_cfg = cfg.get('simulation', {}) or {}
+        self._level_of_detail = bool(simulation_cfg.get('level_of_detail', False))
+        self.occupancy_recorder: Optional[OccupancyRecorder] = None
+        analytics_cfg = cfg.get('analytics', {}) or {}
+        if analytics_cfg.get('record_occupancy', False):
+            self.occupancy_recorder = OccupancyRecorder(
+                self.grid.rooms,
+                resolution_minutes=int(analytics_cfg.get('occupancy_resolution_minutes', 15)),
+                history_minutes=int(analytics_cfg.get('occupancy_history_days', 7)) * time_cfg['day_length_minutes'],
+                start_minute=self.clock.minute_of_day + 1,
+                day_length_minutes=time_cfg['day_length_minutes'],
+            )
+        self._viewport: Optional[Tuple[int, int, int, int]] = None
+        self._focus_rooms: Set[str] = set()
 
         interactions_cfg = cfg.get('interactions', {})
         messages_path = resolve_data_path(interactions_cfg.get('messages_file', 'config/interactions.yaml'))
@@ -125,8 +155,34 @@ class Simulation:
             npc.state = NPCState.IDLE
             npc.target = None
             npc.path.clear()
+            room_id = self.grid.room_id_at(npc.x, npc.y)
+            if room_id is not None:
+                self.room_manager.track_entry(npc.name, room_id)
+
+        self._snapshot_version = 0
+        self._npc_changes: ChangeLog[str] = ChangeLog()
+        self._room_changes: ChangeLog[str] = ChangeLog()
+        self._alert_changes: ChangeLog[str] = ChangeLog()
+        self._dirty_npcs: Set[str] = set()
+        self._tracked_npcs = 0
+        self._pending_alert_changes: List[str] = []
+        self.alert_bus.subscribe(self._on_alert)
+        self.movement_system.subscribe_changes(self.mark_npc_dirty)
+        self.activity_system.subscribe_starts(self.mark_npc_dirty)
+        self.activity_system.subscribe_ends(self.mark_npc_dirty)
+
+        self._day_index = 0
+        rules_path = resolve_data_path(notifications_cfg.get('rules_file', 'config/alert_rules.yaml'))
+        self.alert_rules = AlertRuleEngine.load(rules_path)
+        self.alert_rules.bind(self)
 
         self._prime_initial_activities()
+        self._record_changes()
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Deliver queued alerts to asynchronous subscribers and stop their worker."""
+
+        return self.alert_bus.close(timeout)
 
     @property
     def npcs(self) -> List[NPC]:
@@ -139,15 +195,13 @@ class Simulation:
         return self._select_destination(room_name)
 
     def _prime_initial_activities(self) -> None:
-        day_length = self.clock.day_length_minutes
-        current_minutes = int(self.clock.minute) % day_length
+        current_minutes = self.clock.minute_of_day
         for npc in self.npcs:
             if not npc.schedule:
                 continue
             chosen_activity = None
             chosen_minutes = None
-            for time_str, activity in npc.schedule:
-                minutes = _hhmm_to_minutes(time_str)
+            for minutes, activity in npc.schedule:
                 if minutes <= current_minutes:
                     chosen_activity = activity
                     chosen_minutes = minutes
@@ -158,14 +212,17 @@ class Simulation:
             npc.assign_activity(chosen_activity, chosen_minutes)
             destination = self._select_destination(chosen_activity.location)
             npc.pending_destination = destination
+            self.schedule_system.announce_assignment(npc)
 
     def tick(self) -> None:
-        current_time = self.clock.get_time_str()
-        self.schedule_system.update(current_time)
+        current_minutes = self.clock.minute_of_day
+        self.schedule_system.update(current_minutes)
 
         day_length = self.clock.day_length_minutes
-        current_minutes = int(self.clock.minute) % day_length
-        occupied: Set[Tuple[int, int]] = {(npc.x, npc.y) for npc in self.npcs}
+        # Abstract travellers are between tiles, so they do not block anyone.
+        occupied: Set[Tuple[int, int]] = {
+            (npc.x, npc.y) for npc in self.npcs if not self.movement_system.is_abstract(npc)
+        }
 
         for npc in self.npcs:
             block = npc.pending_schedule
@@ -175,7 +232,10 @@ class Simulation:
                     npc.pending_destination = None
                     npc.target = None
                     npc.path.clear()
-                    npc.state = NPCState.IDLE
+                    if npc.state != NPCState.IDLE:
+                        npc.state = NPCState.IDLE
+                        self.mark_npc_dirty(npc)
+                    self.movement_system.cancel_abstract(npc)
                     self.activity_system.start_if_ready(
                         npc,
                         current_minutes=current_minutes,
@@ -195,7 +255,22 @@ class Simulation:
                         day_length_minutes=day_length,
                     )
 
-            if npc.target:
+            if npc.target and not self._is_observed(npc):
+                if not self.movement_system.is_abstract(npc):
+                    occupied.discard((npc.x, npc.y))
+                arrived = self._advance_abstract(npc, occupied)
+                if arrived:
+                    occupied.add((npc.x, npc.y))
+                    self.activity_system.on_arrival(
+                        npc,
+                        current_minutes=current_minutes,
+                        day_length_minutes=day_length,
+                    )
+            elif npc.target:
+                if self.movement_system.is_abstract(npc):
+                    self.movement_system.materialize(npc, occupied)
+                    if self.movement_system.is_abstract(npc):
+                        continue  # Every tile back to the origin is taken; retry next tick.
                 blocked = occupied - {(npc.x, npc.y)}
                 self.movement_system.plan_if_needed(npc, blocked=blocked)
                 occupied.discard((npc.x, npc.y))
@@ -208,6 +283,7 @@ class Simulation:
                         day_length_minutes=day_length,
                     )
             else:
+                self.movement_system.cancel_abstract(npc)
                 self.activity_system.start_if_ready(
                     npc,
                     current_minutes=current_minutes,
@@ -215,7 +291,7 @@ class Simulation:
                 )
 
         self._minute_accumulator += self._minutes_per_tick
-        minute_cursor = int(self.clock.minute) % day_length
+        minute_cursor = current_minutes
         while self._minute_accumulator >= 1.0:
             minute_cursor = (minute_cursor + 1) % day_length
             for npc in self.npcs:
@@ -223,10 +299,68 @@ class Simulation:
                     npc,
                     current_minutes=minute_cursor,
                 )
+            if self.occupancy_recorder is not None:
+                self.occupancy_recorder.sample(self.room_manager)
             self._minute_accumulator -= 1.0
 
+        self.room_manager.flush_notifications()
         self.clock.tick()
         self._evaluate_alerts(current_minutes)
+        self.alert_bus.flush_aggregates()
+        if self.clock.minute_of_day < current_minutes:
+            self._day_index += 1
+        self._record_changes()
+
+    @property
+    def level_of_detail(self) -> bool:
+        return self._level_of_detail
+
+    def set_level_of_detail(
+        self,
+        enabled: bool,
+        *,
+        viewport: Optional[Tuple[int, int, int, int]] = None,
+        focus_rooms: Iterable[str] = (),
+    ) -> None:
+        """Toggle abstract travel for NPCs outside ``viewport``/``focus_rooms``.
+
+        ``viewport`` is an ``(x, y, width, height)`` rectangle in tiles. With
+        level of detail enabled and nothing observed, every NPC travels
+        abstractly, which suits headless analytics runs.
+        """
+
+        self._level_of_detail = enabled
+        self._viewport = viewport
+        self._focus_rooms = set(focus_rooms)
+
+    def _is_observed(self, npc: NPC) -> bool:
+        if not self._level_of_detail:
+            return True
+        points = [(npc.x, npc.y)]
+        if npc.target is not None:
+            points.append(npc.target)
+        for x, y in points:
+            if self._viewport is not None:
+                vx, vy, vw, vh = self._viewport
+                if vx <= x < vx + vw and vy <= y < vy + vh:
+                    return True
+            if self._focus_rooms:
+                room = self.grid.room_for_position(x, y)
+                if room is not None and room.name in self._focus_rooms:
+                    return True
+        return False
+
+    def _advance_abstract(self, npc: NPC, occupied: Set[Tuple[int, int]]) -> bool:
+        # Full-detail movement covers one tile per tick, so the travel
+        # estimate in tiles doubles as the trip length in ticks.
+        tx, ty = npc.target
+        estimate = abs(tx - npc.x) + abs(ty - npc.y)
+        block = npc.pending_schedule
+        expected = getattr(block, 'expected_travel', None) if block is not None else None
+        if expected:
+            estimate = max(estimate, int(expected))
+        self.movement_system.travel_abstractly(npc, estimate)
+        return self.movement_system.step_abstract(npc, occupied)
 
     def advance(self, ticks: int) -> None:
         for _ in range(ticks):
@@ -236,15 +370,98 @@ class Simulation:
         for npc in self.npcs:
             yield npc.name, (npc.x, npc.y)
 
+    @property
+    def snapshot_version(self) -> int:
+        return self._snapshot_version
+
     def snapshot(self) -> dict:
         return {
             'time': self.clock.get_time_str(),
+            'version': self._snapshot_version,
             'npc_states': {
                 npc.name: {'state': npc.state.value, 'position': (npc.x, npc.y)}
                 for npc in self.npcs
             },
         }
 
+    def snapshot_delta(self, since: int | None = None) -> dict:
+        """Return the state that changed after version ``since``.
+
+        Passing ``None`` (or a version this simulation never issued) yields a
+        full payload, which new subscribers use to seed their view before
+        polling with the returned ``version``.
+        """
+
+        if since is None or since < 0 or since > self._snapshot_version:
+            payload = self.snapshot()
+            payload['since'] = None
+            payload['full'] = True
+            payload['rooms'] = {
+                snapshot.room_id: snapshot.to_dict()
+                for snapshot in self.room_manager.iter_snapshots()
+            }
+            payload['alerts'] = [_alert_payload(alert) for alert in self.alert_bus.active_alerts()]
+            return payload
+
+        npc_states = {}
+        for name in self._npc_changes.changed_since(since):
+            npc = self.get_npc(name)
+            if npc is not None:
+                npc_states[name] = {'state': npc.state.value, 'position': (npc.x, npc.y)}
+        alerts = []
+        for alert_id in self._alert_changes.changed_since(since):
+            alert = self.alert_bus.get(alert_id)
+            # Acknowledged alerts evicted from the bus history can no longer be resolved.
+            alerts.append(_alert_payload(alert) if alert is not None else {'id': alert_id, 'removed': True})
+        return {
+            'time': self.clock.get_time_str(),
+            'version': self._snapshot_version,
+            'since': since,
+            'full': False,
+            'npc_states': npc_states,
+            'rooms': {
+                room_id: self.room_manager.snapshot(room_id).to_dict()
+                for room_id in self._room_changes.changed_since(since)
+            },
+            'alerts': alerts,
+        }
+
+    def _record_changes(self) -> None:
+        version = self._snapshot_version + 1
+        changed = False
+        if len(self.npcs) > self._tracked_npcs:
+            # Overrides may add actors after startup; report them in full once.
+            for npc in self.npcs[self._tracked_npcs:]:
+                self._dirty_npcs.add(npc.name)
+            self._tracked_npcs = len(self.npcs)
+        if self._dirty_npcs:
+            for name in self._dirty_npcs:
+                self._npc_changes.mark(name, version)
+            self._dirty_npcs = set()
+            changed = True
+        for room_id in self.room_manager.drain_changes():
+            self._room_changes.mark(room_id, version)
+            changed = True
+        if self._pending_alert_changes:
+            for alert_id in self._pending_alert_changes:
+                self._alert_changes.mark(alert_id, version)
+            self._pending_alert_changes.clear()
+            changed = True
+        if changed:
+            self._snapshot_version = version
+
+    def mark_npc_dirty(self, npc: NPC) -> None:
+        """Include ``npc`` in the next snapshot delta.
+
+        Movement and activity changes are reported automatically; callers
+        that set an NPC's position or state directly must call this.
+        """
+
+        self._dirty_npcs.add(npc.name)
+
+    def _on_alert(self, alert: 'Alert') -> None:
+        self._pending_alert_changes.append(alert.id)
+
     def interact_with(self, npc: NPC) -> str:
         message = self._format_interaction(npc)
         if message:
@@ -322,81 +539,17 @@ class Simulation:
         }
         return template.format(**context)
     def _evaluate_alerts(self, current_minutes: int) -> None:
-        self._evaluate_capacity_alerts(current_minutes)
-        for npc in self.npcs:
-            self._check_missed_class(npc, current_minutes)
-            self._check_curfew(npc, current_minutes)
+        self.alert_rules.evaluate(current_minutes)
 
-    def _evaluate_capacity_alerts(self, current_minutes: int) -> None:
-        for room_id, room in self.grid.rooms.items():
-            if room.capacity is None:
-                continue
-            snapshot = self.room_manager.snapshot(room_id)
-            occupants = sorted(snapshot.occupants)
-            if len(occupants) <= room.capacity:
-                continue
-            severity = "medium"
-            overflow = len(occupants) - room.capacity
-            if overflow >= 3:
-                severity = "high"
-            self.alert_bus.publish(
-                "Overcapacity",
-                minute_stamp=current_minutes,
-                severity=severity,
-                message=f"{room_id} exceeds capacity {len(occupants)}/{room.capacity}",
-                room_id=room_id,
-                npc_ids=occupants,
-            )
+    def alert_rule_report(self) -> List[Dict[str, object]]:
+        return self.alert_rules.report()
 
-    def _check_missed_class(self, npc: NPC, current_minutes: int) -> None:
-        block = npc.pending_schedule
-        if block is None:
-            return
-        profile = block.profile or self.activity_catalog.resolve(block.name)
-        if profile is None:
-            return
-        if profile.canonical not in {"Studying", "Teaching"}:
-            return
-        start_minutes = npc.pending_activity_start_minutes
-        if start_minutes is None:
-            return
-        elapsed = self._minutes_since(current_minutes, start_minutes)
-        grace = 10 + (block.travel_buffer if block.travel_buffer else 0)
-        if elapsed <= grace:
-            return
-        room = self.grid.room_for_position(npc.x, npc.y)
-        if room and room.name == block.location:
-            return
-        self.alert_bus.publish(
-            "MissedClass",
-            minute_stamp=current_minutes,
-            severity="high",
-            message=f"{npc.name} has not arrived for {block.location} ({profile.label})",
-            room_id=block.location,
-            npc_ids=[npc.name],
-        )
+    def absolute_minute(self, minute_of_day: int) -> int:
+        """Minutes since the start of day 0 for ``minute_of_day`` of the current day."""
 
-    def _check_curfew(self, npc: NPC, current_minutes: int) -> None:
-        curfew_start = 22 * 60
-        curfew_end = 6 * 60
-        within_curfew = current_minutes >= curfew_start or current_minutes < curfew_end
-        if not within_curfew:
-            return
-        activity = npc.current_activity
-        if activity and ("sleep" in activity.name.lower() or "sleep" in activity.label.lower() or "lights out" in activity.label.lower()):
-            return
-        room = self.grid.room_for_position(npc.x, npc.y)
-        if room and (room.room_type or "").lower() == "dormitory":
-            return
-        self.alert_bus.publish(
-            "CurfewViolation",
-            minute_stamp=current_minutes,
-            severity="medium",
-            message=f"{npc.name} is outside dorms during curfew",
-            room_id=room.name if room else None,
-            npc_ids=[npc.name],
-        )
+        return self._day_index * self.clock.day_length_minutes + minute_of_day
+
+    def minutes_since(self, current: int, start: int) -> int:
+        """Minutes from minute-of-day ``start`` to ``current``, wrapping at midnight."""
 
-    def _minutes_since(self, current: int, start: int) -> int:
-        total = self.clock.day_length_minutes
-        return (current - start) % total
+        return (current - start) % self.clock.day_length_minutes
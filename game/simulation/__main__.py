@@ -3,7 +3,6 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from dataclasses import asdict
 from pathlib import Path
 
 from ..config import load_config
@@ -53,9 +52,10 @@ def main() -> None:
             else:
                 print(result.message)
     simulation.advance(args.ticks)
+    simulation.close()
 
     if args.log_activities:
-        events = [asdict(event) for event in simulation.event_logger.iter_events()]
+        events = [event.to_dict() for event in simulation.event_logger.iter_events()]
         payload = json.dumps(events, indent=2)
         if args.log_activities == '-':
             print(payload)
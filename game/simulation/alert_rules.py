@@ -0,0 +1,443 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+import yaml
+
+from ..actors.npc import NPC
+from ..core.time_clock import TimeWindow
+from .curfew import CurfewPolicy
+from .deadlines import DeadlineQueue
+
+if TYPE_CHECKING:
+    from . import Simulation
+
+
+def _folded(values: Iterable[object] | None) -> FrozenSet[str]:
+    return frozenset(str(value).strip().lower() for value in values or () if str(value).strip())
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    """One declarative alert rule as written in the rules file.
+
+    ``roles`` limits NPC-scoped rules to those roles and ``room_types``
+    limits the rooms a rule looks at; empty means no filter. ``window``
+    restricts when the rule may fire. Everything else specific to the rule
+    kind lives in ``params``.
+    """
+
+    name: str
+    kind: str
+    category: str
+    severity: str = "medium"
+    roles: FrozenSet[str] = frozenset()
+    room_types: FrozenSet[str] = frozenset()
+    window: Optional[TimeWindow] = None
+    params: Mapping[str, object] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, payload: Mapping[str, object]) -> "RuleSpec":
+        missing = [key for key in ("name", "kind", "category") if not payload.get(key)]
+        if missing:
+            raise ValueError(f"Alert rule {payload!r} is missing {', '.join(missing)}")
+        window = payload.get("window")
+        reserved = {"name", "kind", "category", "severity", "roles", "room_types", "window"}
+        return cls(
+            name=str(payload["name"]),
+            kind=str(payload["kind"]),
+            category=str(payload["category"]),
+            severity=str(payload.get("severity", "medium")),
+            roles=_folded(payload.get("roles")),
+            room_types=_folded(payload.get("room_types")),
+            window=TimeWindow.from_config(window) if isinstance(window, Mapping) else None,
+            params={key: value for key, value in payload.items() if key not in reserved},
+        )
+
+
+@dataclass
+class RuleStats:
+    evaluations: int = 0
+    fired: int = 0
+    seconds: float = 0.0
+
+
+class AlertRule(ABC):
+    """Compiled form of a :class:`RuleSpec`.
+
+    Rules subscribe to the simulation events that can change their outcome
+    when bound, and :meth:`has_work` tells the engine whether anything is
+    pending this tick, so idle rules cost one cheap check. ``filters`` and
+    ``params`` list the spec keys a kind honours; :meth:`validate` rejects
+    anything else instead of silently ignoring it.
+    """
+
+    kind: ClassVar[str]
+    filters: ClassVar[FrozenSet[str]] = frozenset()
+    params: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def validate(cls, spec: RuleSpec) -> None:
+        unsupported = [name for name in ("roles", "room_types") if getattr(spec, name) and name not in cls.filters]
+        if unsupported:
+            raise ValueError(f"Alert rule '{spec.name}' ({cls.kind}) does not support {', '.join(unsupported)}")
+        unknown = sorted(set(spec.params) - cls.params)
+        if unknown:
+            raise ValueError(
+                f"Alert rule '{spec.name}' ({cls.kind}) has unknown parameter(s) {', '.join(unknown)} "
+                f"(expected: {', '.join(sorted(cls.params))})"
+            )
+
+    def __init__(self, spec: RuleSpec) -> None:
+        self.spec = spec
+        self.stats = RuleStats()
+        self._simulation: Optional["Simulation"] = None
+
+    @property
+    def simulation(self) -> "Simulation":
+        assert self._simulation is not None, f"Rule '{self.spec.name}' is not bound"
+        return self._simulation
+
+    def bind(self, simulation: "Simulation") -> None:
+        self._simulation = simulation
+
+    def in_window(self, minute_of_day: int) -> bool:
+        return self.spec.window is None or self.spec.window.contains(minute_of_day)
+
+    def applies_to(self, npc: NPC) -> bool:
+        return not self.spec.roles or (npc.role or "").lower() in self.spec.roles
+
+    def applies_to_room(self, room_id: Optional[str]) -> bool:
+        if not self.spec.room_types:
+            return True
+        room = self.simulation.grid.rooms.get(room_id) if room_id else None
+        return room is not None and (room.room_type or "").lower() in self.spec.room_types
+
+    def publish(
+        self,
+        current_minutes: int,
+        *,
+        message: str,
+        room_id: Optional[str],
+        npc_ids: Sequence[str],
+        severity: Optional[str] = None,
+    ) -> None:
+        self.stats.fired += 1
+        self.simulation.alert_bus.publish(
+            self.spec.category,
+            minute_stamp=current_minutes,
+            severity=severity or self.spec.severity,
+            message=message,
+            room_id=room_id,
+            npc_ids=npc_ids,
+        )
+
+    @abstractmethod
+    def has_work(self, current_minutes: int) -> bool:
+        """Whether :meth:`evaluate` could publish anything this tick."""
+
+    @abstractmethod
+    def evaluate(self, current_minutes: int) -> None:
+        ...
+
+
+class RoomCapacityRule(AlertRule):
+    """Rooms holding more than ``capacity + threshold`` occupants.
+
+    Params: ``threshold`` (default 0), ``escalate_overflow`` (default 3)
+    and ``escalate_severity`` (default ``high``).
+    """
+
+    kind = "room_capacity"
+    filters = frozenset({"room_types"})
+    params = frozenset({"threshold", "escalate_overflow", "escalate_severity"})
+
+    def __init__(self, spec: RuleSpec) -> None:
+        super().__init__(spec)
+        self.threshold = int(spec.params.get("threshold", 0))
+        self.escalate_overflow = int(spec.params.get("escalate_overflow", 3))
+        self.escalate_severity = str(spec.params.get("escalate_severity", "high"))
+
+    def has_work(self, current_minutes: int) -> bool:
+        return bool(self.simulation.room_manager.over_capacity()) and self.in_window(current_minutes)
+
+    def evaluate(self, current_minutes: int) -> None:
+        simulation = self.simulation
+        room_manager = simulation.room_manager
+        for room_id in sorted(room_manager.over_capacity()):
+            if not self.applies_to_room(room_id):
+                continue
+            room = simulation.grid.rooms[room_id]
+            occupants = room_manager.occupants(room_id)
+            overflow = len(occupants) - room.capacity
+            if overflow <= self.threshold:
+                continue
+            self.publish(
+                current_minutes,
+                severity=self.escalate_severity if overflow >= self.escalate_overflow else None,
+                message=f"{room_id} exceeds capacity {len(occupants)}/{room.capacity}",
+                room_id=room_id,
+                npc_ids=occupants,
+            )
+
+
+class MissedActivityRule(AlertRule):
+    """NPCs not in the room of an assigned block once its grace period ends.
+
+    Params: ``activities`` (canonical activities, default Studying and
+    Teaching), ``grace_minutes`` (default 10) and ``include_travel_buffer``
+    (default true). A deadline is registered when a matching block is
+    assigned and cancelled when it starts; an NPC still missing at the
+    deadline is re-checked every minute (the alert cooldown keeps that
+    quiet) until the block starts, is replaced or a day has passed.
+    """
+
+    kind = "missed_activity"
+    filters = frozenset({"roles", "room_types"})
+    params = frozenset({"activities", "grace_minutes", "include_travel_buffer"})
+
+    def __init__(self, spec: RuleSpec) -> None:
+        super().__init__(spec)
+        self.activities = _folded(spec.params.get("activities", ("Studying", "Teaching")))
+        self.grace_minutes = int(spec.params.get("grace_minutes", 10))
+        self.include_travel_buffer = bool(spec.params.get("include_travel_buffer", True))
+        self.pending: DeadlineQueue[str, Tuple[NPC, object, int]] = DeadlineQueue()
+
+    def bind(self, simulation: "Simulation") -> None:
+        super().bind(simulation)
+        simulation.schedule_system.subscribe_assignments(self.watch)
+        simulation.activity_system.subscribe_starts(self.cancel)
+
+    def watch(self, npc: NPC) -> None:
+        block = npc.pending_schedule
+        start_minutes = npc.pending_activity_start_minutes
+        if block is None or start_minutes is None or not self._matches(npc, block):
+            self.pending.cancel(npc.name)
+            return
+        simulation = self.simulation
+        current = simulation.clock.minute_of_day
+        started_at = simulation.absolute_minute(current) - simulation.minutes_since(current, start_minutes)
+        expires = started_at + simulation.clock.day_length_minutes
+        self.pending.schedule(npc.name, started_at + self._grace(block) + 1, (npc, block, expires))
+
+    def cancel(self, npc: NPC) -> None:
+        self.pending.cancel(npc.name)
+
+    def has_work(self, current_minutes: int) -> bool:
+        due = self.pending.next_due()
+        return due is not None and due <= self.simulation.absolute_minute(current_minutes)
+
+    def evaluate(self, current_minutes: int) -> None:
+        now = self.simulation.absolute_minute(current_minutes)
+        for name, (npc, block, expires) in self.pending.pop_due(now):
+            if npc.pending_schedule is not block:
+                continue
+            self.check(npc, current_minutes)
+            if now + 1 < expires:
+                self.pending.schedule(name, now + 1, (npc, block, expires))
+
+    def check(self, npc: NPC, current_minutes: int) -> None:
+        block = npc.pending_schedule
+        if block is None or not self._matches(npc, block) or not self.in_window(current_minutes):
+            return
+        start_minutes = npc.pending_activity_start_minutes
+        if start_minutes is None:
+            return
+        simulation = self.simulation
+        if simulation.minutes_since(current_minutes, start_minutes) <= self._grace(block):
+            return
+        if simulation.grid.room_id_at(npc.x, npc.y) == block.location:
+            return
+        profile = block.profile or simulation.activity_catalog.resolve(block.name)
+        self.publish(
+            current_minutes,
+            message=f"{npc.name} has not arrived for {block.location} ({profile.label})",
+            room_id=block.location,
+            npc_ids=[npc.name],
+        )
+
+    def _grace(self, block) -> int:
+        buffer = block.travel_buffer if self.include_travel_buffer and block.travel_buffer else 0
+        return self.grace_minutes + buffer
+
+    def _matches(self, npc: NPC, block) -> bool:
+        if not self.applies_to(npc) or not self.applies_to_room(block.location):
+            return False
+        profile = block.profile or self.simulation.activity_catalog.resolve(block.name)
+        return profile is not None and profile.canonical.lower() in self.activities
+
+
+class CurfewRule(AlertRule):
+    """NPCs outside a safe room during the rule window without an exempt activity.
+
+    Params: ``exempt_activities`` (activity ids or canonical activities,
+    default Sleeping) and ``safe_room_types`` (default dormitory); the
+    window defaults to 22:00-06:00. Violators are only re-derived when the
+    clock crosses a window boundary, an NPC changes room or an NPC's
+    activity starts or ends. An NPC is published when it becomes a
+    violator (or moves to another room while still violating) and then
+    once per alert cooldown for as long as it stays one.
+    """
+
+    kind = "curfew"
+    filters = frozenset({"roles"})
+    params = frozenset({"exempt_activities", "safe_room_types"})
+
+    def __init__(self, spec: RuleSpec) -> None:
+        super().__init__(spec)
+        self.policy = CurfewPolicy.from_config(spec.params, window=spec.window)
+        self.violators: Dict[str, NPC] = {}
+        self.repeats: DeadlineQueue[str, NPC] = DeadlineQueue()
+        self._entered: Dict[str, NPC] = {}
+        self._active = False
+
+    def bind(self, simulation: "Simulation") -> None:
+        super().bind(simulation)
+        simulation.movement_system.subscribe_room_changes(self._on_room_change)
+        simulation.activity_system.subscribe_starts(self.refresh)
+        simulation.activity_system.subscribe_ends(self.refresh)
+
+    def has_work(self, current_minutes: int) -> bool:
+        if self._entered or self.policy.active(current_minutes) != self._active:
+            return True
+        due = self.repeats.next_due()
+        return due is not None and due <= self.simulation.absolute_minute(current_minutes)
+
+    def evaluate(self, current_minutes: int) -> None:
+        active = self.policy.active(current_minutes)
+        if active != self._active:
+            self._active = active
+            self.violators.clear()
+            self._entered.clear()
+            self.repeats = DeadlineQueue()
+            if active:
+                for npc in self.simulation.npcs:
+                    self.refresh(npc)
+        now = self.simulation.absolute_minute(current_minutes)
+        due = dict(self.repeats.pop_due(now))
+        due.update(self._entered)
+        self._entered = {}
+        for npc in due.values():
+            self._publish(npc, current_minutes)
+            self.repeats.schedule(npc.name, now + max(1, self.simulation.alert_bus.cooldown_minutes), npc)
+
+    def refresh(self, npc: NPC) -> None:
+        if not self._active:
+            return
+        if self.violates(npc):
+            if npc.name not in self.violators:
+                self.violators[npc.name] = npc
+                self._entered[npc.name] = npc
+        else:
+            self.violators.pop(npc.name, None)
+            self._entered.pop(npc.name, None)
+            self.repeats.cancel(npc.name)
+
+    def violates(self, npc: NPC) -> bool:
+        simulation = self.simulation
+        if not self.applies_to(npc) or self.policy.exempts(npc.current_activity, simulation.activity_catalog):
+            return False
+        room_id = simulation.grid.room_id_at(npc.x, npc.y)
+        room = simulation.grid.rooms[room_id] if room_id is not None else None
+        return not (room is not None and self.policy.safe_room(room.room_type))
+
+    def check(self, npc: NPC, current_minutes: int) -> None:
+        if self.policy.active(current_minutes) and self.violates(npc):
+            self._publish(npc, current_minutes)
+
+    def _on_room_change(self, actor, old_room: Optional[str], new_room: Optional[str]) -> None:
+        if not isinstance(actor, NPC):
+            return
+        self.refresh(actor)
+        if actor.name in self.violators:
+            # The alert names the room, so a violator who moves is reported again.
+            self._entered[actor.name] = actor
+
+    def _publish(self, npc: NPC, current_minutes: int) -> None:
+        room_id = self.simulation.grid.room_id_at(npc.x, npc.y)
+        self.publish(
+            current_minutes,
+            message=f"{npc.name} is outside dorms during curfew",
+            room_id=room_id,
+            npc_ids=[npc.name],
+        )
+
+
+class AlertRuleEngine:
+    """Runs compiled alert rules in file order and records what each costs."""
+
+    KINDS: ClassVar[Dict[str, Type[AlertRule]]] = {
+        rule.kind: rule for rule in (RoomCapacityRule, MissedActivityRule, CurfewRule)
+    }
+
+    def __init__(self, rules: Sequence[AlertRule]) -> None:
+        self.rules: List[AlertRule] = list(rules)
+
+    @classmethod
+    def from_config(cls, payload: Mapping[str, object] | None) -> "AlertRuleEngine":
+        rules: List[AlertRule] = []
+        for entry in (payload or {}).get("rules", []) or []:
+            spec = RuleSpec.from_config(entry)
+            rule_cls = cls.KINDS.get(spec.kind)
+            if rule_cls is None:
+                raise ValueError(
+                    f"Alert rule '{spec.name}' has unknown kind '{spec.kind}' "
+                    f"(expected one of {', '.join(sorted(cls.KINDS))})"
+                )
+            rule_cls.validate(spec)
+            rules.append(rule_cls(spec))
+        return cls(rules)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "AlertRuleEngine":
+        return cls.from_config(yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {})
+
+    def bind(self, simulation: "Simulation") -> None:
+        for rule in self.rules:
+            rule.bind(simulation)
+
+    def evaluate(self, current_minutes: int) -> None:
+        for rule in self.rules:
+            if not rule.has_work(current_minutes):
+                continue
+            started = time.perf_counter()
+            rule.evaluate(current_minutes)
+            rule.stats.seconds += time.perf_counter() - started
+            rule.stats.evaluations += 1
+
+    def rules_of(self, kind: str) -> List[AlertRule]:
+        return [rule for rule in self.rules if rule.kind == kind]
+
+    def report(self) -> List[Dict[str, object]]:
+        """Per-rule evaluation counts, publishes and time spent, in rule order."""
+
+        rows: List[Dict[str, object]] = []
+        for rule in self.rules:
+            stats = rule.stats
+            rows.append(
+                {
+                    "rule": rule.spec.name,
+                    "kind": rule.kind,
+                    "category": rule.spec.category,
+                    "evaluations": stats.evaluations,
+                    "fired": stats.fired,
+                    "seconds": stats.seconds,
+                    "mean_us": stats.seconds / stats.evaluations * 1e6 if stats.evaluations else 0.0,
+                }
+            )
+        return rows
+
+
+__all__ = [
+    "AlertRule",
+    "AlertRuleEngine",
+    "CurfewRule",
+    "MissedActivityRule",
+    "RoomCapacityRule",
+    "RuleSpec",
+    "RuleStats",
+]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Generic, Hashable, List, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class ChangeLog(Generic[K]):
+    """Remembers the snapshot version at which each key last changed.
+
+    Keys are kept in change order, so readers walk backwards from the most
+    recent change and stop at the first entry they have already seen. A
+    delta query therefore costs O(changed keys) rather than O(all keys).
+    """
+
+    def __init__(self) -> None:
+        self._versions: "OrderedDict[K, int]" = OrderedDict()
+
+    def mark(self, key: K, version: int) -> None:
+        self._versions[key] = version
+        self._versions.move_to_end(key)
+
+    def changed_since(self, version: int) -> List[K]:
+        changed: List[K] = []
+        for key, stamp in reversed(self._versions.items()):
+            if stamp <= version:
+                break
+            changed.append(key)
+        changed.reverse()
+        return changed
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+
+__all__ = ["ChangeLog"]
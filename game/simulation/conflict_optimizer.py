@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import time
+from array import array
+from bisect import bisect_right, insort
+from datetime import timedelta
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from ..core.map import Room
+from .conflict_resolver import ConflictRecord
+from .schedule_generator import DailySchedule
+
+
+class _Placement:
+    """Mutable search state: per-minute room occupancy and current starts."""
+
+    def __init__(
+        self,
+        blocks: Sequence[DailySchedule],
+        movable: Sequence[int],
+        capacities: Mapping[str, int],
+        actor_blocks: Mapping[str, Sequence[DailySchedule]],
+        increment: int,
+        day_length: int,
+    ) -> None:
+        self.blocks = blocks
+        self.increment = increment
+        self.day_length = day_length
+        self.capacities = capacities
+        self.origin: Dict[int, int] = {}
+        self.length: Dict[int, int] = {}
+        self.start: Dict[int, int] = {}
+        self.occupancy: Dict[str, array] = {room: array("i", [0]) * (2 * day_length) for room in capacities}
+        self.room_starts: Dict[str, List[tuple[int, int]]] = {room: [] for room in capacities}
+        self.longest: Dict[str, int] = {room: 0 for room in capacities}
+        self.peers: Dict[int, List[DailySchedule]] = {}
+        self.overlapping: Dict[int, set[int]] = {}
+        for index in movable:
+            block = blocks[index]
+            start, end = block.absolute_interval()
+            self.origin[index] = start
+            self.length[index] = end - start
+            self.longest[block.room_id] = max(self.longest[block.room_id], end - start)
+            peers = [other for other in actor_blocks.get(block.actor_id, ()) if other is not block]
+            self.peers[index] = peers
+            self.overlapping[index] = {
+                id(other) for other in peers if _overlaps((start, end), other.absolute_interval())
+            }
+        # Peers that are themselves movable report their current start, not the stored one.
+        self._movable_by_id = {id(blocks[index]): index for index in movable}
+
+    def place(self, index: int, start: int) -> None:
+        room = self.blocks[index].room_id
+        occupancy = self.occupancy[room]
+        for minute in range(start, start + self.length[index]):
+            occupancy[minute] += 1
+        self.start[index] = start
+        insort(self.room_starts[room], (start, index))
+
+    def remove(self, index: int) -> None:
+        room = self.blocks[index].room_id
+        start = self.start.pop(index)
+        occupancy = self.occupancy[room]
+        for minute in range(start, start + self.length[index]):
+            occupancy[minute] -= 1
+        starts = self.room_starts[room]
+        del starts[bisect_right(starts, (start, index)) - 1]
+
+    def interval_of(self, block: DailySchedule) -> tuple[int, int]:
+        index = self._movable_by_id.get(id(block))
+        if index is None:
+            return block.absolute_interval()
+        start = self.start.get(index, self.origin[index])
+        return start, start + self.length[index]
+
+    def earliest_start(self, index: int, *, respect_actor: bool = True) -> Optional[int]:
+        """First increment-aligned start with room capacity and no new actor overlap."""
+
+        origin = self.origin[index]
+        length = self.length[index]
+        room = self.blocks[index].room_id
+        capacity = self.capacities[room]
+        occupancy = self.occupancy[room]
+        candidate = origin
+        while candidate < self.day_length:
+            window = occupancy[candidate:candidate + length]
+            if window and max(window) >= capacity:
+                last_full = max(offset for offset, count in enumerate(window) if count >= capacity)
+                candidate = self._align(origin, candidate + last_full + 1)
+                continue
+            if respect_actor:
+                blocker = self._actor_blocker(index, candidate, candidate + length)
+                if blocker is not None:
+                    candidate = self._align(origin, blocker)
+                    continue
+            return candidate
+        return None
+
+    def occupants(self, index: int, minute: int) -> tuple[str, ...]:
+        room = self.blocks[index].room_id
+        starts = self.room_starts[room]
+        names = {self.blocks[index].actor_id}
+        position = bisect_right(starts, (minute, len(self.blocks)))
+        floor = minute - self.longest[room]
+        while position > 0:
+            position -= 1
+            start, other = starts[position]
+            if start <= floor:
+                break
+            if start + self.length[other] > minute:
+                names.add(self.blocks[other].actor_id)
+        return tuple(sorted(names))
+
+    def _actor_blocker(self, index: int, start: int, end: int) -> Optional[int]:
+        latest_end: Optional[int] = None
+        allowed = self.overlapping[index]
+        for other in self.peers[index]:
+            if id(other) in allowed:
+                continue
+            interval = self.interval_of(other)
+            if _overlaps((start, end), interval):
+                latest_end = interval[1] if latest_end is None else max(latest_end, interval[1])
+        return latest_end
+
+    def _align(self, origin: int, minute: int) -> int:
+        steps = -(-(minute - origin) // self.increment)
+        return origin + max(steps, 0) * self.increment
+
+
+def _overlaps(first: tuple[int, int], second: tuple[int, int]) -> bool:
+    return first[0] < second[1] and second[0] < first[1]
+
+
+def resolve_with_optimization(
+    schedules: Sequence[DailySchedule],
+    room_metadata: Mapping[str, Room],
+    *,
+    increment: timedelta = timedelta(minutes=5),
+    actor_blocks: Mapping[str, Sequence[DailySchedule]] | None = None,
+    time_budget_seconds: float | None = 1.0,
+    max_passes: int = 8,
+) -> list[ConflictRecord]:
+    """Stagger blocks to fit room capacity while minimising total shift minutes.
+
+    Blocks in capacity-limited rooms are first inserted in start order
+    (shortest first on ties) at their earliest increment-aligned start that
+    keeps the room within capacity and does not make the actor overlap one
+    of their other blocks. Blocks never move past midnight; when no such
+    start exists the actor constraint is relaxed, and failing that the block
+    stays put. A bounded local search then re-inserts pairs of blocks that
+    compete for the same room in the opposite order and keeps any move that
+    lowers the total shift, until a pass brings no improvement, after
+    ``max_passes`` passes, or once ``time_budget_seconds`` has elapsed.
+
+    ``actor_blocks`` supplies every block of each actor (defaulting to
+    ``schedules``) so shifts avoid collisions with blocks outside the set
+    being resolved. One :class:`ConflictRecord` is returned per shifted block.
+    """
+
+    increment_minutes = max(int(increment.total_seconds() // 60), 1)
+    capacities = {name: room.capacity for name, room in room_metadata.items() if room.capacity}
+    blocks = list(schedules)
+    movable = [
+        index
+        for index, block in enumerate(blocks)
+        if block.duration_minutes > 0 and block.room_id in capacities
+    ]
+    if not movable:
+        return []
+    if actor_blocks is None:
+        grouped: Dict[str, List[DailySchedule]] = {}
+        for block in blocks:
+            grouped.setdefault(block.actor_id, []).append(block)
+        actor_blocks = grouped
+    day_length = blocks[movable[0]].day_length_minutes
+    state = _Placement(blocks, movable, capacities, actor_blocks, increment_minutes, day_length)
+
+    order = sorted(movable, key=lambda index: (state.origin[index], state.length[index], blocks[index].actor_id))
+    for index in order:
+        start = state.earliest_start(index)
+        if start is None:
+            start = state.earliest_start(index, respect_actor=False)
+        state.place(index, state.origin[index] if start is None else start)
+
+    deadline = None if time_budget_seconds is None else time.perf_counter() + time_budget_seconds
+    for _ in range(max(max_passes, 0)):
+        if not _improve(state, order, deadline):
+            break
+
+    records: list[ConflictRecord] = []
+    for index in order:
+        shift = state.start[index] - state.origin[index]
+        if shift <= 0:
+            continue
+        block = blocks[index]
+        records.append(
+            ConflictRecord(
+                room=block.room_id,
+                start_tick=state.origin[index] % day_length,
+                end_tick=state.start[index] % day_length,
+                capacity=capacities[block.room_id],
+                actors=state.occupants(index, state.origin[index]),
+                shift_minutes=shift,
+            )
+        )
+        block.shift_by(shift)
+    return records
+
+
+def _improve(state: _Placement, order: Sequence[int], deadline: Optional[float]) -> bool:
+    improved = False
+    for index in order:
+        if deadline is not None and time.perf_counter() > deadline:
+            return False
+        if state.start[index] == state.origin[index]:
+            continue
+        if _reinsert(state, [index]):
+            improved = True
+            continue
+        origin = state.origin[index]
+        room = state.blocks[index].room_id
+        rivals = [
+            other
+            for start, other in state.room_starts[room]
+            if start <= origin < start + state.length[other] and other != index
+        ]
+        for rival in rivals:
+            if _reinsert(state, [index, rival]):
+                improved = True
+                break
+    return improved
+
+
+def _reinsert(state: _Placement, indices: Sequence[int]) -> bool:
+    """Re-place ``indices`` in the given order; keep the result only if it is cheaper."""
+
+    previous = {index: state.start[index] for index in indices}
+    before = sum(previous[index] - state.origin[index] for index in indices)
+    for index in indices:
+        state.remove(index)
+    placed: Dict[int, int] = {}
+    feasible = True
+    for index in indices:
+        start = state.earliest_start(index)
+        if start is None:
+            feasible = False
+            break
+        state.place(index, start)
+        placed[index] = start
+    if feasible and sum(placed[index] - state.origin[index] for index in indices) < before:
+        return True
+    for index in placed:
+        state.remove(index)
+    for index in indices:
+        state.place(index, previous[index])
+    return False
+
+
+__all__ = ["resolve_with_optimization"]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Mapping, Sequence
+from typing import TYPE_CHECKING, Iterable, Literal, Mapping, Sequence
 
 from ..core.map import Room
 from .schedule_generator import DailySchedule
 
+if TYPE_CHECKING:
+    from .schedule_store import ScheduleStore
+
 
 @dataclass
 class ConflictRecord:
@@ -18,55 +22,240 @@ class ConflictRecord:
     shift_minutes: int = 0
 
 
+def _room_events(blocks: Sequence[DailySchedule]) -> list[tuple[int, int, int]]:
+    """Sorted ``(time, delta, block index)`` sweep events for one room.
+
+    Ends sort before starts at the same minute, so back-to-back blocks do
+    not overlap; ties keep block order.
+    """
+
+    return _interval_events([block.absolute_interval() for block in blocks])
+
+
+def _interval_events(intervals: Sequence[tuple[int, int]]) -> list[tuple[int, int, int]]:
+    events: list[tuple[int, int, int]] = []
+    for index, (start, end) in enumerate(intervals):
+        events.append((int(start), 1, index))
+        events.append((int(end), -1, index))
+    events.sort()
+    return events
+
+
 def detect_room_capacity_conflicts(
     schedules: Sequence[DailySchedule],
     room_metadata: Mapping[str, Room],
+) -> list[ConflictRecord]:
+    """Report every point where a room holds more blocks than its capacity.
+
+    Blocks are bucketed by room in one pass, then each room's timeline is
+    swept with a running occupancy counter. Only rooms whose counter ever
+    exceeds capacity are swept a second time with per-block membership to
+    name the actors involved, so well-behaved rooms cost one sort.
+    """
+
+    buckets: dict[str, tuple[list[tuple[int, int]], list[str]]] = {}
+    day_length = 24 * 60
+    for block in schedules:
+        if block.duration_minutes <= 0:
+            continue
+        room = room_metadata.get(block.room_id)
+        if room is None or not room.capacity:
+            continue
+        intervals, actors = buckets.setdefault(block.room_id, ([], []))
+        intervals.append(block.absolute_interval())
+        actors.append(block.actor_id)
+        day_length = block.day_length_minutes
+    return _sweep_rooms(buckets, room_metadata, day_length)
+
+
+def detect_store_conflicts(
+    store: "ScheduleStore",
+    room_metadata: Mapping[str, Room],
+    indices: Iterable[int] | None = None,
+) -> list[ConflictRecord]:
+    """:func:`detect_room_capacity_conflicts` over store rows, read from its columns.
+
+    ``indices`` defaults to every live row; pass them explicitly to keep a
+    caller's block order, which decides how simultaneous starts are grouped.
+    """
+
+    rooms = store.rooms.values
+    actors = store.actors.values
+    room_column = store.room
+    actor_column = store.actor
+    duration = store.duration
+    interval = store.interval
+    buckets: dict[str, tuple[list[tuple[int, int]], list[str]]] = {}
+    for index in store.live_indices() if indices is None else indices:
+        if duration[index] <= 0:
+            continue
+        room_id = rooms[room_column[index]]
+        room = room_metadata.get(room_id)
+        if room is None or not room.capacity:
+            continue
+        room_intervals, room_actors = buckets.setdefault(room_id, ([], []))
+        room_intervals.append(interval(index))
+        room_actors.append(actors[actor_column[index]])
+    return _sweep_rooms(buckets, room_metadata, store.day_length_minutes)
+
+
+def _sweep_rooms(
+    buckets: Mapping[str, tuple[Sequence[tuple[int, int]], Sequence[str]]],
+    room_metadata: Mapping[str, Room],
+    day_length: int,
 ) -> list[ConflictRecord]:
     conflicts: list[ConflictRecord] = []
-    seen: set[tuple[str, int, tuple[str, ...]]] = set()
     for room_name, room in room_metadata.items():
-        if not room.capacity:
+        bucket = buckets.get(room_name)
+        if not bucket or len(bucket[0]) <= room.capacity:
             continue
-        room_blocks = [block for block in schedules if block.room_id == room_name and block.duration_minutes > 0]
-        if not room_blocks:
+        intervals, actors = bucket
+        events = _interval_events(intervals)
+        occupancy = 0
+        peak = 0
+        for _, delta, _ in events:
+            occupancy += delta
+            if occupancy > peak:
+                peak = occupancy
+        if peak <= room.capacity:
             continue
-        events: list[tuple[int, int, DailySchedule]] = []
-        for block in room_blocks:
-            start, end = block.absolute_interval()
-            events.append((int(start), 1, block))
-            events.append((int(end), -1, block))
-        events.sort(key=lambda item: (item[0], item[1]))
-        active: list[DailySchedule] = []
-        for time, delta, block in events:
-            if delta == 1:
-                active.append(block)
-                if len(active) > room.capacity:
-                    actor_ids = tuple(sorted({slot.actor_id for slot in active}))
-                    key = (room_name, time, actor_ids)
-                    if key not in seen:
-                        seen.add(key)
-                        conflicts.append(
-                            ConflictRecord(
-                                room=room_name,
-                                start_tick=time % block.day_length_minutes,
-                                end_tick=time % block.day_length_minutes,
-                                capacity=room.capacity,
-                                actors=actor_ids,
-                            )
-                        )
-            else:
-                if block in active:
-                    active.remove(block)
+        conflicts.extend(_room_conflicts(room_name, room.capacity, actors, events, day_length))
     return conflicts
 
 
+def _room_conflicts(
+    room_name: str,
+    capacity: int,
+    actors: Sequence[str],
+    events: Sequence[tuple[int, int, int]],
+    day_length: int,
+) -> list[ConflictRecord]:
+    conflicts: list[ConflictRecord] = []
+    seen: set[tuple[int, tuple[str, ...]]] = set()
+    active: dict[int, str] = {}
+    for time, delta, index in events:
+        if delta < 0:
+            active.pop(index, None)
+            continue
+        active[index] = actors[index]
+        if len(active) <= capacity:
+            continue
+        actor_ids = tuple(sorted(set(active.values())))
+        key = (time, actor_ids)
+        if key in seen:
+            continue
+        seen.add(key)
+        conflicts.append(
+            ConflictRecord(
+                room=room_name,
+                start_tick=time % day_length,
+                end_tick=time % day_length,
+                capacity=capacity,
+                actors=actor_ids,
+            )
+        )
+    return conflicts
+
+
+StaggerMode = Literal["sweep", "iterative"]
+
+
 def resolve_with_staggering(
     schedules: Sequence[DailySchedule],
     room_metadata: Mapping[str, Room],
     *,
     increment: timedelta = timedelta(minutes=5),
+    mode: StaggerMode = "sweep",
 ) -> list[ConflictRecord]:
+    """Shift blocks later in ``increment`` steps until every room fits its capacity.
+
+    ``mode="sweep"`` walks each room's timeline once (see
+    :func:`_stagger_room`). ``mode="iterative"`` is the original algorithm,
+    which re-detects every conflict after each single shift; it is kept as
+    a fallback for comparing plans.
+    """
+
     increment_minutes = max(int(increment.total_seconds() // 60), 1)
+    if mode == "iterative":
+        return _resolve_iteratively(schedules, room_metadata, increment_minutes)
+    if mode != "sweep":
+        raise ValueError(f"Unknown stagger mode '{mode}'")
+
+    buckets: dict[str, list[DailySchedule]] = {}
+    for block in schedules:
+        if block.duration_minutes <= 0:
+            continue
+        room = room_metadata.get(block.room_id)
+        if room is None or not room.capacity:
+            continue
+        buckets.setdefault(block.room_id, []).append(block)
+
+    adjustments: list[ConflictRecord] = []
+    for room_name, room in room_metadata.items():
+        room_blocks = buckets.get(room_name)
+        if room_blocks and len(room_blocks) > room.capacity:
+            adjustments.extend(_stagger_room(room_name, room.capacity, room_blocks, increment_minutes))
+    return adjustments
+
+
+def _stagger_room(
+    room_name: str,
+    capacity: int,
+    blocks: Sequence[DailySchedule],
+    increment_minutes: int,
+) -> list[ConflictRecord]:
+    """Give each block of one room the earliest feasible start, in one pass.
+
+    Blocks are popped from a priority queue ordered by candidate start (ties
+    keep the lower actor id in place, as the iterative resolver does). A
+    second heap holds the end times of accepted blocks. When the room is
+    full at a block's candidate start, the block jumps to the first
+    ``increment`` step at or after the earliest end and is queued again.
+    Each jump yields one shift record whose ``shift_minutes`` covers the
+    whole jump (the iterative resolver emits one record per increment). A
+    block never moves more than a day.
+    """
+
+    adjustments: list[ConflictRecord] = []
+    pending: list[tuple[int, str, int]] = []
+    lengths: list[int] = []
+    for index, block in enumerate(blocks):
+        start, end = block.absolute_interval()
+        lengths.append(end - start)
+        pending.append((start, block.actor_id, index))
+    heapq.heapify(pending)
+    original_starts = {index: start for start, _, index in pending}
+    running: list[tuple[int, str]] = []
+    while pending:
+        start, actor_id, index = heapq.heappop(pending)
+        while running and running[0][0] <= start:
+            heapq.heappop(running)
+        block = blocks[index]
+        if len(running) < capacity or start - original_starts[index] >= block.day_length_minutes:
+            heapq.heappush(running, (start + lengths[index], actor_id))
+            continue
+        shift = -(-(running[0][0] - start) // increment_minutes) * increment_minutes
+        day_length = block.day_length_minutes
+        adjustments.append(
+            ConflictRecord(
+                room=room_name,
+                start_tick=start % day_length,
+                end_tick=(start + shift) % day_length,
+                capacity=capacity,
+                actors=tuple(sorted({name for _, name in running} | {actor_id})),
+                shift_minutes=shift,
+            )
+        )
+        heapq.heappush(pending, (start + shift, actor_id, index))
+        block.shift_by(shift)
+    return adjustments
+
+
+def _resolve_iteratively(
+    schedules: Sequence[DailySchedule],
+    room_metadata: Mapping[str, Room],
+    increment_minutes: int,
+) -> list[ConflictRecord]:
     adjustments: list[ConflictRecord] = []
     flat_list = list(schedules)
     max_iterations = len(flat_list) * 12 if flat_list else 0
@@ -96,4 +285,10 @@ def resolve_with_staggering(
     return adjustments
 
 
-__all__ = ["ConflictRecord", "detect_room_capacity_conflicts", "resolve_with_staggering"]
+__all__ = [
+    "ConflictRecord",
+    "StaggerMode",
+    "detect_room_capacity_conflicts",
+    "detect_store_conflicts",
+    "resolve_with_staggering",
+]
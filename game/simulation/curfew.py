@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, FrozenSet, Iterable, Mapping, Optional
+
+from ..core.time_clock import TimeWindow
+
+if TYPE_CHECKING:
+    from .activities import ActivityCatalog
+
+
+def _folded(values: Iterable[object]) -> FrozenSet[str]:
+    return frozenset(str(value).strip().lower() for value in values if str(value).strip())
+
+
+@dataclass(frozen=True)
+class CurfewPolicy:
+    """Curfew window plus the activities and room types that satisfy it.
+
+    ``exempt_activities`` matches an activity's catalog id or canonical
+    activity (``Sleeping`` covers aliases such as ``lights_out_north``),
+    case-insensitively.
+    """
+
+    window: TimeWindow = TimeWindow(22 * 60, 6 * 60)
+    exempt_activities: FrozenSet[str] = field(default_factory=lambda: frozenset({"sleeping"}))
+    safe_room_types: FrozenSet[str] = field(default_factory=lambda: frozenset({"dormitory"}))
+
+    @classmethod
+    def from_config(
+        cls, payload: Mapping[str, object] | None, *, window: Optional[TimeWindow] = None
+    ) -> "CurfewPolicy":
+        defaults = cls()
+        payload = payload or {}
+        exempt = payload.get("exempt_activities")
+        rooms = payload.get("safe_room_types")
+        return cls(
+            window=window or defaults.window,
+            exempt_activities=_folded(exempt) if exempt is not None else defaults.exempt_activities,
+            safe_room_types=_folded(rooms) if rooms is not None else defaults.safe_room_types,
+        )
+
+    def active(self, minute_of_day: int) -> bool:
+        return self.window.contains(minute_of_day)
+
+    def exempts(self, activity: object | None, catalog: "ActivityCatalog") -> bool:
+        if activity is None:
+            return False
+        name = str(getattr(activity, "name", "") or "")
+        if name.lower() in self.exempt_activities:
+            return True
+        profile = catalog.resolve(name)
+        return profile is not None and profile.canonical.lower() in self.exempt_activities
+
+    def safe_room(self, room_type: str | None) -> bool:
+        return (room_type or "").lower() in self.safe_room_types
+
+
+__all__ = ["CurfewPolicy"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DeadlineQueue(Generic[K, V]):
+    """Min-heap of per-key deadlines with lazy cancellation.
+
+    Scheduling a key again replaces its previous deadline; replaced and
+    cancelled entries stay in the heap and are skipped when they surface,
+    so every operation is O(log n) and :meth:`pop_due` only touches
+    deadlines that have actually expired.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[int, int, K]] = []
+        self._live: Dict[K, Tuple[int, V]] = {}
+        self._sequence = count()
+
+    def schedule(self, key: K, due: int, payload: V) -> None:
+        sequence = next(self._sequence)
+        self._live[key] = (sequence, payload)
+        heapq.heappush(self._heap, (due, sequence, key))
+
+    def cancel(self, key: K) -> None:
+        self._live.pop(key, None)
+
+    def next_due(self) -> Optional[int]:
+        """Earliest live deadline, or ``None`` when nothing is scheduled."""
+
+        heap = self._heap
+        while heap:
+            _, sequence, key = heap[0]
+            live = self._live.get(key)
+            if live is not None and live[0] == sequence:
+                return heap[0][0]
+            heapq.heappop(heap)
+        return None
+
+    def pop_due(self, now: int) -> List[Tuple[K, V]]:
+        """Remove and return every live ``(key, payload)`` whose deadline is ``<= now``."""
+
+        expired: List[Tuple[K, V]] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(heap)
+            live = self._live.get(key)
+            if live is None or live[0] != sequence:
+                continue
+            del self._live[key]
+            expired.append((key, live[1]))
+        return expired
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._live
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+
+__all__ = ["DeadlineQueue"]
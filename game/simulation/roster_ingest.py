@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import yaml
+
+try:  # Prefer libyaml's C parser; the pure-Python loader is an order of magnitude slower.
+    YAML_LOADER = yaml.CSafeLoader
+except AttributeError:  # pragma: no cover - depends on how PyYAML was built
+    YAML_LOADER = yaml.SafeLoader
+
+
+def load_yaml(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=YAML_LOADER)
+
+
+@dataclass
+class RosterIngestStats:
+    """Summary of a roster ingestion pass."""
+
+    source: Optional[str] = None
+    assignments: int = 0
+    elapsed_seconds: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+
+
+def iter_assignment_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield roster assignment entries one at a time.
+
+    JSON Lines files hold one assignment object per line. CSV files use the
+    columns ``name``, ``role``, ``template``, ``variant`` and ``notes``; an
+    optional ``overrides`` column carries a JSON list of slot overrides.
+    """
+
+    suffix = path.suffix.lower()
+    if suffix in {".jsonl", ".ndjson"}:
+        yield from _iter_json_lines(path)
+    elif suffix == ".csv":
+        yield from _iter_csv(path)
+    else:
+        raise ValueError(f"Unsupported assignments file format '{path.suffix}' (expected .jsonl or .csv)")
+
+
+def _iter_json_lines(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({exc.msg})") from exc
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object per line")
+            yield record
+
+
+def _iter_csv(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            record: Dict[str, Any] = {key: value for key, value in row.items() if key and value not in (None, "")}
+            overrides = record.get("overrides")
+            if overrides:
+                try:
+                    record["overrides"] = json.loads(overrides)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"{path}: invalid overrides JSON for {record.get('name')} ({exc.msg})") from exc
+            yield record
+
+
+class IngestTimer:
+    """Context manager that fills a :class:`RosterIngestStats` on exit."""
+
+    def __init__(self, stats: RosterIngestStats, *, measure_memory: bool = False) -> None:
+        self.stats = stats
+        self._measure_memory = measure_memory
+        self._started_tracing = False
+        self._start = 0.0
+
+    def __enter__(self) -> RosterIngestStats:
+        if self._measure_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+        return self.stats
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stats.elapsed_seconds = time.perf_counter() - self._start
+        if self._measure_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            self.stats.peak_memory_bytes = peak
+            if self._started_tracing:
+                tracemalloc.stop()
+
+
+__all__ = [
+    "IngestTimer",
+    "RosterIngestStats",
+    "YAML_LOADER",
+    "iter_assignment_records",
+    "load_yaml",
+]
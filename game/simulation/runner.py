@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import Simulation
+
+
+@dataclass(frozen=True)
+class PositionFrame:
+    """NPC positions, states and the clock captured right after a tick.
+
+    The render thread reads only frames, never the live simulation, so a
+    frame must carry everything a marker and its label need.
+    """
+
+    time: float
+    clock_text: str = ""
+    positions: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    states: Dict[str, str] = field(default_factory=dict)
+
+
+class SimulationRunner:
+    """Advances a :class:`Simulation` on a worker thread at a fixed timestep.
+
+    Each tick publishes a :class:`PositionFrame`; the previous and current
+    frames form a double buffer that the render loop reads without holding
+    the simulation lock. When the worker falls behind it runs at most
+    ``max_catchup_ticks`` ticks and drops the remaining backlog instead of
+    spiralling.
+    """
+
+    def __init__(
+        self,
+        simulation: "Simulation",
+        *,
+        tick_rate_hz: float,
+        max_catchup_ticks: int = 5,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if tick_rate_hz <= 0:
+            raise ValueError("tick_rate_hz must be positive")
+        self.simulation = simulation
+        self.lock = threading.RLock()
+        self._tick_interval = 1.0 / float(tick_rate_hz)
+        self._max_catchup_ticks = max(1, int(max_catchup_ticks))
+        self._clock = clock
+        self._next_tick_at: Optional[float] = None
+        self._dropped_ticks = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        with self.lock:
+            initial = self._capture(clock())
+        self._frames: Tuple[PositionFrame, PositionFrame] = (initial, initial)
+
+    @property
+    def tick_interval(self) -> float:
+        return self._tick_interval
+
+    @property
+    def dropped_ticks(self) -> int:
+        return self._dropped_ticks
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._next_tick_at = self._clock() + self._tick_interval
+        self._thread = threading.Thread(target=self._run, name="simulation-runner", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_pending(self, now: float | None = None) -> int:
+        """Run every tick due at ``now`` within the catch-up budget."""
+
+        if now is None:
+            now = self._clock()
+        if self._next_tick_at is None:
+            self._next_tick_at = now + self._tick_interval
+            return 0
+        due = int((now - self._next_tick_at) // self._tick_interval) + 1
+        if due <= 0:
+            return 0
+        if due > self._max_catchup_ticks:
+            self._dropped_ticks += due - self._max_catchup_ticks
+            due = self._max_catchup_ticks
+            self._next_tick_at = now - (due - 1) * self._tick_interval
+        for _ in range(due):
+            with self.lock:
+                self.simulation.tick()
+                frame = self._capture(self._next_tick_at)
+            self._frames = (self._frames[1], frame)
+            self._next_tick_at += self._tick_interval
+        return due
+
+    def frames(self) -> Tuple[PositionFrame, PositionFrame]:
+        return self._frames
+
+    def latest_frame(self) -> PositionFrame:
+        return self._frames[1]
+
+    def interpolated_positions(self, now: float | None = None) -> Dict[str, Tuple[float, float]]:
+        """Blend the last two frames so markers glide between tiles.
+
+        Rendering runs one tick behind the simulation: ``alpha`` is how far
+        ``now`` has progressed past the newest frame, clamped to ``[0, 1]``.
+        Jumps longer than a single tile (teleports, respawns) snap instead of
+        sliding across the map.
+        """
+
+        if now is None:
+            now = self._clock()
+        previous, current = self._frames
+        alpha = (now - current.time) / self._tick_interval
+        alpha = min(max(alpha, 0.0), 1.0)
+        blended: Dict[str, Tuple[float, float]] = {}
+        for name, (cx, cy) in current.positions.items():
+            start = previous.positions.get(name)
+            if start is None or abs(cx - start[0]) + abs(cy - start[1]) > 1:
+                blended[name] = (float(cx), float(cy))
+                continue
+            px, py = start
+            blended[name] = (px + (cx - px) * alpha, py + (cy - py) * alpha)
+        return blended
+
+    def _capture(self, stamp: float) -> PositionFrame:
+        npcs = self.simulation.npcs
+        return PositionFrame(
+            time=stamp,
+            clock_text=self.simulation.clock.get_time_str(),
+            positions={npc.name: (npc.x, npc.y) for npc in npcs},
+            states={npc.name: npc.state.value for npc in npcs},
+        )
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.run_pending()
+            next_at = self._next_tick_at or self._clock()
+            self._stop_event.wait(max(0.0, next_at - self._clock()))
+
+
+__all__ = ["PositionFrame", "SimulationRunner"]
@@ -1,21 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Mapping, MutableMapping, Optional, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence
 
 from ..core.map import MapGrid
 from ..core.pathfinding import astar
+from ..core.time_clock import format_minutes, parse_hhmm
 
-
-def parse_hhmm(value: str) -> int:
-    hours, minutes = map(int, value.split(":"))
-    return hours * 60 + minutes
-
-
-def format_minutes(minutes: int) -> str:
-    minutes %= 24 * 60
-    hours, mins = divmod(minutes, 60)
-    return f"{hours:02d}:{mins:02d}"
+if TYPE_CHECKING:
+    from .schedule_store import ScheduleStore
 
 
 def parse_duration(value: str | None) -> int:
@@ -25,33 +19,15 @@ def parse_duration(value: str | None) -> int:
     return hours * 60 + minutes
 
 
-@dataclass
-class DailySchedule:
-    actor_id: str
-    slot: str
-    activity_id: str
-    room_id: str
-    start_tick: int
-    duration_minutes: int
-    day_length_minutes: int
-    notes: str | None = None
-    travel_buffer: int = 0
-    expected_travel: Optional[int] = None
-    travel_path: Optional[List[tuple[int, int]]] = None
-    stagger_applied: int = 0
+class ScheduleBlockOps:
+    """Behaviour shared by :class:`DailySchedule` and columnar row views.
 
-    def clone_for_actor(self, actor_id: str) -> "DailySchedule":
-        return DailySchedule(
-            actor_id=actor_id,
-            slot=self.slot,
-            activity_id=self.activity_id,
-            room_id=self.room_id,
-            start_tick=self.start_tick,
-            duration_minutes=self.duration_minutes,
-            day_length_minutes=self.day_length_minutes,
-            notes=self.notes,
-            travel_buffer=self.travel_buffer,
-        )
+    Subclasses provide ``start_tick``, ``duration_minutes``,
+    ``day_length_minutes`` and the other block attributes; every method here
+    goes through those attributes only.
+    """
+
+    __slots__ = ()
 
     @property
     def end_tick(self) -> int:
@@ -92,6 +68,35 @@ class DailySchedule:
         self.stagger_applied += minutes
 
 
+@dataclass
+class DailySchedule(ScheduleBlockOps):
+    actor_id: str
+    slot: str
+    activity_id: str
+    room_id: str
+    start_tick: int
+    duration_minutes: int
+    day_length_minutes: int
+    notes: str | None = None
+    travel_buffer: int = 0
+    expected_travel: Optional[int] = None
+    travel_path: Optional[List[tuple[int, int]]] = None
+    stagger_applied: int = 0
+
+    def clone_for_actor(self, actor_id: str) -> "DailySchedule":
+        return DailySchedule(
+            actor_id=actor_id,
+            slot=self.slot,
+            activity_id=self.activity_id,
+            room_id=self.room_id,
+            start_tick=self.start_tick,
+            duration_minutes=self.duration_minutes,
+            day_length_minutes=self.day_length_minutes,
+            notes=self.notes,
+            travel_buffer=self.travel_buffer,
+        )
+
+
 class ScheduleTemplate:
     def __init__(self, name: str, raw_data: Mapping[str, Sequence[Mapping[str, object]]], *, day_length_minutes: int):
         self.name = name
@@ -122,9 +127,17 @@ class ScheduleTemplate:
                 )
             self._variants[variant] = slots
 
-    def instantiate(self, actor_id: str, variant: str) -> List[DailySchedule]:
+    def instantiate(self, actor_id: str, variant: str, *, store: "ScheduleStore | None" = None) -> List[DailySchedule]:
+        """Copy a variant's slots for ``actor_id``.
+
+        With a ``store`` the copies are appended to its columns and returned
+        as row views instead of standalone dataclasses.
+        """
+
         if variant not in self._variants:
             raise KeyError(f"Template {self.name} missing variant {variant}")
+        if store is not None:
+            return [store.add_block(slot, actor_id=actor_id) for slot in self._variants[variant]]
         return [slot.clone_for_actor(actor_id) for slot in self._variants[variant]]
 
 
@@ -137,8 +150,8 @@ class ScheduleAssignment:
     overrides: Sequence[Mapping[str, object]] = field(default_factory=list)
     notes: str | None = None
 
-    def apply(self) -> List[DailySchedule]:
-        slots = self.template.instantiate(self.actor_id, self.variant)
+    def apply(self, *, store: "ScheduleStore | None" = None) -> List[DailySchedule]:
+        slots = self.template.instantiate(self.actor_id, self.variant, store=store)
         slot_lookup: Dict[str, DailySchedule] = {slot.slot: slot for slot in slots}
         for override in self.overrides:
             slot_name = str(override.get("slot"))
@@ -197,9 +210,33 @@ class ScheduleAssignment:
         )
 
 
+_WORKER_GRID: MapGrid | None = None
+
+
+def _init_travel_worker(grid: MapGrid) -> None:
+    global _WORKER_GRID
+    _WORKER_GRID = grid
+
+
+def _route_in_worker(pair: tuple[tuple[int, int], tuple[int, int]]) -> Optional[List[tuple[int, int]]]:
+    assert _WORKER_GRID is not None
+    return astar(_WORKER_GRID, pair[0], pair[1])
+
+
 class TravelEstimator:
-    def __init__(self, grid: MapGrid):
+    """Annotates consecutive schedule blocks with the walk between their rooms.
+
+    Routes are planned once per distinct anchor pair. With ``workers > 1``
+    and at least ``parallel_threshold`` distinct routes, the A* searches fan
+    out over a process pool. Each worker receives the map once through the
+    pool initializer, and results come back in submission order, so the
+    annotation does not depend on the worker count.
+    """
+
+    def __init__(self, grid: MapGrid, *, workers: int = 1, parallel_threshold: int = 64):
         self.grid = grid
+        self.workers = max(1, int(workers))
+        self.parallel_threshold = max(1, int(parallel_threshold))
 
     def _room_anchor(self, room_id: str) -> tuple[int, int]:
         interior = self.grid.room_interior_targets(room_id)
@@ -213,7 +250,18 @@ class TravelEstimator:
         *,
         adjust_buffers: bool = True,
     ) -> None:
-        for actor_id, blocks in schedules.items():
+        anchors: Dict[str, Optional[tuple[int, int]]] = {}
+
+        def _anchor(room_id: str) -> Optional[tuple[int, int]]:
+            if room_id not in anchors:
+                try:
+                    anchors[room_id] = self._room_anchor(room_id)
+                except KeyError:
+                    anchors[room_id] = None
+            return anchors[room_id]
+
+        legs: List[tuple[DailySchedule, Optional[tuple[tuple[int, int], tuple[int, int]]]]] = []
+        for blocks in schedules.values():
             blocks.sort(key=lambda block: block.start_tick)
             previous: DailySchedule | None = None
             for block in blocks:
@@ -222,31 +270,52 @@ class TravelEstimator:
                     block.travel_path = []
                     previous = block
                     continue
-                start_room = previous.room_id or previous.activity_id
-                end_room = block.room_id or block.activity_id
-                try:
-                    start_point = self._room_anchor(start_room)
-                    end_point = self._room_anchor(end_room)
-                except KeyError:
-                    block.expected_travel = None
-                    block.travel_path = None
-                    previous = block
-                    continue
-                path = astar(self.grid, start_point, end_point)
-                if path:
-                    block.travel_path = path
-                    travel_steps = max(len(path) - 1, 0)
-                    block.expected_travel = travel_steps
-                    if adjust_buffers and travel_steps > (block.travel_buffer or 0):
-                        block.travel_buffer = travel_steps
-                else:
-                    block.travel_path = None
-                    block.expected_travel = None
+                start_point = _anchor(previous.room_id or previous.activity_id)
+                end_point = _anchor(block.room_id or block.activity_id)
+                pair = (start_point, end_point) if start_point is not None and end_point is not None else None
+                legs.append((block, pair))
                 previous = block
 
+        routes = self.plan_routes(dict.fromkeys(pair for _, pair in legs if pair is not None))
+        for block, pair in legs:
+            if pair is None:
+                block.expected_travel = None
+                block.travel_path = None
+                continue
+            path = routes[pair]
+            if path:
+                block.travel_path = path
+                travel_steps = max(len(path) - 1, 0)
+                block.expected_travel = travel_steps
+                if adjust_buffers and travel_steps > (block.travel_buffer or 0):
+                    block.travel_buffer = travel_steps
+            else:
+                block.travel_path = None
+                block.expected_travel = None
+
+    def plan_routes(
+        self,
+        pairs: Iterable[tuple[tuple[int, int], tuple[int, int]]],
+    ) -> Dict[tuple[tuple[int, int], tuple[int, int]], Optional[List[tuple[int, int]]]]:
+        """Run A* once per distinct pair, in parallel when it pays off."""
+
+        unique = list(dict.fromkeys(pairs))
+        if self.workers > 1 and len(unique) >= self.parallel_threshold:
+            chunksize = max(1, len(unique) // (self.workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_travel_worker,
+                initargs=(self.grid,),
+            ) as pool:
+                paths = list(pool.map(_route_in_worker, unique, chunksize=chunksize))
+        else:
+            paths = [astar(self.grid, start, end) for start, end in unique]
+        return dict(zip(unique, paths))
+
 
 __all__ = [
     "DailySchedule",
+    "ScheduleBlockOps",
     "ScheduleTemplate",
     "ScheduleAssignment",
     "TravelEstimator",
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .schedule_generator import DailySchedule, ScheduleBlockOps
+
+_UNKNOWN = -1
+
+
+class _SymbolTable:
+    """Interns repeated strings (actor, room, activity, slot ids) as ints."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        ident = self._ids.get(value)
+        if ident is None:
+            ident = len(self.values)
+            self._ids[value] = ident
+            self.values.append(value)
+        return ident
+
+    def lookup(self, value: str) -> Optional[int]:
+        return self._ids.get(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ScheduleStore:
+    """Columnar storage for daily schedule blocks.
+
+    Each block is one index into parallel integer arrays: actor, start,
+    duration, room, activity, slot, travel buffer, stagger and expected
+    travel. Strings are interned once in symbol tables and travel paths are
+    shared per distinct route, so a roster of tens of thousands of actors
+    costs a few dozen bytes per block instead of one dataclass (and one path
+    list) each. :class:`ScheduleRow` views keep the ``DailySchedule``
+    attribute interface for existing callers.
+
+    Rows replaced by an override are released rather than removed, so the
+    indices of live rows stay stable; :meth:`live_indices` skips released
+    rows and :meth:`append` reuses them, which keeps the columns as long as
+    the largest number of blocks ever live at once. A released row's view
+    must not be used afterwards, since its index may already hold another
+    block.
+    """
+
+    def __init__(self, day_length_minutes: int) -> None:
+        self.day_length_minutes = day_length_minutes
+        self.actors = _SymbolTable()
+        self.rooms = _SymbolTable()
+        self.activities = _SymbolTable()
+        self.slots = _SymbolTable()
+        self.actor = array("i")
+        self.start = array("i")
+        self.duration = array("i")
+        self.room = array("i")
+        self.activity = array("i")
+        self.slot = array("i")
+        self.buffer = array("i")
+        self.stagger = array("i")
+        self.expected_travel = array("i")
+        self.path = array("i")
+        self.live = bytearray()
+        self.notes: Dict[int, str] = {}
+        self._free: List[int] = []
+        self._paths: List[Tuple[Tuple[int, int], ...]] = []
+        self._path_ids: Dict[Tuple[Tuple[int, int], ...], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def live_count(self) -> int:
+        return len(self.start) - len(self._free)
+
+    def append(
+        self,
+        *,
+        actor_id: str,
+        slot: str,
+        activity_id: str,
+        room_id: str,
+        start_tick: int,
+        duration_minutes: int,
+        notes: str | None = None,
+        travel_buffer: int = 0,
+        expected_travel: Optional[int] = None,
+        travel_path: Optional[Sequence[Tuple[int, int]]] = None,
+        stagger_applied: int = 0,
+    ) -> "ScheduleRow":
+        values = (
+            self.actors.intern(actor_id),
+            start_tick % self.day_length_minutes,
+            duration_minutes,
+            self.rooms.intern(room_id),
+            self.activities.intern(activity_id),
+            self.slots.intern(slot),
+            travel_buffer,
+            stagger_applied,
+            _UNKNOWN if expected_travel is None else expected_travel,
+            self._path_id(travel_path),
+        )
+        columns = self._columns()
+        if self._free:
+            index = self._free.pop()
+            for column, value in zip(columns, values):
+                column[index] = value
+            self.live[index] = 1
+        else:
+            index = len(self.start)
+            for column, value in zip(columns, values):
+                column.append(value)
+            self.live.append(1)
+        if notes is not None:
+            self.notes[index] = notes
+        return ScheduleRow(self, index)
+
+    def add_block(self, block: DailySchedule, *, actor_id: str | None = None) -> "ScheduleRow":
+        """Copy a dataclass block (optionally re-owned by ``actor_id``) into the store."""
+
+        return self.append(
+            actor_id=block.actor_id if actor_id is None else actor_id,
+            slot=block.slot,
+            activity_id=block.activity_id,
+            room_id=block.room_id,
+            start_tick=block.start_tick,
+            duration_minutes=block.duration_minutes,
+            notes=block.notes,
+            travel_buffer=block.travel_buffer,
+            expected_travel=block.expected_travel if actor_id is None else None,
+            travel_path=block.travel_path if actor_id is None else None,
+            stagger_applied=block.stagger_applied if actor_id is None else 0,
+        )
+
+    def row(self, index: int) -> "ScheduleRow":
+        return ScheduleRow(self, index)
+
+    def release(self, rows: Iterable[DailySchedule]) -> None:
+        for row in rows:
+            if isinstance(row, ScheduleRow) and row.store is self and self.live[row.index]:
+                self.live[row.index] = 0
+                self.notes.pop(row.index, None)
+                self._free.append(row.index)
+
+    def live_indices(self) -> Iterator[int]:
+        live = self.live
+        return (index for index in range(len(live)) if live[index])
+
+    def interval(self, index: int) -> Tuple[int, int]:
+        """Absolute ``(start, end)`` of block ``index`` read straight from the columns."""
+
+        start = self.start[index]
+        duration = self.duration[index]
+        if duration <= 0:
+            return start, start
+        end = start + duration
+        if end <= start:
+            end += self.day_length_minutes
+        return start, end
+
+    def _columns(self) -> Tuple[array, ...]:
+        return (
+            self.actor,
+            self.start,
+            self.duration,
+            self.room,
+            self.activity,
+            self.slot,
+            self.buffer,
+            self.stagger,
+            self.expected_travel,
+            self.path,
+        )
+
+    def path_for(self, index: int) -> Optional[Tuple[Tuple[int, int], ...]]:
+        path_id = self.path[index]
+        return None if path_id == _UNKNOWN else self._paths[path_id]
+
+    def _path_id(self, path: Optional[Sequence[Tuple[int, int]]]) -> int:
+        if path is None:
+            return _UNKNOWN
+        key = tuple(path)
+        path_id = self._path_ids.get(key)
+        if path_id is None:
+            path_id = len(self._paths)
+            self._path_ids[key] = path_id
+            self._paths.append(key)
+        return path_id
+
+
+class ScheduleRow(ScheduleBlockOps):
+    """View of one :class:`ScheduleStore` block with the ``DailySchedule`` interface."""
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: ScheduleStore, index: int) -> None:
+        self.store = store
+        self.index = index
+
+    def __repr__(self) -> str:
+        return (
+            f"ScheduleRow(actor_id={self.actor_id!r}, slot={self.slot!r}, activity_id={self.activity_id!r}, "
+            f"room_id={self.room_id!r}, start_tick={self.start_tick}, duration_minutes={self.duration_minutes})"
+        )
+
+    @property
+    def actor_id(self) -> str:
+        return self.store.actors.values[self.store.actor[self.index]]
+
+    @actor_id.setter
+    def actor_id(self, value: str) -> None:
+        self.store.actor[self.index] = self.store.actors.intern(value)
+
+    @property
+    def slot(self) -> str:
+        return self.store.slots.values[self.store.slot[self.index]]
+
+    @slot.setter
+    def slot(self, value: str) -> None:
+        self.store.slot[self.index] = self.store.slots.intern(value)
+
+    @property
+    def activity_id(self) -> str:
+        return self.store.activities.values[self.store.activity[self.index]]
+
+    @activity_id.setter
+    def activity_id(self, value: str) -> None:
+        self.store.activity[self.index] = self.store.activities.intern(value)
+
+    @property
+    def room_id(self) -> str:
+        return self.store.rooms.values[self.store.room[self.index]]
+
+    @room_id.setter
+    def room_id(self, value: str) -> None:
+        self.store.room[self.index] = self.store.rooms.intern(value)
+
+    @property
+    def start_tick(self) -> int:
+        return self.store.start[self.index]
+
+    @start_tick.setter
+    def start_tick(self, value: int) -> None:
+        self.store.start[self.index] = value
+
+    @property
+    def duration_minutes(self) -> int:
+        return self.store.duration[self.index]
+
+    @duration_minutes.setter
+    def duration_minutes(self, value: int) -> None:
+        self.store.duration[self.index] = value
+
+    @property
+    def day_length_minutes(self) -> int:
+        return self.store.day_length_minutes
+
+    @property
+    def notes(self) -> str | None:
+        return self.store.notes.get(self.index)
+
+    @notes.setter
+    def notes(self, value: str | None) -> None:
+        if value is None:
+            self.store.notes.pop(self.index, None)
+        else:
+            self.store.notes[self.index] = value
+
+    @property
+    def travel_buffer(self) -> int:
+        return self.store.buffer[self.index]
+
+    @travel_buffer.setter
+    def travel_buffer(self, value: int) -> None:
+        self.store.buffer[self.index] = value
+
+    @property
+    def expected_travel(self) -> Optional[int]:
+        value = self.store.expected_travel[self.index]
+        return None if value == _UNKNOWN else value
+
+    @expected_travel.setter
+    def expected_travel(self, value: Optional[int]) -> None:
+        self.store.expected_travel[self.index] = _UNKNOWN if value is None else value
+
+    @property
+    def travel_path(self) -> Optional[Tuple[Tuple[int, int], ...]]:
+        return self.store.path_for(self.index)
+
+    @travel_path.setter
+    def travel_path(self, value: Optional[Sequence[Tuple[int, int]]]) -> None:
+        self.store.path[self.index] = self.store._path_id(value)
+
+    @property
+    def stagger_applied(self) -> int:
+        return self.store.stagger[self.index]
+
+    @stagger_applied.setter
+    def stagger_applied(self, value: int) -> None:
+        self.store.stagger[self.index] = value
+
+    def absolute_interval(self) -> tuple[int, int]:
+        return self.store.interval(self.index)
+
+    def to_block(self) -> DailySchedule:
+        return DailySchedule(
+            actor_id=self.actor_id,
+            slot=self.slot,
+            activity_id=self.activity_id,
+            room_id=self.room_id,
+            start_tick=self.start_tick,
+            duration_minutes=self.duration_minutes,
+            day_length_minutes=self.day_length_minutes,
+            notes=self.notes,
+            travel_buffer=self.travel_buffer,
+            expected_travel=self.expected_travel,
+            travel_path=list(self.travel_path) if self.travel_path is not None else None,
+            stagger_applied=self.stagger_applied,
+        )
+
+
+__all__ = ["ScheduleRow", "ScheduleStore"]
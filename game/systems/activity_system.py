@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Callable, List
+
 from ..actors.base_actor import NPCState
 from ..actors.npc import NPC
 from ..logging import EventLogger
@@ -7,12 +9,6 @@ from ..simulation.activities import ActivityCatalog, ActivityFactory
 from ..world import RoomManager
 
 
-def _format_minutes(minutes: int) -> str:
-    minutes %= 24 * 60
-    hours, mins = divmod(minutes, 60)
-    return f"{hours:02d}:{mins:02d}"
-
-
 class ActivitySystem:
     """Coordinates activity lifecycle with room tracking and logging."""
 
@@ -26,6 +22,18 @@ class ActivitySystem:
         self._catalog = catalog
         self._room_manager = room_manager
         self._logger = event_logger
+        self._start_listeners: List[Callable[[NPC], None]] = []
+        self._end_listeners: List[Callable[[NPC], None]] = []
+
+    def subscribe_starts(self, callback: Callable[[NPC], None]) -> None:
+        """Call ``callback(npc)`` after an NPC begins its pending block."""
+
+        self._start_listeners.append(callback)
+
+    def subscribe_ends(self, callback: Callable[[NPC], None]) -> None:
+        """Call ``callback(npc)`` after an NPC's activity completes or is interrupted."""
+
+        self._end_listeners.append(callback)
 
     def start_if_ready(self, npc: NPC, *, current_minutes: int, day_length_minutes: int) -> None:
         block = npc.pending_schedule
@@ -46,14 +54,15 @@ class ActivitySystem:
         npc.begin_activity(activity, current_minutes=current_minutes, day_length_minutes=day_length_minutes)
         start_state = activity.on_start()
         self._room_manager.start_activity(npc.name, activity)
-        timestamp = _format_minutes(current_minutes)
         self._logger.log_activity_start(
-            timestamp,
+            current_minutes,
             npc=npc.name,
             activity=activity.label,
             room=activity.room_id,
             state=dict(start_state.metadata),
         )
+        for listener in tuple(self._start_listeners):
+            listener(npc)
 
     def on_arrival(self, npc: NPC, *, current_minutes: int, day_length_minutes: int) -> None:
         self.start_if_ready(npc, current_minutes=current_minutes, day_length_minutes=day_length_minutes)
@@ -70,15 +79,15 @@ class ActivitySystem:
         if npc.tick_activity_minute():
             completion_state = activity.on_complete()
             self._room_manager.end_activity(npc.name, activity)
-            timestamp = _format_minutes(current_minutes)
             self._logger.log_activity_end(
-                timestamp,
+                current_minutes,
                 npc=npc.name,
                 activity=activity.label,
                 room=activity.room_id,
                 state=dict(completion_state.metadata),
             )
             npc.clear_activity()
+            self._notify_end(npc)
 
     def interrupt(self, npc: NPC, reason: str | None = None, *, current_minutes: int) -> None:
         activity = npc.current_activity
@@ -86,12 +95,16 @@ class ActivitySystem:
             return
         interrupt_state = activity.on_interrupt(reason)
         self._room_manager.end_activity(npc.name, activity)
-        timestamp = _format_minutes(current_minutes)
         self._logger.log_activity_interrupt(
-            timestamp,
+            current_minutes,
             npc=npc.name,
             activity=activity.label,
             room=activity.room_id,
             state=dict(interrupt_state.metadata),
         )
         npc.clear_activity()
+        self._notify_end(npc)
+
+    def _notify_end(self, npc: NPC) -> None:
+        for listener in tuple(self._end_listeners):
+            listener(npc)
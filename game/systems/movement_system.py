@@ -1,15 +1,40 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import Set, Tuple
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from ..actors.base_actor import NPCState
 from ..core.pathfinding import astar
 
 
+@dataclass
+class AbstractTrip:
+    """Tile-free journey used for actors simulated at low detail."""
+
+    origin: Tuple[int, int]
+    destination: Tuple[int, int]
+    total_ticks: int
+    elapsed_ticks: int = 0
+
+
 class MovementSystem:
-    def __init__(self, grid, *, cache_size: int = 128):
+    """Moves actors along planned paths.
+
+    With a ``room_manager`` attached, every position change that crosses a
+    room boundary is reported through ``track_exit``/``track_entry`` using the
+    grid's precomputed tile-to-room lookup. Abstract travellers stay in their
+    origin room until they arrive or are materialized. Listeners registered
+    with :meth:`subscribe_changes` hear about every actual change of an
+    actor's tile or movement state.
+    """
+
+    def __init__(self, grid, *, cache_size: int = 128, room_manager=None):
         self.grid = grid
+        self.room_manager = room_manager
+        self._room_listeners: List[Callable[[object, Optional[str], Optional[str]], None]] = []
+        self._change_listeners: List[Callable[[object], None]] = []
+        self._trips: Dict[str, AbstractTrip] = {}
         self._path_cache: "OrderedDict[Tuple[Tuple[int, int], Tuple[int, int]], Tuple[Tuple[int, int], ...]]" = (
             OrderedDict()
         )
@@ -52,7 +77,7 @@ class MovementSystem:
                 path = astar(self.grid, start, target, blocked=blocked)
                 if not path:
                     actor.target = None
-                    actor.state = NPCState.IDLE
+                    self._set_state(actor, NPCState.IDLE)
                     return
                 if not blocked:
                     self._store_cached_path(start, target, tuple(path))
@@ -60,11 +85,11 @@ class MovementSystem:
                 path = list(cached)
             if not path:
                 actor.target = None
-                actor.state = NPCState.IDLE
+                self._set_state(actor, NPCState.IDLE)
                 return
             actor.path = list(path[1:]) if len(path) > 1 else []
         if actor.path:
-            actor.state = NPCState.MOVING
+            self._set_state(actor, NPCState.MOVING)
 
     def step(self, actor, occupied: Set[Tuple[int, int]] | None = None, steps: int = 1) -> bool:
         if occupied is None:
@@ -76,10 +101,128 @@ class MovementSystem:
                 break
             actor.path.pop(0)
             occupied.add((nx, ny))
-            actor.x, actor.y = nx, ny
+            self._relocate(actor, (nx, ny))
             steps -= 1
         if not actor.path and actor.target is not None and (actor.x, actor.y) == actor.target:
             actor.target = None
-            actor.state = NPCState.IDLE
+            self._set_state(actor, NPCState.IDLE)
             reached = True
-        return reached
\ No newline at end of file
+        return reached
+
+    def is_abstract(self, actor) -> bool:
+        return actor.name in self._trips
+
+    def travel_abstractly(self, actor, travel_ticks: int) -> AbstractTrip:
+        """Replace tile-by-tile walking with a timed trip to ``actor.target``.
+
+        An in-progress path is honoured: its remaining length becomes the
+        trip duration so switching detail levels does not change arrival.
+        """
+
+        trip = self._trips.get(actor.name)
+        if trip is not None and trip.destination == actor.target:
+            return trip
+        duration = len(actor.path) if actor.path else max(int(travel_ticks), 0)
+        trip = AbstractTrip(origin=(actor.x, actor.y), destination=actor.target, total_ticks=duration)
+        self._trips[actor.name] = trip
+        actor.path.clear()
+        self._set_state(actor, NPCState.MOVING)
+        return trip
+
+    def step_abstract(self, actor, occupied: Set[Tuple[int, int]] | None = None) -> bool:
+        """Advance a trip by one tick; arrive once its duration has elapsed.
+
+        An abstract traveller holds no tile while en route. If another actor
+        stands on the destination when the trip completes, the traveller
+        waits, just as a walking actor would in front of a blocked tile.
+        """
+
+        trip = self._trips.get(actor.name)
+        if trip is None:
+            return False
+        trip.elapsed_ticks = min(trip.elapsed_ticks + 1, trip.total_ticks)
+        if trip.elapsed_ticks < trip.total_ticks:
+            return False
+        if occupied is not None and trip.destination in occupied:
+            return False
+        del self._trips[actor.name]
+        self._relocate(actor, trip.destination)
+        actor.path.clear()
+        actor.target = None
+        self._set_state(actor, NPCState.IDLE)
+        return True
+
+    def materialize(self, actor, occupied: Set[Tuple[int, int]] | None = None) -> None:
+        """Drop an abstract trip back to full detail at its estimated tile.
+
+        When that tile is taken the actor backs off along the path to the
+        nearest free tile. If every tile back to the origin is taken, the
+        actor stays abstract and is materialized on a later call.
+        """
+
+        trip = self._trips.get(actor.name)
+        if trip is None:
+            return
+        path = self._get_cached_path(trip.origin, trip.destination)
+        if path is None:
+            found = astar(self.grid, trip.origin, trip.destination)
+            if not found:
+                del self._trips[actor.name]
+                actor.target = trip.destination
+                actor.path.clear()
+                return
+            path = tuple(found)
+            self._store_cached_path(trip.origin, trip.destination, path)
+        index = min(trip.elapsed_ticks, len(path) - 1)
+        if occupied:
+            while index >= 0 and path[index] in occupied:
+                index -= 1
+            if index < 0:
+                return
+        del self._trips[actor.name]
+        actor.target = trip.destination
+        self._relocate(actor, path[index])
+        actor.path = list(path[index + 1:])
+        if actor.path:
+            self._set_state(actor, NPCState.MOVING)
+
+    def cancel_abstract(self, actor) -> None:
+        self._trips.pop(actor.name, None)
+
+    def subscribe_room_changes(self, callback: Callable[[object, Optional[str], Optional[str]], None]) -> None:
+        """Call ``callback(actor, old_room, new_room)`` whenever an actor crosses a room boundary."""
+
+        self._room_listeners.append(callback)
+
+    def subscribe_changes(self, callback: Callable[[object], None]) -> None:
+        """Call ``callback(actor)`` whenever an actor's tile or movement state changes."""
+
+        self._change_listeners.append(callback)
+
+    def _set_state(self, actor, state: NPCState) -> None:
+        if actor.state == state:
+            return
+        actor.state = state
+        for listener in tuple(self._change_listeners):
+            listener(actor)
+
+    def _relocate(self, actor, position: Tuple[int, int]) -> None:
+        previous = (actor.x, actor.y)
+        if previous == position:
+            return
+        actor.x, actor.y = position
+        for listener in tuple(self._change_listeners):
+            listener(actor)
+        if self.room_manager is None and not self._room_listeners:
+            return
+        old_room = self.grid.room_id_at(*previous)
+        new_room = self.grid.room_id_at(*position)
+        if old_room == new_room:
+            return
+        if self.room_manager is not None:
+            if old_room is not None:
+                self.room_manager.track_exit(actor.name, old_room)
+            if new_room is not None:
+                self.room_manager.track_entry(actor.name, new_room)
+        for listener in tuple(self._room_listeners):
+            listener(actor, old_room, new_room)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+CACHE_FORMAT_VERSION = 1
+
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+# Modules whose code decides what a compiled plan looks like or how it is
+# pickled: block and travel estimation, conflict staggering and the
+# optimizing resolver, the columnar store, roster ingestion and the compile
+# step itself.
+_PLANNER_SOURCES = (
+    _PACKAGE_ROOT / "simulation" / "schedule_generator.py",
+    _PACKAGE_ROOT / "simulation" / "conflict_resolver.py",
+    _PACKAGE_ROOT / "simulation" / "conflict_optimizer.py",
+    _PACKAGE_ROOT / "simulation" / "schedule_store.py",
+    _PACKAGE_ROOT / "simulation" / "roster_ingest.py",
+    _PACKAGE_ROOT / "systems" / "schedule_system.py",
+    _PACKAGE_ROOT / "systems" / "schedule_cache.py",
+)
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def planner_fingerprint() -> str:
+    """Digest of the planner sources, so code changes invalidate old plans."""
+
+    digest = hashlib.sha256()
+    for path in _PLANNER_SOURCES:
+        digest.update(path.name.encode("utf-8"))
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class CompiledPlanCache:
+    """Stores compiled daily plans on disk, keyed by a hash of their inputs.
+
+    The file name is derived from the roster and map contents, the day
+    length and a fingerprint of the planner source code. The resolver mode
+    (``conflict_resolution``) only comes from the roster file, so hashing
+    its contents keys ``sweep``, ``iterative`` and ``optimize`` plans
+    apart. The roster's dependent files (activities, templates, external
+    assignment lists) are recorded with their digests inside the payload and
+    re-validated on load, so editing any of them forces a rebuild without
+    having to parse the roster first.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def key_for(self, roster_path: Path, map_path: Path, *, day_length_minutes: int) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"v{CACHE_FORMAT_VERSION}:{day_length_minutes}".encode("utf-8"))
+        digest.update(planner_fingerprint().encode("ascii"))
+        for path in (roster_path, map_path):
+            digest.update(str(path.resolve()).encode("utf-8"))
+            digest.update(_file_digest(path).encode("ascii"))
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as handle:
+                payload = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+            return None
+        if not isinstance(payload, dict) or payload.get("format") != CACHE_FORMAT_VERSION:
+            return None
+        for dependency, expected in payload.get("dependencies", {}).items():
+            dependency_path = Path(dependency)
+            if not dependency_path.exists() or _file_digest(dependency_path) != expected:
+                return None
+        return payload
+
+    def store(self, key: str, payload: Mapping[str, Any], *, dependencies: Iterable[Path]) -> None:
+        record = dict(payload)
+        record["format"] = CACHE_FORMAT_VERSION
+        record["dependencies"] = {str(path.resolve()): _file_digest(path) for path in dependencies}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self._path_for(key)
+        temporary = target.with_suffix(f".{os.getpid()}.tmp")
+        with temporary.open("wb") as handle:
+            pickle.dump(record, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, target)
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.plan"
+
+
+__all__ = ["CompiledPlanCache", "CACHE_FORMAT_VERSION", "planner_fingerprint"]
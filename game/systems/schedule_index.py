@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..simulation.schedule_generator import DailySchedule
+
+_Entry = Tuple[int, int, DailySchedule]
+
+
+def _start_key(entry: _Entry) -> int:
+    return entry[0]
+
+
+def _end_key(entry: _Entry) -> int:
+    return -entry[1]
+
+
+def _discard(items: List[_Entry], entry: _Entry, key: Callable[[_Entry], int]) -> None:
+    low = bisect_left(items, key(entry), key=key)
+    high = bisect_right(items, key(entry), key=key)
+    for position in range(low, high):
+        if items[position] is entry:
+            del items[position]
+            return
+
+
+class _IntervalNode:
+    """Centered interval tree node over half-open ``[start, end)`` minutes.
+
+    Each node owns the minute range ``[low, high]`` its entries' points fall
+    in; children split it at ``center``. Nodes created by :meth:`insert`
+    take the midpoint of their range, so the depth stays bounded by the
+    bulk-built depth plus ``log2(day_length)`` however many blocks move.
+    """
+
+    __slots__ = ("center", "low", "high", "by_start", "by_end", "left", "right")
+
+    def __init__(self, entries: Sequence[_Entry], low: int, high: int) -> None:
+        self.low = low
+        self.high = high
+        if entries:
+            points = sorted(point for start, end, _ in entries for point in (start, end - 1))
+            self.center = points[len(points) // 2]
+        else:
+            self.center = (low + high) // 2
+        here: List[_Entry] = []
+        left: List[_Entry] = []
+        right: List[_Entry] = []
+        for entry in entries:
+            start, end, _ = entry
+            if end <= self.center:
+                left.append(entry)
+            elif start > self.center:
+                right.append(entry)
+            else:
+                here.append(entry)
+        self.by_start = sorted(here, key=_start_key)
+        self.by_end = sorted(here, key=_end_key)
+        self.left = _IntervalNode(left, low, self.center - 1) if left else None
+        self.right = _IntervalNode(right, self.center + 1, high) if right else None
+
+    def insert(self, entry: _Entry) -> None:
+        start, end, _ = entry
+        node = self
+        while True:
+            if end <= node.center:
+                if node.left is None:
+                    node.left = _IntervalNode((), node.low, node.center - 1)
+                node = node.left
+            elif start > node.center:
+                if node.right is None:
+                    node.right = _IntervalNode((), node.center + 1, node.high)
+                node = node.right
+            else:
+                insort(node.by_start, entry, key=_start_key)
+                insort(node.by_end, entry, key=_end_key)
+                return
+
+    def remove(self, entry: _Entry) -> None:
+        start, end, _ = entry
+        node: Optional[_IntervalNode] = self
+        while node is not None:
+            if end <= node.center:
+                node = node.left
+            elif start > node.center:
+                node = node.right
+            else:
+                _discard(node.by_start, entry, _start_key)
+                _discard(node.by_end, entry, _end_key)
+                return
+
+    def overlapping(self, start: int, end: int, found: List[DailySchedule]) -> None:
+        node: Optional[_IntervalNode] = self
+        while node is not None:
+            center = node.center
+            if start <= center < end:
+                found.extend(entry[2] for entry in node.by_start)
+                if node.left is not None:
+                    node.left.overlapping(start, end, found)
+                node = node.right
+            elif end <= center:
+                for entry_start, _, block in node.by_start:
+                    if entry_start >= end:
+                        break
+                    found.append(block)
+                node = node.left
+            else:
+                for _, entry_end, block in node.by_end:
+                    if entry_end <= start:
+                        break
+                    found.append(block)
+                node = node.right
+
+
+class RoomIntervalIndex:
+    """Per-room interval tree over scheduled blocks.
+
+    Blocks are indexed by :meth:`DailySchedule.absolute_interval`; a block
+    that runs past midnight is stored as two pieces so queries on either
+    side of the wrap find it. :meth:`rebuild` bulk-loads balanced trees;
+    after that :meth:`add` and :meth:`remove` insert and delete a block's
+    pieces in place, so an override costs ``O(log n)`` tree steps plus a
+    list insertion instead of a rebuild of the whole room. Stabbing and
+    range queries cost ``O(log n + k)``.
+
+    Resolvers shift blocks in place, so callers that stagger blocks must
+    :meth:`invalidate` the rooms involved before querying them again; that
+    re-places only the blocks whose interval actually moved.
+    """
+
+    def __init__(self, day_length_minutes: int) -> None:
+        self.day_length_minutes = day_length_minutes
+        self._members: Dict[str, Dict[int, Tuple[DailySchedule, List[_Entry]]]] = {}
+        self._trees: Dict[str, _IntervalNode] = {}
+
+    def rebuild(self, blocks: Iterable[DailySchedule]) -> None:
+        self._members = {}
+        pieces_by_room: Dict[str, List[_Entry]] = {}
+        for block in blocks:
+            pieces = self._pieces(block)
+            self._members.setdefault(block.room_id, {})[id(block)] = (block, pieces)
+            pieces_by_room.setdefault(block.room_id, []).extend(pieces)
+        self._trees = {
+            room_id: _IntervalNode(pieces, 0, self.day_length_minutes - 1)
+            for room_id, pieces in pieces_by_room.items()
+        }
+
+    def add(self, block: DailySchedule) -> None:
+        members = self._members.setdefault(block.room_id, {})
+        if id(block) in members:
+            return
+        pieces = self._pieces(block)
+        members[id(block)] = (block, pieces)
+        tree = self._tree_for(block.room_id)
+        for entry in pieces:
+            tree.insert(entry)
+
+    def remove(self, block: DailySchedule) -> None:
+        members = self._members.get(block.room_id)
+        record = members.pop(id(block), None) if members is not None else None
+        if record is None:
+            return
+        tree = self._trees[block.room_id]
+        for entry in record[1]:
+            tree.remove(entry)
+
+    def invalidate(self, room_ids: Iterable[str]) -> None:
+        """Re-place blocks in ``room_ids`` whose interval changed since indexing."""
+
+        for room_id in room_ids:
+            members = self._members.get(room_id)
+            if not members:
+                continue
+            tree = self._trees[room_id]
+            for key, (block, pieces) in members.items():
+                current = self._pieces(block)
+                if [entry[:2] for entry in current] == [entry[:2] for entry in pieces]:
+                    continue
+                for entry in pieces:
+                    tree.remove(entry)
+                for entry in current:
+                    tree.insert(entry)
+                members[key] = (block, current)
+
+    def rooms(self) -> List[str]:
+        return [room_id for room_id, members in self._members.items() if members]
+
+    def blocks_in(self, room_id: str) -> List[DailySchedule]:
+        return [block for block, _ in self._members.get(room_id, {}).values()]
+
+    def at(self, room_id: str, minute: int) -> List[DailySchedule]:
+        """Blocks in ``room_id`` whose interval contains ``minute``."""
+
+        minute %= self.day_length_minutes
+        return self.between(room_id, minute, minute + 1)
+
+    def between(self, room_id: str, start: int, end: int) -> List[DailySchedule]:
+        """Blocks in ``room_id`` overlapping ``[start, end)``.
+
+        ``end`` may run past midnight (``end > day_length``) for windows
+        that wrap. Results are ordered by start minute, then actor, so the
+        order does not depend on the tree's shape.
+        """
+
+        tree = self._trees.get(room_id)
+        if tree is None or end <= start:
+            return []
+        day = self.day_length_minutes
+        start %= day
+        end = start + min(end - start, day)
+        found: List[DailySchedule] = []
+        tree.overlapping(start, min(end, day), found)
+        if end > day:
+            tree.overlapping(0, end - day, found)
+        unique: Dict[int, DailySchedule] = {}
+        for block in found:
+            unique.setdefault(id(block), block)
+        return sorted(unique.values(), key=lambda block: (block.start_tick, block.actor_id))
+
+    def _tree_for(self, room_id: str) -> _IntervalNode:
+        tree = self._trees.get(room_id)
+        if tree is None:
+            tree = self._trees[room_id] = _IntervalNode((), 0, self.day_length_minutes - 1)
+        return tree
+
+    def _pieces(self, block: DailySchedule) -> List[_Entry]:
+        day = self.day_length_minutes
+        start, end = block.absolute_interval()
+        if end <= start:
+            return []
+        if end > day:
+            entries = [(start, day, block), (0, min(end - day, start), block)]
+        else:
+            entries = [(start, end, block)]
+        return [entry for entry in entries if entry[1] > entry[0]]
+
+
+__all__ = ["RoomIntervalIndex"]
@@ -4,14 +4,14 @@ import csv
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple
-
-import yaml
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 from ..actors.npc import NPC
+from ..simulation.conflict_optimizer import resolve_with_optimization
 from ..simulation.conflict_resolver import (
     ConflictRecord,
     detect_room_capacity_conflicts,
+    detect_store_conflicts,
     resolve_with_staggering,
 )
 from ..simulation.schedule_generator import (
@@ -23,7 +23,16 @@ from ..simulation.schedule_generator import (
     parse_duration,
     parse_hhmm,
 )
+from ..simulation.schedule_store import ScheduleRow, ScheduleStore
 from ..simulation.activities import ActivityCatalog, ActivityProfile
+from ..simulation.roster_ingest import (
+    IngestTimer,
+    RosterIngestStats,
+    iter_assignment_records,
+    load_yaml,
+)
+from .schedule_cache import CompiledPlanCache
+from .schedule_index import RoomIntervalIndex
 
 
 @dataclass
@@ -34,6 +43,43 @@ class ActivityDefinition:
     notes: Optional[str] = None
 
 
+@dataclass
+class ConflictResolution:
+    """Roster-level choice of capacity-conflict resolver.
+
+    ``sweep`` and ``iterative`` are the greedy staggering modes;
+    ``optimize`` minimises total shift minutes within a time budget.
+    """
+
+    strategy: str = "sweep"
+    time_budget_seconds: Optional[float] = 1.0
+    max_passes: int = 8
+
+    STRATEGIES = ("sweep", "iterative", "optimize")
+
+    @classmethod
+    def from_config(cls, value: object) -> "ConflictResolution":
+        if value is None:
+            return cls()
+        if isinstance(value, str):
+            settings = cls(strategy=value)
+        elif isinstance(value, Mapping):
+            budget = value.get("time_budget_seconds", 1.0)
+            settings = cls(
+                strategy=str(value.get("strategy", "sweep")),
+                time_budget_seconds=float(budget) if budget is not None else None,
+                max_passes=int(value.get("max_passes", 8)),
+            )
+        else:
+            raise ValueError("conflict_resolution must be a strategy name or a mapping")
+        if settings.strategy not in cls.STRATEGIES:
+            raise ValueError(
+                f"Unknown conflict_resolution strategy '{settings.strategy}' "
+                f"(expected one of: {', '.join(cls.STRATEGIES)})"
+            )
+        return settings
+
+
 @dataclass
 class ScheduledActivity:
     name: str
@@ -46,6 +92,27 @@ class ScheduledActivity:
     profile: Optional[ActivityProfile] = None
 
 
+def _resolve_relative(roster_path: Path, value: str) -> Path:
+    path = Path(value)
+    if path.is_absolute():
+        return path
+    candidate = (roster_path.parent / path).resolve()
+    if candidate.exists():
+        return candidate
+    return (Path.cwd() / path).resolve()
+
+
+def _intervals_overlap(first: Tuple[int, int], second: Tuple[int, int], day_length: int) -> bool:
+    """Return True when two absolute intervals overlap on a wrapping day."""
+
+    start_a, end_a = first
+    start_b, end_b = second
+    for offset in (-day_length, 0, day_length):
+        if start_a < end_b + offset and start_b + offset < end_a:
+            return True
+    return False
+
+
 class ScheduleSystem:
     def __init__(
         self,
@@ -55,8 +122,13 @@ class ScheduleSystem:
         day_length_minutes: int = 1440,
         rng=None,
         activity_catalog: ActivityCatalog | None = None,
+        cache_dir: str | Path | None = None,
+        measure_memory: bool = False,
+        travel_workers: int = 1,
     ):
         self.mapgrid = mapgrid
+        self.travel_workers = max(1, int(travel_workers))
+        self._assignment_listeners: List[Callable[[NPC], None]] = []
         self.day_length_minutes = day_length_minutes
         self.rng = rng
         self.activity_catalog = activity_catalog
@@ -66,32 +138,39 @@ class ScheduleSystem:
         if roster_path.suffix.lower() == '.json':
             self._init_from_legacy_json(roster_path)
             return
+        if roster_path.suffix.lower() in {'.jsonl', '.ndjson', '.csv'}:
+            raise ValueError(
+                f"{roster_path.name}: streamed assignment lists must be referenced through a roster "
+                "YAML's assignments_file so activities_file and templates_file are known"
+            )
+
+        cache = CompiledPlanCache(cache_dir) if cache_dir else None
+        map_file = getattr(mapgrid, "path", None)
+        cache_key = None
+        if cache is not None and map_file:
+            cache_key = cache.key_for(roster_path, Path(map_file), day_length_minutes=day_length_minutes)
+            cached = cache.load(cache_key)
+            if cached is not None:
+                self._restore_compiled(cached)
+                self._finalize_setup(compiled=True)
+                return
 
-        roster_data = yaml.safe_load(roster_path.read_text(encoding="utf-8")) or {}
+        roster_data = load_yaml(roster_path) or {}
 
         activities_file = roster_data.get("activities_file")
         templates_file = roster_data.get("templates_file")
-        assignments_data = roster_data.get("assignments", [])
+        assignments_file = roster_data.get("assignments_file")
+        assignments_data = roster_data.get("assignments", []) or []
+        self.conflict_resolution = ConflictResolution.from_config(roster_data.get("conflict_resolution"))
 
         if not activities_file or not templates_file:
             raise ValueError("Roster configuration must include activities_file and templates_file")
 
-        activities_path = Path(activities_file)
-        if not activities_path.is_absolute():
-            candidate = (roster_path.parent / activities_path).resolve()
-            if candidate.exists():
-                activities_path = candidate
-            else:
-                activities_path = (Path.cwd() / activities_path).resolve()
-        templates_path = Path(templates_file)
-        if not templates_path.is_absolute():
-            candidate = (roster_path.parent / templates_path).resolve()
-            if candidate.exists():
-                templates_path = candidate
-            else:
-                templates_path = (Path.cwd() / templates_path).resolve()
-
-        activities_raw = yaml.safe_load(activities_path.read_text(encoding="utf-8")) or {}
+        activities_path = _resolve_relative(roster_path, activities_file)
+        templates_path = _resolve_relative(roster_path, templates_file)
+        assignments_path = _resolve_relative(roster_path, assignments_file) if assignments_file else None
+
+        activities_raw = load_yaml(activities_path) or {}
         activity_entries = activities_raw.get("activities", {})
         self.activity_definitions: Dict[str, ActivityDefinition] = {}
         for key, value in activity_entries.items():
@@ -105,29 +184,68 @@ class ScheduleSystem:
                 notes=str(notes) if notes is not None else None,
             )
 
-        templates_raw = yaml.safe_load(templates_path.read_text(encoding="utf-8")) or {}
+        templates_raw = load_yaml(templates_path) or {}
         self.templates: Dict[str, ScheduleTemplate] = {
             name: ScheduleTemplate(name, variants, day_length_minutes=day_length_minutes)
             for name, variants in templates_raw.items()
         }
 
-        self.assignments: List[ScheduleAssignment] = [
-            ScheduleAssignment.from_dict(entry, templates=self.templates)
-            for entry in assignments_data
-        ]
+        self.assignments: List[ScheduleAssignment] = []
+        self.assignment_specs: Dict[str, Mapping[str, object]] = {}
+        self._daily_plan: Dict[str, List[DailySchedule]] = {}
+        self.store = ScheduleStore(day_length_minutes)
+        self.ingest_stats = RosterIngestStats(source=str(assignments_path or roster_path))
+        with IngestTimer(self.ingest_stats, measure_memory=measure_memory):
+            self._ingest_assignments(assignments_data)
+            if assignments_path is not None:
+                self._ingest_assignments(iter_assignment_records(assignments_path))
+
+        self._compile_plan()
+        if cache is not None and cache_key is not None:
+            cache.store(
+                cache_key,
+                self._compiled_payload(),
+                dependencies=[path for path in (activities_path, templates_path, assignments_path) if path],
+            )
+        self._finalize_setup(compiled=True)
 
-        self.assignment_specs: Dict[str, Mapping[str, object]] = {
-            str(entry.get("name")): entry
-            for entry in assignments_data
-            if isinstance(entry, Mapping) and entry.get("name")
-        }
+    def _ingest_assignments(self, entries: Iterable[Mapping[str, object]]) -> None:
+        """Instantiate assignments one entry at a time so large rosters stream."""
 
-        self._daily_plan: Dict[str, List[DailySchedule]] = {}
-        for assignment in self.assignments:
-            blocks = assignment.apply()
-            self._daily_plan[assignment.actor_id] = blocks
+        for entry in entries:
+            if not isinstance(entry, Mapping):
+                continue
+            assignment = ScheduleAssignment.from_dict(entry, templates=self.templates)
+            self.assignments.append(assignment)
+            if entry.get("name"):
+                self.assignment_specs[str(entry.get("name"))] = entry
+            self._daily_plan[assignment.actor_id] = assignment.apply(store=self.store)
+            self.ingest_stats.assignments += 1
+
+    def _compiled_payload(self) -> Dict[str, object]:
+        return {
+            "activity_definitions": self.activity_definitions,
+            "templates": self.templates,
+            "assignments": self.assignments,
+            "assignment_specs": self.assignment_specs,
+            "store": self.store,
+            "daily_plan": self._daily_plan,
+            "detected_conflicts": self.detected_conflicts,
+            "conflicts": self.conflicts,
+            "conflict_resolution": self.conflict_resolution,
+        }
 
-        self._finalize_setup()
+    def _restore_compiled(self, payload: Mapping[str, object]) -> None:
+        self.activity_definitions = payload["activity_definitions"]  # type: ignore[assignment]
+        self.templates = payload["templates"]  # type: ignore[assignment]
+        self.assignments = payload["assignments"]  # type: ignore[assignment]
+        self.assignment_specs = payload["assignment_specs"]  # type: ignore[assignment]
+        self.store = payload["store"]  # type: ignore[assignment]
+        self._daily_plan = payload["daily_plan"]  # type: ignore[assignment]
+        self.detected_conflicts = payload["detected_conflicts"]  # type: ignore[assignment]
+        self.conflicts = payload["conflicts"]  # type: ignore[assignment]
+        self.conflict_resolution = payload["conflict_resolution"]  # type: ignore[assignment]
+        self.ingest_stats = RosterIngestStats(source="compiled plan cache", assignments=len(self.assignments))
 
     def _init_from_legacy_json(self, roster_path: Path) -> None:
         payload = json.loads(roster_path.read_text(encoding="utf-8"))
@@ -144,12 +262,15 @@ class ScheduleSystem:
         self.templates = {}
         self.assignments = []
         npcs = payload.get("npcs", [])
+        self.ingest_stats = RosterIngestStats(source=str(roster_path), assignments=len(npcs))
         self.assignment_specs = {
             str(entry.get("name")): {"role": entry.get("role", "student")}
             for entry in npcs
             if isinstance(entry, Mapping)
         }
         self._daily_plan = {}
+        self.store = ScheduleStore(self.day_length_minutes)
+        self.conflict_resolution = ConflictResolution()
         for npc_data in npcs:
             if not isinstance(npc_data, Mapping):
                 continue
@@ -162,41 +283,44 @@ class ScheduleSystem:
                 activity_id = str(entry.get("activity"))
                 if activity_id not in self.activity_definitions:
                     continue
-                minutes = self._hhmm_to_minutes(str(entry.get("time", "00:00")))
+                minutes = parse_hhmm(str(entry.get("time", "00:00"))) % self.day_length_minutes
                 jitter = int(entry.get("jitter", 0) or 0)
                 if jitter and self.rng is not None:
                     minutes = (minutes + self.rng.randint(-jitter, jitter)) % self.day_length_minutes
                 spec = self.activity_definitions[activity_id]
                 blocks.append(
-                    DailySchedule(
+                    self.store.append(
                         actor_id=name,
                         slot=activity_id,
                         activity_id=activity_id,
                         room_id=spec.location,
                         start_tick=minutes,
                         duration_minutes=spec.duration,
-                        day_length_minutes=self.day_length_minutes,
                     )
                 )
             blocks.sort(key=lambda block: block.start_tick)
             self._daily_plan[name] = blocks
         self._finalize_setup()
 
-    def _finalize_setup(self) -> None:
-        travel_estimator = TravelEstimator(self.mapgrid)
+    def _compile_plan(self) -> None:
+        travel_estimator = TravelEstimator(self.mapgrid, workers=self.travel_workers)
         travel_estimator.annotate(self._daily_plan, adjust_buffers=True)
 
         flat_blocks: List[DailySchedule] = [block for blocks in self._daily_plan.values() for block in blocks]
         self.detected_conflicts = []
         self.conflicts = []
         if flat_blocks:
-            self.detected_conflicts = detect_room_capacity_conflicts(list(flat_blocks), self.mapgrid.rooms)
-            self.conflicts = resolve_with_staggering(flat_blocks, self.mapgrid.rooms)
+            self.detected_conflicts = self._detect_conflicts(flat_blocks, self.mapgrid.rooms)
+            self.conflicts = self._resolve_conflicts(flat_blocks, self.mapgrid.rooms)
             travel_estimator.annotate(self._daily_plan, adjust_buffers=False)
 
         for blocks in self._daily_plan.values():
             blocks.sort(key=lambda block: block.start_tick)
 
+    def _finalize_setup(self, *, compiled: bool = False) -> None:
+        if not compiled:
+            self._compile_plan()
+
         self.npcs = []
         self._default_spawn = self._choose_spawn()
         self.daily_plan = {actor_id: list(blocks) for actor_id, blocks in self._daily_plan.items()}
@@ -217,6 +341,9 @@ class ScheduleSystem:
             npc.daily_plan = list(blocks)
             self.npcs.append(npc)
 
+        self._index_rooms()
+        self._rebuild_dispatch()
+
     def override_plan(
         self,
         actor_id: str,
@@ -224,9 +351,47 @@ class ScheduleSystem:
         *,
         source: str = "principal_override",
     ) -> List[DailySchedule]:
-        if actor_id not in self.daily_plan:
-            raise KeyError(f"Unknown actor '{actor_id}'")
+        return self.override_plans({actor_id: overrides}, source=source)[actor_id]
 
+    def override_plans(
+        self,
+        overrides: Mapping[str, Sequence[Mapping[str, object]]],
+        *,
+        source: str = "principal_override",
+    ) -> Dict[str, List[DailySchedule]]:
+        """Replace several actors' plans and re-plan travel and conflicts once.
+
+        Every override is validated before anything changes, so an unknown
+        actor or a malformed block leaves the whole plan untouched.
+        """
+
+        if not overrides:
+            raise ValueError("Override requires at least one actor")
+        parsed: Dict[str, List[DailySchedule]] = {}
+        for actor_id, payloads in overrides.items():
+            if actor_id not in self.daily_plan:
+                raise KeyError(f"Unknown actor '{actor_id}'")
+            parsed[actor_id] = self._parse_override_blocks(actor_id, payloads, source)
+
+        changes: Dict[str, Sequence[DailySchedule]] = {}
+        for actor_id, blocks in parsed.items():
+            stored = [self.store.add_block(block) for block in blocks]
+            changes[actor_id] = self.daily_plan.get(actor_id, [])
+            self._daily_plan[actor_id] = list(stored)
+            self.daily_plan[actor_id] = list(stored)
+            self.assignment_specs.setdefault(actor_id, {})["override_source"] = source
+
+        self._recalculate_plans(changes)
+        for previous_blocks in changes.values():
+            self.store.release(previous_blocks)
+        return {actor_id: self.daily_plan[actor_id] for actor_id in parsed}
+
+    def _parse_override_blocks(
+        self,
+        actor_id: str,
+        overrides: Sequence[Mapping[str, object]],
+        source: str,
+    ) -> List[DailySchedule]:
         day_length = self.day_length_minutes
         blocks: List[DailySchedule] = []
         for index, payload in enumerate(overrides):
@@ -276,36 +441,21 @@ class ScheduleSystem:
 
         if not blocks:
             raise ValueError("Override requires at least one block")
-
         blocks.sort(key=lambda item: item.start_tick)
-        self._daily_plan[actor_id] = list(blocks)
-        self.daily_plan[actor_id] = list(blocks)
-        self.assignment_specs.setdefault(actor_id, {})["override_source"] = source
+        return blocks
 
-        self._recalculate_plans(actor_id=actor_id)
-        return self.daily_plan[actor_id]
+    def _recalculate_plans(self, changes: Mapping[str, Sequence[DailySchedule]] | None = None) -> None:
+        """Rebuild NPC schedules after ``changes`` (actor -> replaced blocks).
 
-    def _recalculate_plans(self, actor_id: str | None = None) -> None:
-        travel_estimator = TravelEstimator(self.mapgrid)
-        travel_estimator.annotate(self.daily_plan, adjust_buffers=True)
+        Without ``changes`` the whole roster is re-planned.
+        """
 
-        flat_blocks: List[DailySchedule] = [
-            block
-            for blocks in self.daily_plan.values()
-            for block in blocks
-        ]
-        if flat_blocks:
-            self.detected_conflicts = detect_room_capacity_conflicts(
-                list(flat_blocks),
-                self.mapgrid.rooms,
-            )
-            self.conflicts = resolve_with_staggering(flat_blocks, self.mapgrid.rooms)
-            travel_estimator.annotate(self.daily_plan, adjust_buffers=False)
+        if changes is None:
+            self._recalculate_all()
+            target_names = {npc.name for npc in self.npcs}
         else:
-            self.detected_conflicts = []
-            self.conflicts = []
-
-        target_names = {actor_id} if actor_id else {npc.name for npc in self.npcs}
+            shifted_actors = self._recalculate_actors(changes)
+            target_names = set(changes) | shifted_actors
         for npc in self.npcs:
             if npc.name not in target_names:
                 continue
@@ -317,8 +467,11 @@ class ScheduleSystem:
             npc.pending_destination = None
             npc.target = None
             npc.path.clear()
+            self._index_npc(self._npc_index[npc.name])
 
-        if actor_id and all(npc.name != actor_id for npc in self.npcs):
+        for actor_id in changes or ():
+            if actor_id in self._npc_index:
+                continue
             blocks = self.daily_plan.get(actor_id, [])
             if blocks:
                 schedule = self._build_schedule(blocks)
@@ -335,9 +488,175 @@ class ScheduleSystem:
                 )
                 npc.daily_plan = list(blocks)
                 self.npcs.append(npc)
+                self._npc_index[npc.name] = len(self.npcs) - 1
+                self._index_npc(len(self.npcs) - 1)
 
-    def _build_schedule(self, blocks: List[DailySchedule]) -> List[Tuple[str, ScheduledActivity]]:
-        schedule: List[Tuple[str, ScheduledActivity]] = []
+    def _recalculate_all(self) -> None:
+        travel_estimator = TravelEstimator(self.mapgrid, workers=self.travel_workers)
+        travel_estimator.annotate(self.daily_plan, adjust_buffers=True)
+
+        flat_blocks: List[DailySchedule] = [
+            block
+            for blocks in self.daily_plan.values()
+            for block in blocks
+        ]
+        if flat_blocks:
+            self.detected_conflicts = self._detect_conflicts(flat_blocks, self.mapgrid.rooms)
+            self.conflicts = self._resolve_conflicts(flat_blocks, self.mapgrid.rooms)
+            travel_estimator.annotate(self.daily_plan, adjust_buffers=False)
+        else:
+            self.detected_conflicts = []
+            self.conflicts = []
+        self._index_rooms()
+
+    def _recalculate_actors(self, changes: Mapping[str, Sequence[DailySchedule]]) -> Set[str]:
+        """Re-plan after some actors' blocks changed and return shifted actors.
+
+        ``changes`` maps each changed actor to the blocks it replaced. Travel
+        is re-annotated for those actors only, in one pass, and capacity
+        conflicts are re-checked only among blocks in the rooms their old and
+        new blocks use that overlap those blocks' time windows. Staggering can
+        push a block into a neighbour outside the window, so the window grows
+        to cover the shifted intervals and the pass repeats until no new block
+        is pulled in. Actors whose blocks get staggered have their travel
+        annotations refreshed.
+        """
+
+        travel_estimator = TravelEstimator(self.mapgrid, workers=self.travel_workers)
+        changed_plans = {actor_id: self.daily_plan.get(actor_id, []) for actor_id in changes}
+        travel_estimator.annotate(changed_plans, adjust_buffers=True)
+
+        windows: Dict[str, List[Tuple[int, int]]] = {}
+        for previous_blocks in changes.values():
+            for block in previous_blocks:
+                windows.setdefault(block.room_id, []).append(block.absolute_interval())
+                self.room_index.remove(block)
+        for new_blocks in changed_plans.values():
+            for block in new_blocks:
+                windows.setdefault(block.room_id, []).append(block.absolute_interval())
+                self.room_index.add(block)
+
+        affected_rooms = {room_id: self.mapgrid.rooms[room_id] for room_id in windows if room_id in self.mapgrid.rooms}
+        day_length = self.day_length_minutes
+
+        def _collect() -> List[DailySchedule]:
+            found: Dict[int, DailySchedule] = {}
+            for room_id in affected_rooms:
+                for start, end in windows[room_id]:
+                    for block in self.room_index.between(room_id, start, end):
+                        found.setdefault(id(block), block)
+            return list(found.values())
+
+        def _touched(record: ConflictRecord) -> bool:
+            if record.room not in affected_rooms:
+                return False
+            point = (record.start_tick, record.start_tick + 1)
+            return any(
+                _intervals_overlap(point, window, day_length)
+                for window in windows[record.room]
+            )
+
+        candidates = _collect()
+        self.conflicts = []
+        if not candidates:
+            self.detected_conflicts = [record for record in self.detected_conflicts if not _touched(record)]
+            return set()
+        detected = self._detect_conflicts(candidates, affected_rooms)
+        starts: Dict[int, int] = {}
+        while True:
+            for block in candidates:
+                starts.setdefault(id(block), block.start_tick)
+            self.conflicts.extend(self._resolve_conflicts(candidates, affected_rooms))
+            self.room_index.invalidate(affected_rooms)
+            for block in candidates:
+                if block.start_tick != starts[id(block)]:
+                    windows[block.room_id].append(block.absolute_interval())
+            widened = _collect()
+            if len(widened) == len(candidates):
+                break
+            candidates = widened
+
+        self.detected_conflicts = [record for record in self.detected_conflicts if not _touched(record)]
+        self.detected_conflicts.extend(detected)
+        shifted_actors = {
+            block.actor_id
+            for block in candidates
+            if block.start_tick != starts[id(block)]
+        }
+        if shifted_actors:
+            travel_estimator.annotate(
+                {name: self.daily_plan[name] for name in shifted_actors if name in self.daily_plan},
+                adjust_buffers=False,
+            )
+        return shifted_actors
+
+    def _detect_conflicts(self, blocks: Sequence[DailySchedule], rooms: Mapping[str, object]) -> List[ConflictRecord]:
+        """Capacity conflicts among ``blocks``, read from the store's columns when they are its rows."""
+
+        store = self.store
+        if all(isinstance(block, ScheduleRow) and block.store is store for block in blocks):
+            return detect_store_conflicts(store, rooms, [block.index for block in blocks])
+        return detect_room_capacity_conflicts(list(blocks), rooms)
+
+    def _resolve_conflicts(
+        self,
+        blocks: List[DailySchedule],
+        rooms: Mapping[str, object],
+    ) -> List[ConflictRecord]:
+        settings = self.conflict_resolution
+        if settings.strategy == "optimize":
+            return resolve_with_optimization(
+                blocks,
+                rooms,
+                actor_blocks=self._daily_plan,
+                time_budget_seconds=settings.time_budget_seconds,
+                max_passes=settings.max_passes,
+            )
+        return resolve_with_staggering(blocks, rooms, mode=settings.strategy)
+
+    def _index_rooms(self) -> None:
+        self.room_index = RoomIntervalIndex(self.day_length_minutes)
+        self.room_index.rebuild(block for blocks in self.daily_plan.values() for block in blocks)
+
+    def scheduled_in(self, room_id: str, start: int, end: int | None = None) -> List[DailySchedule]:
+        """Blocks planned in ``room_id`` at minute ``start`` or during ``[start, end)``."""
+
+        if end is None:
+            return self.room_index.at(room_id, start)
+        if end <= start:
+            end += self.day_length_minutes
+        return self.room_index.between(room_id, start, end)
+
+    def _rebuild_dispatch(self) -> None:
+        """Compile every NPC schedule into per-minute dispatch buckets.
+
+        ``_dispatch[minute]`` lists ``(npc index, activity)`` pairs whose slot
+        starts at that minute, so :meth:`update` only touches NPCs that have
+        something to start instead of scanning every schedule each tick.
+        """
+
+        self._dispatch: List[List[Tuple[int, ScheduledActivity]]] = [
+            [] for _ in range(self.day_length_minutes)
+        ]
+        self._dispatch_minutes: Dict[int, List[int]] = {}
+        self._npc_index: Dict[str, int] = {}
+        for index, npc in enumerate(self.npcs):
+            self._npc_index[npc.name] = index
+            self._index_npc(index)
+
+    def _index_npc(self, index: int) -> None:
+        for minute in self._dispatch_minutes.pop(index, []):
+            bucket = self._dispatch[minute]
+            bucket[:] = [entry for entry in bucket if entry[0] != index]
+        minutes: List[int] = []
+        for minute, activity in self.npcs[index].schedule:
+            self._dispatch[minute].append((index, activity))
+            if minute not in minutes:
+                minutes.append(minute)
+        self._dispatch_minutes[index] = minutes
+
+    def _build_schedule(self, blocks: List[DailySchedule]) -> List[Tuple[int, ScheduledActivity]]:
+        schedule: List[Tuple[int, ScheduledActivity]] = []
         for block in blocks:
             spec = self.activity_definitions.get(block.activity_id)
             duration = block.duration_minutes
@@ -354,8 +673,8 @@ class ScheduleSystem:
                 travel_buffer=block.travel_buffer,
                 profile=profile,
             )
-            schedule.append((format_minutes(block.start_tick), activity))
-        schedule.sort(key=lambda item: self._hhmm_to_minutes(item[0]))
+            schedule.append((block.start_tick % self.day_length_minutes, activity))
+        schedule.sort(key=lambda item: item[0])
         return schedule
 
     def _spawn_point(self, blocks: List[DailySchedule], role: str | None) -> Tuple[int, int]:
@@ -402,22 +721,34 @@ class ScheduleSystem:
     def default_spawn(self) -> Tuple[int, int]:
         return self._default_spawn
 
-    def update(self, hhmm: str) -> None:
-        for npc in self.npcs:
-            for time_str, activity in npc.schedule:
-                if time_str != hhmm:
-                    continue
-                if npc.pending_schedule is not None:
-                    continue
-                if npc.current_activity and npc.current_activity.name == activity.name:
-                    continue
-                start_minutes = self._hhmm_to_minutes(time_str)
-                npc.assign_activity(activity, start_minutes)
-                break
+    def subscribe_assignments(self, callback: Callable[[NPC], None]) -> None:
+        """Call ``callback(npc)`` whenever :meth:`update` hands an NPC its next block."""
+
+        self._assignment_listeners.append(callback)
+
+    def announce_assignment(self, npc: NPC) -> None:
+        """Notify assignment listeners about a block assigned outside :meth:`update`."""
 
-    def _hhmm_to_minutes(self, hhmm: str) -> int:
-        hours, minutes = map(int, hhmm.split(":"))
-        return (hours * 60 + minutes) % self.day_length_minutes
+        for listener in tuple(self._assignment_listeners):
+            listener(npc)
+
+    def update(self, minute: int) -> None:
+        start_minutes = minute % self.day_length_minutes
+        bucket = self._dispatch[start_minutes]
+        if not bucket:
+            return
+        assigned: set[int] = set()
+        for index, activity in bucket:
+            if index in assigned:
+                continue
+            npc = self.npcs[index]
+            if npc.pending_schedule is not None:
+                continue
+            if npc.current_activity and npc.current_activity.name == activity.name:
+                continue
+            npc.assign_activity(activity, start_minutes)
+            assigned.add(index)
+            self.announce_assignment(npc)
 
     def _minutes_to_hhmm(self, minutes: int) -> str:
         minutes %= self.day_length_minutes
@@ -444,25 +775,34 @@ class ScheduleSystem:
                     "notes",
                 ]
             )
-            for actor_id, blocks in sorted(self.daily_plan.items()):
-                for block in sorted(blocks, key=lambda item: item.start_tick):
-                    spec = self.activity_definitions.get(block.activity_id)
-                    duration = block.duration_minutes
-                    start_minutes = block.start_tick
-                    end_minutes = start_minutes + duration
-                    writer.writerow(
-                        [
-                            actor_id,
-                            format_minutes(start_minutes),
-                            format_minutes(end_minutes),
-                            block.slot,
-                            block.activity_id,
-                            block.room_id or (spec.location if spec else ""),
-                            block.expected_travel if block.expected_travel is not None else "",
-                            block.travel_buffer,
-                            block.notes or (spec.notes if spec else ""),
-                        ]
-                    )
+            store = self.store
+            actors = store.actors.values
+            activities = store.activities.values
+            rooms = store.rooms.values
+            slots = store.slots.values
+            order = sorted(
+                store.live_indices(),
+                key=lambda index: (actors[store.actor[index]], store.start[index]),
+            )
+            for index in order:
+                activity_id = activities[store.activity[index]]
+                spec = self.activity_definitions.get(activity_id)
+                start_minutes = store.start[index]
+                end_minutes = start_minutes + store.duration[index]
+                expected_travel = store.expected_travel[index]
+                writer.writerow(
+                    [
+                        actors[store.actor[index]],
+                        format_minutes(start_minutes),
+                        format_minutes(end_minutes),
+                        slots[store.slot[index]],
+                        activity_id,
+                        rooms[store.room[index]] or (spec.location if spec else ""),
+                        expected_travel if expected_travel >= 0 else "",
+                        store.buffer[index],
+                        store.notes.get(index) or (spec.notes if spec else ""),
+                    ]
+                )
 
     def _resolve_profile(self, activity_id: str) -> ActivityProfile | None:
         if self.activity_catalog is None:
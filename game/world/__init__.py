@@ -1,5 +1,6 @@
 """World-level helpers."""
 
+from .occupancy_recorder import OccupancyRecorder
 from .room_manager import RoomManager, RoomSnapshot
 
-__all__ = ["RoomManager", "RoomSnapshot"]
+__all__ = ["OccupancyRecorder", "RoomManager", "RoomSnapshot"]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import csv
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..core.time_clock import format_minutes
+
+if TYPE_CHECKING:
+    from .room_manager import RoomManager
+
+RESOLUTIONS = (1, 5, 15, 60)
+
+
+class OccupancyRecorder:
+    """Per-room occupancy time series in fixed-size ring buffers.
+
+    Every :meth:`sample` reads each room's occupant count once (via
+    :meth:`RoomManager.occupancy`, which does not allocate) for one simulated
+    minute. Minutes are folded into buckets of ``resolution_minutes``; each
+    bucket keeps the peak and the summed count, so averages stay exact after
+    downsampling. Storage is preallocated for ``history_minutes`` and the
+    oldest buckets are overwritten once it is full, which bounds memory for
+    semester-long runs.
+
+    Bucket stamps are absolute minutes since day 0, counted from
+    ``start_minute``.
+    """
+
+    def __init__(
+        self,
+        room_ids: Iterable[str],
+        *,
+        resolution_minutes: int = 1,
+        history_minutes: int = 24 * 60,
+        start_minute: int = 0,
+        day_length_minutes: int = 24 * 60,
+    ) -> None:
+        if resolution_minutes not in RESOLUTIONS:
+            raise ValueError(f"resolution_minutes must be one of {RESOLUTIONS}")
+        self.rooms: Tuple[str, ...] = tuple(sorted(room_ids))
+        self.resolution_minutes = resolution_minutes
+        self.day_length_minutes = day_length_minutes
+        self.capacity = max(1, -(-history_minutes // resolution_minutes))
+        self._room_index = {room_id: index for index, room_id in enumerate(self.rooms)}
+        cells = self.capacity * len(self.rooms)
+        self._peak = array("I", bytes(4 * cells))
+        self._total = array("I", bytes(4 * cells))
+        self._samples = array("H", bytes(2 * self.capacity))
+        self._minute = start_minute
+        self._first_bucket = start_minute // resolution_minutes
+        self._last_bucket: Optional[int] = None
+
+    @property
+    def minute(self) -> int:
+        """Absolute minute the next :meth:`sample` will be recorded at."""
+
+        return self._minute
+
+    def sample(self, room_manager: "RoomManager") -> None:
+        bucket = self._minute // self.resolution_minutes
+        slot = bucket % self.capacity
+        if bucket != self._last_bucket:
+            self._open(bucket, slot)
+        width = len(self.rooms)
+        base = slot * width
+        peak = self._peak
+        total = self._total
+        for offset, room_id in enumerate(self.rooms):
+            count = room_manager.occupancy(room_id)
+            cell = base + offset
+            total[cell] += count
+            if count > peak[cell]:
+                peak[cell] = count
+        self._samples[slot] += 1
+        self._minute += 1
+
+    def buckets(self) -> range:
+        """Absolute bucket numbers currently held, oldest first."""
+
+        if self._last_bucket is None:
+            return range(0)
+        return range(max(self._first_bucket, self._last_bucket - self.capacity + 1), self._last_bucket + 1)
+
+    def series(self, room_id: str) -> List[Tuple[int, int, float]]:
+        """``(bucket start minute, peak, average)`` for every held bucket."""
+
+        return list(self._window(room_id, None, None))
+
+    def peak(self, room_id: str, start: int | None = None, end: int | None = None) -> Tuple[int, Optional[int]]:
+        """Highest occupancy in ``[start, end)`` and the bucket minute it first occurred."""
+
+        best, when = 0, None
+        for minute, value, _ in self._window(room_id, start, end):
+            if when is None or value > best:
+                best, when = value, minute
+        return best, when
+
+    def average(self, room_id: str, start: int | None = None, end: int | None = None) -> float:
+        """Mean occupancy per sampled minute in ``[start, end)``."""
+
+        column = self._column(room_id)
+        width = len(self.rooms)
+        total = samples = 0
+        for bucket in self._window_buckets(start, end):
+            slot = bucket % self.capacity
+            total += self._total[slot * width + column]
+            samples += self._samples[slot]
+        return total / samples if samples else 0.0
+
+    def peaks(self, start: int | None = None, end: int | None = None) -> Dict[str, Tuple[int, Optional[int]]]:
+        return {room_id: self.peak(room_id, start, end) for room_id in self.rooms}
+
+    def to_csv(self, path: str | Path) -> Path:
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["minute", "day", "time", "room", "peak", "average"])
+            for room_id in self.rooms:
+                for minute, peak, average in self.series(room_id):
+                    day, minute_of_day = divmod(minute, self.day_length_minutes)
+                    writer.writerow([minute, day, format_minutes(minute_of_day), room_id, peak, f"{average:.3f}"])
+        return output
+
+    def to_npz(self, path: str | Path) -> Path:
+        """Write ``minutes``, ``rooms``, ``peak`` and ``average`` arrays (requires numpy)."""
+
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise ImportError("NPZ export requires numpy; use to_csv() instead") from exc
+        buckets = list(self.buckets())
+        slots = [bucket % self.capacity for bucket in buckets]
+        width = len(self.rooms)
+        peak = np.frombuffer(self._peak, dtype=np.uint32).reshape(self.capacity, width)[slots]
+        total = np.frombuffer(self._total, dtype=np.uint32).reshape(self.capacity, width)[slots]
+        samples = np.frombuffer(self._samples, dtype=np.uint16)[slots].reshape(-1, 1)
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            output,
+            minutes=np.array([bucket * self.resolution_minutes for bucket in buckets], dtype=np.int64),
+            rooms=np.array(self.rooms),
+            peak=peak,
+            average=total / np.maximum(samples, 1),
+        )
+        return output
+
+    def _open(self, bucket: int, slot: int) -> None:
+        width = len(self.rooms)
+        base = slot * width
+        for cell in range(base, base + width):
+            self._peak[cell] = 0
+            self._total[cell] = 0
+        self._samples[slot] = 0
+        self._last_bucket = bucket
+
+    def _column(self, room_id: str) -> int:
+        try:
+            return self._room_index[room_id]
+        except KeyError:
+            raise KeyError(f"Room '{room_id}' is not recorded") from None
+
+    def _window_buckets(self, start: int | None, end: int | None) -> Sequence[int]:
+        held = self.buckets()
+        if not held:
+            return held
+        first = held.start if start is None else max(held.start, start // self.resolution_minutes)
+        last = held.stop if end is None else min(held.stop, -(-end // self.resolution_minutes))
+        return range(first, max(first, last))
+
+    def _window(self, room_id: str, start: int | None, end: int | None) -> Iterable[Tuple[int, int, float]]:
+        column = self._column(room_id)
+        width = len(self.rooms)
+        for bucket in self._window_buckets(start, end):
+            slot = bucket % self.capacity
+            cell = slot * width + column
+            yield bucket * self.resolution_minutes, self._peak[cell], self._total[cell] / self._samples[slot]
+
+
+__all__ = ["OccupancyRecorder", "RESOLUTIONS"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Iterable, List, Mapping, MutableMapping, Set
+from typing import AbstractSet, Callable, Dict, Iterable, List, Mapping, MutableMapping, Set
 
 from ..core.map import MapGrid
 from ..simulation.activities import Activity
@@ -25,13 +25,31 @@ class RoomSnapshot:
 
 
 class RoomManager:
-    """Tracks room occupancy and active activities."""
+    """Tracks room occupancy and active activities.
+
+    Mutations only mark a room dirty. Subscribers receive one coalesced
+    :class:`RoomSnapshot` per dirty room when :meth:`flush_notifications`
+    runs (the simulation calls it once at the end of every tick), and rooms
+    nobody subscribed to never build a snapshot at all.
+
+    Occupant and per-label activity counts, and the set of rooms above their
+    declared capacity, are maintained on every enter, exit, start and end, so
+    :meth:`occupancy` and :meth:`over_capacity` answer without scanning.
+    """
 
     def __init__(self, grid: MapGrid) -> None:
         self._grid = grid
         self._occupants: MutableMapping[str, Set[str]] = defaultdict(set)
         self._activities: MutableMapping[str, Dict[str, Activity]] = defaultdict(dict)
         self._subscribers: MutableMapping[str, List[Callable[[RoomSnapshot], None]]] = defaultdict(list)
+        self._changed_rooms: Set[str] = set()
+        self._dirty_rooms: Set[str] = set()
+        self._label_counts: Dict[str, Dict[str, int]] = {}
+        self._capacities: Dict[str, int] = {
+            name: room.capacity for name, room in grid.rooms.items() if room.capacity is not None
+        }
+        self._over_capacity: Set[str] = set()
+        self._present: Dict[str, str] = {}
 
     def subscribe(self, room_id: str, callback: Callable[[RoomSnapshot], None]) -> None:
         self._subscribers[room_id].append(callback)
@@ -45,9 +63,12 @@ class RoomManager:
         if room_id not in self._grid.rooms:
             return
         self._occupants[room_id].add(npc_name)
+        self._present[npc_name] = room_id
         self._notify(room_id)
 
     def track_exit(self, npc_name: str, room_id: str) -> None:
+        if self._present.get(npc_name) == room_id:
+            del self._present[npc_name]
         occupants = self._occupants.get(room_id)
         if not occupants:
             return
@@ -55,7 +76,7 @@ class RoomManager:
             occupants.remove(npc_name)
             if not occupants:
                 self._occupants.pop(room_id, None)
-        self._activities.get(room_id, {}).pop(npc_name, None)
+        self._drop_activity(room_id, npc_name)
         self._notify(room_id)
 
     def start_activity(self, npc_name: str, activity: Activity) -> None:
@@ -63,7 +84,7 @@ class RoomManager:
         if room_id not in self._grid.rooms:
             return
         self._occupants[room_id].add(npc_name)
-        self._activities[room_id][npc_name] = activity
+        self._set_activity(room_id, npc_name, activity)
         self._notify(room_id)
 
     def update_activity(self, npc_name: str, activity: Activity) -> None:
@@ -72,40 +93,115 @@ class RoomManager:
             return
         if npc_name not in self._occupants.get(room_id, set()):
             self._occupants[room_id].add(npc_name)
-        self._activities[room_id][npc_name] = activity
+        self._set_activity(room_id, npc_name, activity)
         self._notify(room_id)
 
     def end_activity(self, npc_name: str, activity: Activity) -> None:
         room_id = activity.room_id
         if room_id not in self._grid.rooms:
             return
-        self._activities.get(room_id, {}).pop(npc_name, None)
+        self._drop_activity(room_id, npc_name)
         occupants = self._occupants.get(room_id)
-        if occupants and npc_name in occupants:
+        # Someone tracked as physically present stays an occupant until they walk out.
+        if occupants and npc_name in occupants and self._present.get(npc_name) != room_id:
             occupants.remove(npc_name)
             if not occupants:
                 self._occupants.pop(room_id, None)
         self._notify(room_id)
 
+    def occupancy(self, room_id: str) -> int:
+        occupants = self._occupants.get(room_id)
+        return len(occupants) if occupants else 0
+
+    def activity_count(self, room_id: str, label: str) -> int:
+        return self._label_counts.get(room_id, {}).get(label, 0)
+
+    def over_capacity(self) -> AbstractSet[str]:
+        """Rooms currently above their declared capacity (a live, read-only view)."""
+
+        return self._over_capacity
+
+    def location_of(self, npc_name: str) -> str | None:
+        """Room the NPC was last tracked entering, if they have not left it."""
+
+        return self._present.get(npc_name)
+
+    def occupants(self, room_id: str) -> List[str]:
+        return sorted(self._occupants.get(room_id, ()))
+
     def snapshot(self, room_id: str) -> RoomSnapshot:
         occupants = set(self._occupants.get(room_id, set()))
         active = self._activities.get(room_id, {})
-        counts: Dict[str, int] = defaultdict(int)
         state: Dict[str, Mapping[str, object]] = {}
         for npc, activity in active.items():
-            counts[activity.label] += 1
             state[npc] = {
                 "label": activity.label,
                 "status": activity.state.status,
                 "metadata": dict(activity.state.metadata),
             }
-        return RoomSnapshot(room_id=room_id, occupants=occupants, activity_counts=dict(counts), activity_state=state)
+        counts = dict(self._label_counts.get(room_id, {}))
+        return RoomSnapshot(room_id=room_id, occupants=occupants, activity_counts=counts, activity_state=state)
 
     def iter_snapshots(self) -> Iterable[RoomSnapshot]:
         for room_id in sorted(self._grid.rooms):
             yield self.snapshot(room_id)
 
+    def drain_changes(self) -> Set[str]:
+        """Return the rooms mutated since the previous call and reset the set."""
+
+        changed = self._changed_rooms
+        self._changed_rooms = set()
+        return changed
+
+    def flush_notifications(self) -> int:
+        """Deliver one snapshot per dirty, subscribed room and return how many were sent."""
+
+        if not self._dirty_rooms:
+            return 0
+        dirty = self._dirty_rooms
+        self._dirty_rooms = set()
+        delivered = 0
+        for room_id in sorted(dirty):
+            callbacks = list(self._subscribers.get(room_id, ()))
+            if not callbacks:
+                continue
+            snapshot = self.snapshot(room_id)
+            for callback in callbacks:
+                callback(snapshot)
+            delivered += 1
+        return delivered
+
+    def _set_activity(self, room_id: str, npc_name: str, activity: Activity) -> None:
+        activities = self._activities[room_id]
+        previous = activities.get(npc_name)
+        if previous is not None:
+            self._count_label(room_id, previous.label, -1)
+        activities[npc_name] = activity
+        self._count_label(room_id, activity.label, 1)
+
+    def _drop_activity(self, room_id: str, npc_name: str) -> None:
+        activities = self._activities.get(room_id)
+        if not activities:
+            return
+        previous = activities.pop(npc_name, None)
+        if previous is not None:
+            self._count_label(room_id, previous.label, -1)
+
+    def _count_label(self, room_id: str, label: str, delta: int) -> None:
+        counts = self._label_counts.setdefault(room_id, {})
+        value = counts.get(label, 0) + delta
+        if value > 0:
+            counts[label] = value
+        else:
+            counts.pop(label, None)
+
     def _notify(self, room_id: str) -> None:
-        snapshot = self.snapshot(room_id)
-        for callback in self._subscribers.get(room_id, []):
-            callback(snapshot)
+        capacity = self._capacities.get(room_id)
+        if capacity is not None:
+            if self.occupancy(room_id) > capacity:
+                self._over_capacity.add(room_id)
+            else:
+                self._over_capacity.discard(room_id)
+        self._changed_rooms.add(room_id)
+        if self._subscribers.get(room_id):
+            self._dirty_rooms.add(room_id)
@@ -0,0 +1,72 @@
+"""Time room-capacity conflict detection on a synthetic school.
+
+Usage: python scripts/benchmark_conflicts.py [--blocks 10000] [--rooms 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from game.core.map import Room  # noqa: E402
+from game.simulation.conflict_resolver import detect_room_capacity_conflicts  # noqa: E402
+from game.simulation.schedule_generator import DailySchedule  # noqa: E402
+
+
+def synthetic_school(blocks: int, rooms: int, *, seed: int = 1337):
+    rng = random.Random(seed)
+    room_metadata = {
+        f"Room_{index:02d}": Room(
+            name=f"Room_{index:02d}",
+            rect=(0, 0, 4, 4),
+            doors=((0, 0),),
+            room_type="Benchmark",
+            capacity=rng.randint(10, 40),
+        )
+        for index in range(rooms)
+    }
+    names = list(room_metadata)
+    schedules = [
+        DailySchedule(
+            actor_id=f"Student_{index // 6:05d}",
+            slot=f"slot_{index % 6}",
+            activity_id="class",
+            room_id=rng.choice(names),
+            start_tick=rng.randrange(7 * 60, 18 * 60, 5),
+            duration_minutes=rng.choice((30, 45, 60, 90)),
+            day_length_minutes=1440,
+        )
+        for index in range(blocks)
+    ]
+    return schedules, room_metadata
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=10_000)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    schedules, rooms = synthetic_school(args.blocks, args.rooms)
+    timings = []
+    conflicts = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        conflicts = detect_room_capacity_conflicts(schedules, rooms)
+        timings.append(time.perf_counter() - started)
+    print(
+        f"{args.blocks} blocks / {args.rooms} rooms: {len(conflicts)} conflicts, "
+        f"best {min(timings) * 1000:.1f} ms over {args.repeat} runs"
+    )
+
+
+if __name__ == "__main__":
+    main()
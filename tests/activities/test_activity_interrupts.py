@@ -1,5 +1,4 @@
 from game.actors.base_actor import NPCState
-from game.simulation import _hhmm_to_minutes
 
 
 def test_activity_interrupt_clears_room_state(simulation) -> None:
@@ -8,8 +7,7 @@ def test_activity_interrupt_clears_room_state(simulation) -> None:
 
     block_entry = next((entry for entry in npc.schedule if entry[1].location), None)
     assert block_entry is not None
-    start_time, scheduled = block_entry
-    start_minutes = _hhmm_to_minutes(start_time)
+    start_minutes, scheduled = block_entry
 
     simulation.event_logger.clear()
     npc.assign_activity(scheduled, start_minutes)
@@ -33,7 +31,10 @@ def test_activity_interrupt_clears_room_state(simulation) -> None:
 
     assert npc.current_activity is None
     updated = simulation.room_manager.snapshot(scheduled.location)
-    assert npc.name not in updated.occupants
+    assert npc.name not in updated.activity_state
+    # Occupancy now follows movement: an NPC who is still standing in the room stays counted.
+    present = simulation.room_manager.location_of(npc.name) == scheduled.location
+    assert (npc.name in updated.occupants) == present
 
     events = list(simulation.event_logger.iter_events())
     assert any(event.kind == 'activity_interrupt' and event.npc == npc.name for event in events)
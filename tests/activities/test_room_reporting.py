@@ -1,6 +1,6 @@
 from game.core.map import MapGrid
 from game.simulation.activities import ActivityCatalog, ActivityFactory
-from game.world import RoomManager
+from game.world import OccupancyRecorder, RoomManager
 
 
 def test_room_manager_tracks_activity_counts():
@@ -34,3 +34,90 @@ def test_room_manager_tracks_activity_counts():
     finished = room_manager.snapshot('Cafeteria')
     assert finished.activity_counts == {}
     assert not finished.occupants
+
+
+def test_room_notifications_are_coalesced_and_skip_unobserved_rooms(monkeypatch):
+    grid = MapGrid('data/campus_map_v1.json')
+    catalog = ActivityCatalog.load('config/activities.yaml')
+    room_manager = RoomManager(grid)
+    received = []
+    room_manager.subscribe('Cafeteria', received.append)
+    received.clear()
+
+    built = []
+    original_snapshot = room_manager.snapshot
+
+    def _counting_snapshot(room_id):
+        built.append(room_id)
+        return original_snapshot(room_id)
+
+    monkeypatch.setattr(room_manager, 'snapshot', _counting_snapshot)
+
+    breakfast = ActivityFactory.create(catalog.resolve('breakfast'), room_id='Cafeteria', duration=30)
+    sleep = ActivityFactory.create(catalog.resolve('Sleeping'), room_id='Dorm_North', duration=480)
+    room_manager.start_activity('Alice', breakfast)
+    room_manager.start_activity('Bob', sleep)
+    breakfast.tick(10)
+    room_manager.update_activity('Alice', breakfast)
+    room_manager.track_entry('Carol', 'Cafeteria')
+    assert received == [] and built == []
+
+    assert room_manager.flush_notifications() == 1
+    assert built == ['Cafeteria']
+    assert [snapshot.occupants for snapshot in received] == [{'Alice', 'Carol'}]
+    assert room_manager.flush_notifications() == 0
+    assert room_manager.drain_changes() == {'Cafeteria', 'Dorm_North'}
+
+
+def test_room_counters_follow_entries_exits_and_activities():
+    grid = MapGrid('data/campus_map_v1.json')
+    catalog = ActivityCatalog.load('config/activities.yaml')
+    room_manager = RoomManager(grid)
+    capacity = grid.rooms['Counseling'].capacity
+
+    for index in range(capacity):
+        room_manager.track_entry(f'Student{index}', 'Counseling')
+    assert room_manager.occupancy('Counseling') == capacity
+    assert not room_manager.over_capacity()
+
+    session = ActivityFactory.create(catalog.resolve('study'), room_id='Counseling', duration=30)
+    room_manager.start_activity('Late', session)
+    assert room_manager.over_capacity() == {'Counseling'}
+    assert room_manager.activity_count('Counseling', session.label) == 1
+    assert room_manager.snapshot('Counseling').activity_counts == {session.label: 1}
+
+    room_manager.track_exit('Late', 'Counseling')
+    assert room_manager.activity_count('Counseling', session.label) == 0
+    assert not room_manager.over_capacity()
+    assert room_manager.occupancy('Counseling') == capacity
+    assert room_manager.occupancy('Library') == 0
+
+
+def test_occupancy_recorder_downsamples_into_a_bounded_ring(tmp_path):
+    grid = MapGrid('data/campus_map_v1.json')
+    room_manager = RoomManager(grid)
+    recorder = OccupancyRecorder(grid.rooms, resolution_minutes=5, history_minutes=15, start_minute=8 * 60)
+
+    for minute in range(20):
+        if minute in (1, 6):
+            room_manager.track_entry(f'Student{minute}', 'Library')
+        if minute == 12:
+            room_manager.track_entry('Crowd0', 'Library')
+            room_manager.track_entry('Crowd1', 'Library')
+        if minute == 13:
+            room_manager.track_exit('Crowd0', 'Library')
+            room_manager.track_exit('Crowd1', 'Library')
+        recorder.sample(room_manager)
+
+    # Four five-minute buckets were filled but only the newest three are kept.
+    assert [row[0] for row in recorder.series('Library')] == [485, 490, 495]
+    assert recorder.series('Library')[0] == (485, 2, 1.8)
+    assert recorder.peak('Library') == (4, 490)
+    assert recorder.average('Library', 490, 495) == (2 + 2 + 4 + 2 + 2) / 5
+    assert recorder.average('Library') == (9 + 12 + 10) / 15
+    assert recorder.peak('Cafeteria') == (0, 485)
+
+    csv_path = recorder.to_csv(tmp_path / 'occupancy.csv')
+    lines = csv_path.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'minute,day,time,room,peak,average'
+    assert '490,0,08:10,Library,4,2.400' in lines
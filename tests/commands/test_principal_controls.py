@@ -26,7 +26,8 @@ def test_override_during_curfew_triggers_alert(simulation) -> None:
     npc.current_activity = None
     npc.x, npc.y = simulation.grid.room_center('Library')
 
-    simulation._check_curfew(npc, 23 * 60 + 30)
+    (rule,) = simulation.alert_rules.rules_of('curfew')
+    rule.check(npc, 23 * 60 + 30)
     alerts = simulation.alert_bus.active_alerts()
     assert any(alert.category == 'CurfewViolation' for alert in alerts)
 
@@ -91,3 +92,57 @@ def test_command_dispatcher_rejects_unknown(simulation) -> None:
         pass
     else:
         raise AssertionError('CommandError not raised')
+
+
+def test_schedule_who_tracks_overrides(simulation) -> None:
+    controls = PrincipalControls(simulation)
+    dispatcher = CommandDispatcher(controls)
+    controls.override_schedule(
+        'Alice',
+        [{'start': '23:30', 'activity': 'study', 'room': 'Library', 'duration': '01:00'}],
+    )
+
+    assert [block.actor_id for block in controls.scheduled_in('Library', '00:15')] == ['Alice']
+    assert 'Alice' in dispatcher.execute('schedule who Library 23:00 23:45').message
+    assert 'Alice' not in dispatcher.execute('schedule who Library 01:00').message
+
+    controls.override_schedule(
+        'Alice',
+        [{'start': '10:00', 'activity': 'study', 'room': 'Counseling', 'duration': '00:30'}],
+    )
+    assert 'Alice' not in dispatcher.execute('schedule who Library 23:00 01:00').message
+    assert 'Alice' in dispatcher.execute('schedule who Counseling 10:10').message
+
+
+def test_override_group_replans_once_and_is_atomic(simulation, monkeypatch) -> None:
+    controls = PrincipalControls(simulation)
+    dispatcher = CommandDispatcher(controls)
+    schedule_system = simulation.schedule_system
+    names = [npc.name for npc in simulation.npcs][:4]
+    passes = []
+    original = schedule_system._recalculate_actors
+
+    def _recording(changes):
+        passes.append(sorted(changes))
+        return original(changes)
+
+    monkeypatch.setattr(schedule_system, '_recalculate_actors', _recording)
+
+    result = dispatcher.execute(
+        f"schedule override-group {','.join(names)} start=14:00 activity=study room=Counseling duration=01:00"
+    )
+    assert f'{len(names)} NPC(s)' in result.message
+    assert passes == [sorted(names)]
+    starts = sorted(schedule_system.daily_plan[name][0].start_tick for name in names)
+    assert starts[:3] == [14 * 60] * 3 and starts[3] >= 15 * 60
+    assert [record.npc_id for record in controls.recent_overrides(len(names))] == names
+
+    before = {name: list(schedule_system.daily_plan[name]) for name in names}
+    try:
+        dispatcher.execute(f'schedule override-group {names[0]},Nobody start=09:00 activity=study room=Library')
+    except CommandError:
+        pass
+    else:
+        raise AssertionError('CommandError not raised')
+    assert passes == [sorted(names)]
+    assert {name: schedule_system.daily_plan[name] for name in names} == before
@@ -1,4 +1,4 @@
-from game.simulation import _hhmm_to_minutes
+from game.actors.base_actor import NPCState
 
 
 def test_missed_class_alert(simulation) -> None:
@@ -6,31 +6,66 @@ def test_missed_class_alert(simulation) -> None:
     npc = simulation.get_npc('Alice')
     assert npc is not None
     target_block = None
-    start_hhmm = None
-    for hhmm, activity in npc.schedule:
+    start_minutes = None
+    for minute, activity in npc.schedule:
         if activity.name == 'class':
             target_block = activity
-            start_hhmm = hhmm
+            start_minutes = minute
             break
     assert target_block is not None
-    start_minutes = _hhmm_to_minutes(start_hhmm)
     npc.assign_activity(target_block, start_minutes)
     npc.pending_activity_start_minutes = start_minutes
     npc.pending_destination = None
     npc.x, npc.y = 0, 0
     current = (start_minutes + 40) % simulation.clock.day_length_minutes
-    simulation._check_missed_class(npc, current)
+    (rule,) = simulation.alert_rules.rules_of('missed_activity')
+    rule.check(npc, current)
     alerts = simulation.alert_bus.active_alerts()
     assert any(alert.category == 'MissedClass' for alert in alerts)
 
 
+def test_missed_class_check_waits_for_its_deadline(simulation) -> None:
+    simulation.alert_bus.clear()
+    npc = simulation.get_npc('Alice')
+    assert npc is not None
+    start_minutes, block = next((minute, activity) for minute, activity in npc.schedule if activity.name == 'class')
+    deadline = start_minutes + 10 + (block.travel_buffer or 0) + 1
+    simulation.clock.minute = start_minutes
+    npc.assign_activity(block, start_minutes)
+    (rule,) = simulation.alert_rules.rules_of('missed_activity')
+    rule.watch(npc)
+    npc.x, npc.y = 0, 0
+
+    checked = []
+    original = rule.check
+    rule.check = lambda *args: checked.append(args[1]) or original(*args)
+    for minute in range(start_minutes, deadline):
+        simulation._evaluate_alerts(minute)
+    assert checked == []
+    simulation._evaluate_alerts(deadline)
+    simulation._evaluate_alerts(deadline + 1)
+    assert checked == [deadline, deadline + 1]
+    assert [alert.category for alert in simulation.alert_bus.active_alerts()].count('MissedClass') == 1
+
+    npc.x, npc.y = simulation.grid.room_center(block.location)
+    npc.target = None
+    npc.state = NPCState.IDLE
+    simulation.activity_system.start_if_ready(
+        npc, current_minutes=deadline + 2, day_length_minutes=simulation.clock.day_length_minutes
+    )
+    assert npc.name not in rule.pending
+    simulation._evaluate_alerts(deadline + 3)
+    assert checked == [deadline, deadline + 1]
+
+
 def test_curfew_violation_alert(simulation) -> None:
     simulation.alert_bus.clear()
     npc = simulation.get_npc('Alice')
     assert npc is not None
     npc.current_activity = None
     npc.x, npc.y = 0, 0
-    simulation._check_curfew(npc, 23 * 60)
+    (rule,) = simulation.alert_rules.rules_of('curfew')
+    rule.check(npc, 23 * 60)
     alerts = simulation.alert_bus.active_alerts()
     assert any(alert.category == 'CurfewViolation' for alert in alerts)
 
@@ -40,6 +75,132 @@ def test_overcapacity_alert(simulation) -> None:
     crowded_room = next(room for room in simulation.grid.rooms.values() if room.capacity and room.capacity <= 6)
     for idx in range(crowded_room.capacity + 1):
         simulation.room_manager.track_entry(f'TestNPC{idx}', crowded_room.name)
-    simulation._evaluate_capacity_alerts(480)
+    (rule,) = simulation.alert_rules.rules_of('room_capacity')
+    rule.evaluate(480)
     alerts = simulation.alert_bus.active_alerts()
     assert any(alert.category == 'Overcapacity' for alert in alerts)
+
+
+def test_curfew_violators_follow_boundaries_rooms_and_activities(simulation) -> None:
+    from game.core.pathfinding import astar
+    from game.systems.schedule_system import ScheduledActivity
+
+    simulation.alert_bus.clear()
+    npc = simulation.get_npc('Alice')
+    assert npc is not None
+    simulation.activity_system.interrupt(npc, current_minutes=21 * 60)
+    npc.pending_schedule = None
+    npc.target = None
+    npc.x, npc.y = simulation.grid.room_center('Library')
+    (rule,) = simulation.alert_rules.rules_of('curfew')
+
+    simulation._evaluate_alerts(21 * 60 + 59)
+    assert 'Alice' not in rule.violators
+    simulation._evaluate_alerts(22 * 60)
+    assert 'Alice' in rule.violators
+
+    sleep = ScheduledActivity(
+        name='Sleeping',
+        duration=60,
+        location='Library',
+        profile=simulation.activity_catalog.resolve('Sleeping'),
+    )
+    npc.assign_activity(sleep, 22 * 60)
+    npc.state = NPCState.IDLE
+    simulation.activity_system.start_if_ready(npc, current_minutes=22 * 60, day_length_minutes=1440)
+    assert 'Alice' not in rule.violators
+    simulation.activity_system.interrupt(npc, current_minutes=22 * 60 + 5)
+    assert 'Alice' in rule.violators
+
+    dorm = simulation.grid.room_center('Dorm_North')
+    path = astar(simulation.grid, (npc.x, npc.y), dorm)
+    npc.target = dorm
+    npc.path = list(path[1:])
+    simulation.movement_system.step(npc, steps=len(path))
+    assert 'Alice' not in rule.violators
+
+    simulation._evaluate_alerts(6 * 60)
+    assert not rule.violators
+    alerts = [alert for alert in simulation.alert_bus.active_alerts() if alert.npc_ids == ('Alice',)]
+    assert [alert.category for alert in alerts] == ['CurfewViolation']
+
+
+def test_curfew_publishes_on_entry_then_once_per_cooldown(simulation) -> None:
+    simulation.alert_bus.clear()
+    npc = simulation.get_npc('Alice')
+    assert npc is not None
+    simulation.activity_system.interrupt(npc, current_minutes=21 * 60)
+    npc.pending_schedule = None
+    npc.target = None
+    npc.x, npc.y = simulation.grid.room_center('Library')
+    (rule,) = simulation.alert_rules.rules_of('curfew')
+    cooldown = simulation.alert_bus.cooldown_minutes
+    published = []
+    original = rule.publish
+
+    def _record(minute, **kwargs):
+        if kwargs['npc_ids'] == ['Alice']:
+            published.append((minute, kwargs['room_id']))
+        original(minute, **kwargs)
+
+    rule.publish = _record
+    start = 22 * 60
+    for minute in range(start, start + 2 * cooldown + 5):
+        simulation._evaluate_alerts(minute)
+    assert published == [(start, 'Library'), (start + cooldown, 'Library'), (start + 2 * cooldown, 'Library')]
+
+    simulation.movement_system._relocate(npc, simulation.grid.room_center('Courtyard'))
+    simulation._evaluate_alerts(start + 2 * cooldown + 5)
+    assert published[-1] == (start + 2 * cooldown + 5, 'Courtyard')
+    rooms = [alert.room_id for alert in simulation.alert_bus.active_alerts() if alert.npc_ids == ('Alice',)]
+    assert rooms == ['Library', 'Library', 'Library', 'Courtyard']
+
+
+def test_alert_rules_apply_filters_thresholds_and_report_costs(simulation) -> None:
+    import pytest
+
+    from game.simulation.alert_rules import AlertRuleEngine
+
+    engine = AlertRuleEngine.from_config(
+        {
+            'rules': [
+                {
+                    'name': 'crowded_offices',
+                    'kind': 'room_capacity',
+                    'category': 'OfficeCrowding',
+                    'severity': 'low',
+                    'room_types': ['Office'],
+                    'threshold': 1,
+                },
+            ]
+        }
+    )
+    engine.bind(simulation)
+    simulation.alert_bus.clear()
+    for idx in range(5):
+        simulation.room_manager.track_entry(f'Visitor{idx}', 'Counseling')
+        simulation.room_manager.track_entry(f'Infirmary{idx}', 'Infirmary')
+    engine.evaluate(9 * 60)
+    assert [(alert.category, alert.room_id, alert.severity) for alert in simulation.alert_bus.active_alerts()] == [
+        ('OfficeCrowding', 'Counseling', 'low')
+    ]
+    simulation.room_manager.track_exit('Visitor0', 'Counseling')
+    simulation.room_manager.track_exit('Visitor1', 'Counseling')
+    engine.evaluate(9 * 60 + 30)
+
+    (row,) = engine.report()
+    assert row['rule'] == 'crowded_offices'
+    assert (row['evaluations'], row['fired']) == (2, 1)
+    assert row['seconds'] > 0
+
+    def _single(kind, **extra):
+        return AlertRuleEngine.from_config({'rules': [{'name': 'x', 'kind': kind, 'category': 'X', **extra}]})
+
+    with pytest.raises(ValueError, match='unknown kind'):
+        _single('bogus')
+    with pytest.raises(ValueError, match='does not support room_types'):
+        _single('curfew', room_types=['Lab'])
+    with pytest.raises(ValueError, match='does not support roles'):
+        _single('room_capacity', roles=['student'])
+    with pytest.raises(ValueError, match='unknown parameter.*grace_minute'):
+        _single('missed_activity', grace_minute=5)
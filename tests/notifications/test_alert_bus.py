@@ -80,3 +80,161 @@ def test_acknowledged_alert_respects_cooldown_and_persists_history() -> None:
     assert len(history) == 2
     assert history[0].id == first.id
     assert history[1].id == later.id
+
+
+def test_history_is_bounded_and_keeps_unacknowledged_alerts() -> None:
+    bus = AlertBus(cooldown_minutes=10, history_limit=2)
+    first = bus.publish('MissedClass', minute_stamp=0, severity='low', message='a', npc_ids=['Alice'])
+    bus.acknowledge(first.id, minute_stamp=1)
+    pending = bus.publish('Overcapacity', minute_stamp=1, severity='high', message='b', room_id='Library')
+    bus.publish('MissedClass', minute_stamp=2, severity='low', message='c', npc_ids=['Bea'])
+    latest = bus.publish('CurfewViolation', minute_stamp=3, severity='medium', message='d', npc_ids=['Cy'])
+
+    assert [alert.message for alert in bus.iter_history()] == ['c', 'd']
+    assert bus.get(first.id) is None
+    # Still unacknowledged, so it stays visible after leaving the history.
+    assert [alert.id for alert in bus.active_alerts()][0] == pending.id
+    assert bus.latest_by_category('MissedClass').message == 'c'
+    assert bus.latest_by_category('Overcapacity') is None
+    assert bus.latest_by_category('CurfewViolation') is latest
+
+    bus.acknowledge(pending.id, minute_stamp=4)
+    assert bus.get(pending.id) is None
+    assert pending.id not in {alert.id for alert in bus.active_alerts()}
+    # Leaving the history does not end the cooldown.
+    assert bus.publish('Overcapacity', minute_stamp=5, severity='high', message='e', room_id='Library') is pending
+    again = bus.publish('Overcapacity', minute_stamp=11, severity='high', message='e', room_id='Library')
+    assert again.id != pending.id
+
+
+def test_cooldowns_outlive_history_eviction_and_expire_by_time() -> None:
+    bus = AlertBus(cooldown_minutes=10, history_limit=3)
+    burst = [
+        bus.publish('CurfewViolation', minute_stamp=0, severity='medium', message=name, npc_ids=[name])
+        for name in ('Ada', 'Bo', 'Cy', 'Di', 'Ed', 'Flo')
+    ]
+    assert len(list(bus.iter_history())) == 3
+
+    repeats = [
+        bus.publish('CurfewViolation', minute_stamp=5, severity='medium', message='again', npc_ids=[alert.npc_ids[0]])
+        for alert in burst
+    ]
+    assert [alert.id for alert in repeats] == [alert.id for alert in burst]
+    assert len(list(bus.iter_history())) == 3
+
+    bus.publish('CurfewViolation', minute_stamp=10, severity='medium', message='Ada', npc_ids=['Ada'])
+    assert len(bus._cooldowns) == 1
+
+
+def test_async_subscribers_are_queued_with_backpressure() -> None:
+    import threading
+
+    gate, started = threading.Event(), threading.Event()
+    delivered, inline = [], []
+
+    def _slow(alert):  # type: ignore[no-redef]
+        started.set()
+        gate.wait(5)
+        delivered.append(alert.message)
+
+    bus = AlertBus(cooldown_minutes=0, delivery_queue_size=2, backpressure='drop_oldest')
+    bus.subscribe(inline.append)
+    bus.subscribe(_slow, asynchronous=True)
+    bus.publish('MissedClass', minute_stamp=0, severity='low', message='a')
+    assert started.wait(5)
+    for message in 'bcd':
+        bus.publish('MissedClass', minute_stamp=0, severity='low', message=message)
+    assert [alert.message for alert in inline] == ['a', 'b', 'c', 'd']
+    assert delivered == [] and bus.delivery.dropped == 1
+    gate.set()
+    assert bus.close(timeout=5)
+    assert delivered == ['a', 'c', 'd']
+    assert bus.delivery is None
+
+    gate.clear()
+    started.clear()
+    delivered.clear()
+    blocking = AlertBus(cooldown_minutes=0, delivery_queue_size=1, backpressure='block')
+    blocking.subscribe(_slow, asynchronous=True)
+    blocking.publish('MissedClass', minute_stamp=0, severity='low', message='a')
+    assert started.wait(5)
+    blocking.publish('MissedClass', minute_stamp=0, severity='low', message='b')
+    publisher = threading.Thread(
+        target=blocking.publish, args=('MissedClass',), kwargs=dict(minute_stamp=0, severity='low', message='c')
+    )
+    publisher.start()
+    publisher.join(0.1)
+    assert publisher.is_alive()
+    gate.set()
+    publisher.join(5)
+    assert blocking.flush(timeout=5)
+    assert delivered == ['a', 'b', 'c']
+    blocking.close()
+
+
+def test_async_subscribers_receive_each_published_state() -> None:
+    import threading
+
+    gate = threading.Event()
+    received = []
+
+    def _slow(alert):  # type: ignore[no-redef]
+        gate.wait(5)
+        received.append(alert)
+
+    bus = AlertBus(cooldown_minutes=10)
+    bus.subscribe(_slow, asynchronous=True)
+    alert = bus.publish('Overcapacity', minute_stamp=60, severity='high', message='Library full', room_id='Library')
+    bus.acknowledge(alert.id, minute_stamp=75)
+    gate.set()
+    assert bus.close(timeout=5)
+
+    assert [(item.id, item.acknowledged_at) for item in received] == [(alert.id, None), (alert.id, '01:15')]
+    assert all(item is not alert for item in received)
+
+
+def test_aggregation_window_folds_bursts_per_room() -> None:
+    bus = AlertBus(cooldown_minutes=10, aggregation_windows={'MissedClass': 5})
+
+    def _missed(minute, name, room='Lab'):
+        return bus.publish(
+            'MissedClass', minute_stamp=minute, severity='high', message=f'{name} missed', room_id=room, npc_ids=[name]
+        )
+
+    observed = []
+    bus.subscribe(lambda alert: observed.append((alert.id, alert.count, alert.npc_ids)))
+    first = _missed(100, 'Ann')
+    for minute, name in ((101, 'Cy'), (102, 'Bo'), (103, 'Cy')):
+        assert _missed(minute, name) is first
+    assert _missed(103, 'Di', room='Gym') is not first
+    assert len(observed) == 2
+
+    assert bus.flush_aggregates() == 1
+    assert bus.flush_aggregates() == 0
+    assert observed[-1] == (first.id, 3, ('Ann', 'Bo', 'Cy'))
+    assert first.message == 'Ann missed (+2 more)'
+    assert len(list(bus.iter_history())) == 2
+
+    # Folded NPCs share the aggregate's cooldown; new NPCs open a new window.
+    assert _missed(106, 'Bo') is first
+    later = _missed(106, 'Ed')
+    assert later is not first and later.count == 1
+    bus.acknowledge(later.id, minute_stamp=107)
+    assert _missed(108, 'Fy') is not later
+
+
+def test_aggregates_and_cooldowns_close_across_midnight() -> None:
+    bus = AlertBus(cooldown_minutes=10, aggregation_windows={'MissedClass': 5}, day_length_minutes=1440)
+
+    def _missed(minute, name):
+        return bus.publish(
+            'MissedClass', minute_stamp=minute, severity='high', message=f'{name} missed', room_id='Lab', npc_ids=[name]
+        )
+
+    late = _missed(1438, 'Ann')
+    assert _missed(1, 'Bo') is late
+    after = _missed(4, 'Cy')
+    assert after is not late and after.npc_ids == ('Cy',)
+
+    assert _missed(5, 'Ann') is late
+    assert _missed(9, 'Ann') is not late
@@ -6,6 +6,7 @@ from game.simulation.conflict_resolver import (
     detect_room_capacity_conflicts,
     resolve_with_staggering,
 )
+from game.simulation.conflict_optimizer import resolve_with_optimization
 from game.simulation.schedule_generator import DailySchedule
 
 
@@ -45,3 +46,121 @@ def test_conflict_detection_and_resolution():
     # No conflicts remain after staggering.
     remaining = detect_room_capacity_conflicts(schedules, {'Library': room})
     assert not remaining
+
+
+def _reference_detect(schedules, room_metadata):
+    conflicts = []
+    seen = set()
+    for room_name, room in room_metadata.items():
+        if not room.capacity:
+            continue
+        room_blocks = [block for block in schedules if block.room_id == room_name and block.duration_minutes > 0]
+        events = []
+        for block in room_blocks:
+            start, end = block.absolute_interval()
+            events.append((start, 1, block))
+            events.append((end, -1, block))
+        events.sort(key=lambda item: (item[0], item[1]))
+        active = []
+        for time, delta, block in events:
+            if delta == 1:
+                active.append(block)
+                if len(active) > room.capacity:
+                    actor_ids = tuple(sorted({slot.actor_id for slot in active}))
+                    if (room_name, time, actor_ids) not in seen:
+                        seen.add((room_name, time, actor_ids))
+                        conflicts.append(
+                            ConflictRecord(room_name, time % 1440, time % 1440, room.capacity, actor_ids)
+                        )
+            elif block in active:
+                active.remove(block)
+    return conflicts
+
+
+def test_sweep_detector_matches_reference_output():
+    import random
+
+    rng = random.Random(7)
+    rooms = {f'Room_{index}': _make_room(f'Room_{index}', capacity=rng.randint(1, 4)) for index in range(6)}
+    schedules = [
+        DailySchedule(
+            actor_id=f'Actor_{index % 40}',
+            slot=f'slot_{index}',
+            activity_id='study',
+            room_id=rng.choice(list(rooms) + ['Hallway']),
+            start_tick=rng.randrange(0, 1440, 15),
+            duration_minutes=rng.choice((0, 30, 60, 120)),
+            day_length_minutes=1440,
+        )
+        for index in range(400)
+    ]
+
+    conflicts = detect_room_capacity_conflicts(schedules, rooms)
+    assert conflicts
+    assert conflicts == _reference_detect(schedules, rooms)
+
+
+def test_sweep_resolver_clears_rooms_and_iterative_mode_remains():
+    import random
+
+    rng = random.Random(11)
+    rooms = {f'Room_{index}': _make_room(f'Room_{index}', capacity=rng.randint(1, 3)) for index in range(4)}
+
+    def _roster():
+        rng.seed(11)
+        return [
+            DailySchedule(
+                actor_id=f'Actor_{index}',
+                slot='study',
+                activity_id='study',
+                room_id=rng.choice(list(rooms)),
+                start_tick=rng.randrange(8 * 60, 12 * 60, 15),
+                duration_minutes=rng.choice((30, 45, 60)),
+                day_length_minutes=1440,
+            )
+            for index in range(60)
+        ]
+
+    swept = _roster()
+    records = resolve_with_staggering(swept, rooms)
+    assert records and not detect_room_capacity_conflicts(swept, rooms)
+    assert sum(record.shift_minutes for record in records) == sum(block.stagger_applied for block in swept)
+    assert all(record.shift_minutes % 5 == 0 for record in records)
+
+    iterated = _roster()
+    resolve_with_staggering(iterated, rooms, mode='iterative')
+    assert sum(block.stagger_applied for block in swept) <= sum(block.stagger_applied for block in iterated)
+
+
+def _block(actor, room, start, duration):
+    return DailySchedule(
+        actor_id=actor,
+        slot='study',
+        activity_id='study',
+        room_id=room,
+        start_tick=start,
+        duration_minutes=duration,
+        day_length_minutes=1440,
+    )
+
+
+def test_optimizer_minimises_total_shift_and_respects_actor_slots():
+    rooms = {'Library': _make_room('Library', capacity=1), 'Lab': _make_room('Lab', capacity=5)}
+    greedy = [_block('Ada', 'Library', 480, 60), _block('Ben', 'Library', 480, 10)]
+    resolve_with_staggering(greedy, rooms)
+    optimized = [_block('Ada', 'Library', 480, 60), _block('Ben', 'Library', 480, 10)]
+    records = resolve_with_optimization(optimized, rooms, time_budget_seconds=None)
+
+    assert sum(block.stagger_applied for block in greedy) == 60
+    assert sum(block.stagger_applied for block in optimized) == 10
+    assert records == [ConflictRecord('Library', 480, 490, 1, ('Ada', 'Ben'), shift_minutes=10)]
+
+    # Cam's next class starts at 08:40, so Cam keeps the short slot and Ben waits.
+    schedules = [
+        _block('Ben', 'Library', 480, 60),
+        _block('Cam', 'Library', 480, 30),
+        _block('Cam', 'Lab', 520, 60),
+    ]
+    resolve_with_optimization(schedules, rooms, time_budget_seconds=None)
+    assert [block.start_tick for block in schedules] == [510, 480, 520]
+    assert not detect_room_capacity_conflicts(schedules, rooms)
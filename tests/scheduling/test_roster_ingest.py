@@ -0,0 +1,82 @@
+import csv
+import json
+from pathlib import Path
+
+import yaml
+
+from game.core.map import MapGrid
+from game.simulation.roster_ingest import iter_assignment_records
+from game.systems.schedule_system import ScheduleSystem
+
+SCHEDULES = Path('config') / 'schedules'
+
+
+def _write_roster(tmp_path: Path, assignments_file: Path) -> Path:
+    roster_path = tmp_path / 'roster.yaml'
+    roster_path.write_text(
+        yaml.safe_dump(
+            {
+                'activities_file': str((SCHEDULES / 'activities.yaml').resolve()),
+                'templates_file': str((SCHEDULES / 'student_templates.yaml').resolve()),
+                'assignments_file': assignments_file.name,
+            }
+        ),
+        encoding='utf-8',
+    )
+    return roster_path
+
+
+def test_json_lines_roster_streams_assignments(tmp_path):
+    override = [{'slot': 'clubs', 'activity': 'study', 'room': 'Library', 'duration': '01:30'}]
+    lines = [
+        json.dumps({'name': f'Student{idx:03d}', 'role': 'student', 'template': 'boarding_student', 'overrides': override})
+        for idx in range(6)
+    ]
+    assignments_path = tmp_path / 'assignments.jsonl'
+    assignments_path.write_text('# district roster\n' + '\n'.join(lines) + '\n', encoding='utf-8')
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+
+    sched = ScheduleSystem(grid, str(_write_roster(tmp_path, assignments_path)), measure_memory=True)
+
+    assert len(sched.npcs) == 6
+    assert sched.ingest_stats.assignments == 6
+    assert sched.ingest_stats.peak_memory_bytes
+    clubs = next(block for block in sched.daily_plan['Student004'] if block.slot == 'clubs')
+    assert clubs.room_id == 'Library'
+
+
+def test_csv_roster_parses_override_column(tmp_path):
+    assignments_path = tmp_path / 'assignments.csv'
+    with assignments_path.open('w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(['name', 'role', 'template', 'variant', 'notes', 'overrides'])
+        writer.writerow(['Quinn', 'student', 'athlete_student', 'weekday', 'Captain', ''])
+        writer.writerow(
+            ['Rae', 'student', 'boarding_student', '', '', json.dumps([{'slot': 'clubs', 'room': 'Library'}])]
+        )
+
+    records = list(iter_assignment_records(assignments_path))
+    assert records[0] == {
+        'name': 'Quinn',
+        'role': 'student',
+        'template': 'athlete_student',
+        'variant': 'weekday',
+        'notes': 'Captain',
+    }
+    assert records[1]['overrides'] == [{'slot': 'clubs', 'room': 'Library'}]
+
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    sched = ScheduleSystem(grid, str(_write_roster(tmp_path, assignments_path)))
+    assert {npc.name for npc in sched.npcs} == {'Quinn', 'Rae'}
+
+
+def test_streamed_roster_must_be_referenced_from_yaml(tmp_path):
+    assignments_path = tmp_path / 'assignments.jsonl'
+    assignments_path.write_text('', encoding='utf-8')
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    try:
+        ScheduleSystem(grid, str(assignments_path))
+    except ValueError as exc:
+        assert 'assignments_file' in str(exc)
+    else:
+        raise AssertionError('ValueError not raised')
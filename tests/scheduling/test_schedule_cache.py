@@ -0,0 +1,78 @@
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from game.core.map import MapGrid
+from game.simulation import schedule_generator
+from game.systems import schedule_cache
+from game.systems.schedule_system import ScheduleSystem
+
+
+def _write_roster(tmp_path: Path) -> Path:
+    schedules_dir = Path('config') / 'schedules'
+    for name in ('activities.yaml', 'student_templates.yaml'):
+        shutil.copy(schedules_dir / name, tmp_path / name)
+    roster = yaml.safe_load((schedules_dir / 'npc_assignments.yaml').read_text(encoding='utf-8'))
+    roster['activities_file'] = str(tmp_path / 'activities.yaml')
+    roster['templates_file'] = str(tmp_path / 'student_templates.yaml')
+    roster_path = tmp_path / 'roster.yaml'
+    roster_path.write_text(yaml.safe_dump(roster), encoding='utf-8')
+    return roster_path
+
+
+def _plan_signature(sched: ScheduleSystem):
+    return {
+        actor: [(b.activity_id, b.room_id, b.start_tick, b.travel_buffer, b.expected_travel) for b in blocks]
+        for actor, blocks in sched.daily_plan.items()
+    }
+
+
+def test_compiled_plan_cache_round_trip(tmp_path, monkeypatch):
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    roster_path = _write_roster(tmp_path)
+    cache_dir = tmp_path / 'cache'
+
+    first = ScheduleSystem(grid, str(roster_path), cache_dir=cache_dir)
+    assert list(cache_dir.glob('*.plan'))
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError('cache hit should skip travel estimation')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(schedule_generator.TravelEstimator, 'annotate', _fail)
+        cached = ScheduleSystem(grid, str(roster_path), cache_dir=cache_dir)
+    assert _plan_signature(cached) == _plan_signature(first)
+    assert [npc.name for npc in cached.npcs] == [npc.name for npc in first.npcs]
+
+    templates_path = tmp_path / 'student_templates.yaml'
+    templates_path.write_text(templates_path.read_text(encoding='utf-8') + '\n# edited\n', encoding='utf-8')
+    with monkeypatch.context() as patch:
+        patch.setattr(schedule_generator.TravelEstimator, 'annotate', _fail)
+        with pytest.raises(AssertionError):
+            ScheduleSystem(grid, str(roster_path), cache_dir=cache_dir)
+
+
+def test_cache_key_tracks_planner_code(tmp_path, monkeypatch):
+    roster_path = _write_roster(tmp_path)
+    map_path = Path('data') / 'campus_map_v1.json'
+    cache = schedule_cache.CompiledPlanCache(tmp_path / 'cache')
+    key = cache.key_for(roster_path, map_path, day_length_minutes=1440)
+
+    monkeypatch.setattr(schedule_cache, 'planner_fingerprint', lambda: 'edited-resolver')
+    assert cache.key_for(roster_path, map_path, day_length_minutes=1440) != key
+    assert any(path.name == 'conflict_optimizer.py' for path in schedule_cache._PLANNER_SOURCES)
+
+
+def test_cache_key_tracks_resolver_mode(tmp_path):
+    roster_path = _write_roster(tmp_path)
+    map_path = Path('data') / 'campus_map_v1.json'
+    cache = schedule_cache.CompiledPlanCache(tmp_path / 'cache')
+    keys = set()
+    for mode in ('sweep', 'iterative', 'optimize'):
+        roster = yaml.safe_load(roster_path.read_text(encoding='utf-8'))
+        roster['conflict_resolution'] = {'strategy': mode}
+        roster_path.write_text(yaml.safe_dump(roster), encoding='utf-8')
+        keys.add(cache.key_for(roster_path, map_path, day_length_minutes=1440))
+    assert len(keys) == 3
@@ -0,0 +1,80 @@
+import random
+
+from game.simulation.schedule_generator import DailySchedule
+from game.systems.schedule_index import RoomIntervalIndex
+
+
+def _block(actor, start, duration, room='Library'):
+    return DailySchedule(
+        actor_id=actor,
+        slot='study',
+        activity_id='study',
+        room_id=room,
+        start_tick=start,
+        duration_minutes=duration,
+        day_length_minutes=1440,
+    )
+
+
+def _overlaps(block, start, end):
+    block_start, block_end = block.absolute_interval()
+    return block_end > block_start and any(
+        block_start < end + offset and start + offset < block_end for offset in (-1440, 0, 1440)
+    )
+
+
+def test_interval_index_matches_linear_scan_across_midnight():
+    rng = random.Random(3)
+    blocks = [_block(f'Actor{index}', rng.randrange(0, 1440, 5), rng.choice((0, 15, 60, 180))) for index in range(300)]
+    index = RoomIntervalIndex(1440)
+    index.rebuild(blocks)
+
+    for start in range(0, 1440, 37):
+        for length in (1, 30, 240):
+            expected = {id(block) for block in blocks if _overlaps(block, start, start + length)}
+            assert {id(block) for block in index.between('Library', start, start + length)} == expected
+    assert index.at('Kitchen', 600) == []
+
+
+def test_interval_index_follows_updates():
+    late = _block('Night', 1410, 60)
+    index = RoomIntervalIndex(1440)
+    index.rebuild([late, _block('Day', 600, 60)])
+
+    assert index.at('Library', 10) == [late]
+    assert index.at('Library', 1415) == [late]
+    index.remove(late)
+    assert index.at('Library', 10) == []
+
+    early = _block('Early', 5, 30)
+    index.add(early)
+    early.shift_by(60)
+    index.invalidate(['Library'])
+    assert index.at('Library', 10) == []
+    assert index.at('Library', 70) == [early]
+
+
+def test_interval_index_updates_in_place_and_matches_linear_scan():
+    rng = random.Random(11)
+    live = [_block(f'Actor{index}', rng.randrange(0, 1440, 5), rng.choice((15, 60, 180))) for index in range(200)]
+    index = RoomIntervalIndex(1440)
+    index.rebuild(live)
+    tree = index._trees['Library']
+
+    for step in range(300):
+        action = rng.random()
+        if action < 0.3 and live:
+            index.remove(live.pop(rng.randrange(len(live))))
+        elif action < 0.6:
+            block = _block(f'New{step}', rng.randrange(0, 1440, 5), rng.choice((15, 60, 180)))
+            live.append(block)
+            index.add(block)
+        elif live:
+            rng.choice(live).shift_by(rng.choice((-30, 15, 45)))
+            index.invalidate(['Library'])
+        start = rng.randrange(0, 1440)
+        expected = {id(block) for block in live if _overlaps(block, start, start + 45)}
+        assert {id(block) for block in index.between('Library', start, start + 45)} == expected
+
+    assert index._trees['Library'] is tree
+    assert len(index.blocks_in('Library')) == len(live)
@@ -0,0 +1,86 @@
+import pickle
+
+from game.simulation.schedule_generator import ScheduleAssignment, ScheduleTemplate, parse_hhmm
+from game.simulation.schedule_store import ScheduleRow, ScheduleStore
+
+
+def _template() -> ScheduleTemplate:
+    return ScheduleTemplate(
+        'boarding',
+        {
+            'weekday': [
+                {'slot': 'wake', 'start': '06:30', 'duration': '00:30', 'activity': 'wake', 'room': 'Dorm_North'},
+                {'slot': 'late', 'start': '23:30', 'duration': '01:00', 'activity': 'rest', 'room': 'Dorm_North'},
+            ]
+        },
+        day_length_minutes=1440,
+    )
+
+
+def test_assignments_fill_shared_columns():
+    store = ScheduleStore(1440)
+    template = _template()
+    alice = template.instantiate('Alice', 'weekday', store=store)
+    bob = ScheduleAssignment(
+        actor_id='Bob',
+        template_name='boarding',
+        template=template,
+        overrides=[{'slot': 'wake', 'start': '07:00', 'notes': 'late riser'}],
+    ).apply(store=store)
+
+    assert all(isinstance(row, ScheduleRow) for row in alice + bob)
+    assert len(store) == 4
+    assert len(store.rooms) == 1 and len(store.activities) == 2
+    assert bob[0].start_tick == parse_hhmm('07:00') and bob[0].notes == 'late riser'
+    assert alice[1].absolute_interval() == (23 * 60 + 30, 24 * 60 + 30)
+
+    alice[0].shift_by(5)
+    assert store.start[alice[0].index] == parse_hhmm('06:35')
+    assert store.stagger[alice[0].index] == 5
+
+    alice[0].travel_path = [(0, 0), (1, 0)]
+    bob[0].travel_path = [(0, 0), (1, 0)]
+    assert alice[0].travel_path is bob[0].travel_path
+
+
+def test_store_rows_survive_pickling_with_shared_store():
+    store = ScheduleStore(1440)
+    plan = {'Alice': _template().instantiate('Alice', 'weekday', store=store)}
+    store.release(plan['Alice'][:1])
+
+    restored = pickle.loads(pickle.dumps({'store': store, 'plan': plan}))
+    rows = restored['plan']['Alice']
+    assert rows[0].store is restored['store']
+    assert [row.to_block().slot for row in rows] == ['wake', 'late']
+    assert list(restored['store'].live_indices()) == [1]
+
+
+def test_repeated_overrides_reuse_released_rows():
+    from pathlib import Path
+
+    from game.core.map import MapGrid
+    from game.simulation.conflict_resolver import detect_room_capacity_conflicts, detect_store_conflicts
+    from game.systems.schedule_system import ScheduleSystem
+
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    system = ScheduleSystem(grid, str(Path('config') / 'schedules' / 'npc_assignments.yaml'))
+    store = system.store
+    name = sorted(system.daily_plan)[0]
+    block = {'activity': 'class', 'start': '09:00', 'duration': '00:50', 'room': 'Counseling'}
+    system.override_plan(name, [block, dict(block, start='10:00')])
+    size = len(store)
+    for _ in range(20):
+        system.override_plan(name, [block, dict(block, start='10:00')])
+    assert len(store) == size
+    assert store.live_count == sum(len(blocks) for blocks in system.daily_plan.values())
+
+    crowded = ScheduleStore(1440)
+    rows = [
+        crowded.append(
+            actor_id=f'npc{index}', slot='s', activity_id='a', room_id='Counseling', start_tick=540 + index,
+            duration_minutes=30,
+        )
+        for index in range(5)
+    ]
+    expected = detect_room_capacity_conflicts(rows, grid.rooms)
+    assert expected and detect_store_conflicts(crowded, grid.rooms) == expected
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from game.core.map import MapGrid
+from game.simulation import schedule_generator
 from game.simulation.schedule_generator import (
     DailySchedule,
     ScheduleAssignment,
@@ -101,3 +102,43 @@ def test_travel_estimator_updates_expected_path():
     second = blocks['Alice'][1]
     assert second.expected_travel is not None
     assert second.travel_buffer >= second.expected_travel
+
+
+def test_parallel_travel_estimator_dedupes_routes_and_matches_serial(monkeypatch):
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    rooms = ['Dorm_North', 'Classroom_STEM', 'Library', 'Dorm_North']
+
+    def _roster():
+        return {
+            f'Student{index}': [
+                DailySchedule(
+                    actor_id=f'Student{index}',
+                    slot=f'slot{position}',
+                    activity_id='study',
+                    room_id=room,
+                    start_tick=parse_hhmm('08:00') + 120 * position,
+                    duration_minutes=60,
+                    day_length_minutes=1440,
+                )
+                for position, room in enumerate(rooms)
+            ]
+            for index in range(20)
+        }
+
+    serial = _roster()
+    calls = []
+    original_astar = schedule_generator.astar
+
+    def _counting_astar(*args, **kwargs):
+        calls.append(args[1:3])
+        return original_astar(*args, **kwargs)
+
+    monkeypatch.setattr(schedule_generator, 'astar', _counting_astar)
+    TravelEstimator(grid).annotate(serial)
+    assert len(calls) == 3
+
+    parallel = _roster()
+    TravelEstimator(grid, workers=2, parallel_threshold=1).annotate(parallel)
+    for name, blocks in serial.items():
+        assert [block.travel_path for block in blocks] == [block.travel_path for block in parallel[name]]
+        assert [block.expected_travel for block in blocks] == [block.expected_travel for block in parallel[name]]
@@ -36,3 +36,43 @@ def test_movement_system_reuses_cached_paths(monkeypatch) -> None:
     actor.path.clear()
     system.plan_if_needed(actor)
     assert calls['count'] == 1
+
+
+def test_abstract_trip_waits_for_a_free_destination() -> None:
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    system = MovementSystem(grid)
+    start = grid.room_center('Dorm_North')
+    goal = grid.room_center('Library')
+    actor = NPC(name='Traveller', x=start[0], y=start[1], role='student', schedule=[])
+    actor.set_target(*goal)
+
+    system.travel_abstractly(actor, 2)
+    assert not system.step_abstract(actor, {goal})
+    assert not system.step_abstract(actor, {goal})
+    assert (actor.x, actor.y) == start and system.is_abstract(actor)
+
+    assert system.step_abstract(actor, set())
+    assert (actor.x, actor.y) == goal and not system.is_abstract(actor)
+
+
+def test_movement_reports_room_entries_and_exits() -> None:
+    from game.world import RoomManager
+
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    rooms = RoomManager(grid)
+    movement = MovementSystem(grid, room_manager=rooms)
+    npc = NPC(name='Walker', x=10, y=6, role='student', schedule=[])
+    rooms.track_entry(npc.name, 'Dorm_North')
+
+    npc.target = (12, 6)
+    npc.path = [(11, 6), (12, 6)]
+    movement.step(npc)
+    assert rooms.location_of(npc.name) == 'Dorm_North' and rooms.occupancy('Dorm_North') == 1
+    movement.step(npc)
+    assert rooms.location_of(npc.name) is None and rooms.occupancy('Dorm_North') == 0
+
+    npc.target = (11, 8)
+    npc.path = [(11, 7), (11, 8)]
+    movement.step(npc, steps=2)
+    assert rooms.location_of(npc.name) == 'Dorm_Commons'
+    assert rooms.occupants('Dorm_Commons') == ['Walker'] and rooms.occupancy('Dorm_North') == 0
@@ -1,6 +1,9 @@
 from pathlib import Path
 
+import pytest
+
 from game.core.map import MapGrid
+from game.simulation.conflict_resolver import detect_room_capacity_conflicts
 from game.simulation.activities import ActivityCatalog
 from game.systems.schedule_system import ScheduleSystem
 
@@ -16,7 +19,7 @@ def test_schedule_loads_and_creates_npcs(tmp_path):
     assert len(sched.npcs) >= 2
 
     t, act = sched.npcs[0].schedule[0]
-    assert isinstance(t, str) and hasattr(act, 'name')
+    assert isinstance(t, int) and hasattr(act, 'name')
     assert act.profile is not None
 
     # Ensure spawn points respect role-aware configuration.
@@ -37,3 +40,100 @@ def test_schedule_loads_and_creates_npcs(tmp_path):
     export_path = tmp_path / 'daily_plan.csv'
     sched.export_daily_plan(export_path)
     assert export_path.exists()
+
+
+def test_dispatch_table_follows_overrides():
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    sched = ScheduleSystem(grid, str(Path('config') / 'schedules' / 'npc_assignments.yaml'))
+    alice = next(npc for npc in sched.npcs if npc.name == 'Alice')
+    first_time, first_activity = alice.schedule[0]
+
+    sched.update(first_time)
+    assert alice.pending_schedule is first_activity
+
+    sched.override_plan('Alice', [{'start': '13:37', 'activity': 'study', 'room': 'Library', 'duration': '00:30'}])
+    assert alice.pending_schedule is None
+    sched.update(first_time)
+    assert alice.pending_schedule is None
+
+    sched.update(13 * 60 + 37)
+    assert alice.pending_schedule is not None
+    assert alice.pending_schedule.name == 'study'
+    assert alice.pending_activity_start_minutes == 13 * 60 + 37
+
+
+def test_override_recalculates_only_touched_actor_and_rooms(monkeypatch):
+    from game.simulation import schedule_generator
+
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    sched = ScheduleSystem(grid, str(Path('config') / 'schedules' / 'npc_assignments.yaml'))
+    annotated = []
+    original_annotate = schedule_generator.TravelEstimator.annotate
+
+    def _recording_annotate(self, schedules, **kwargs):
+        annotated.append(sorted(schedules))
+        return original_annotate(self, schedules, **kwargs)
+
+    monkeypatch.setattr(schedule_generator.TravelEstimator, 'annotate', _recording_annotate)
+
+    names = [npc.name for npc in sched.npcs][:4]
+    block = {'start': '14:00', 'activity': 'study', 'room': 'Counseling', 'duration': '01:00'}
+    for name in names[:3]:
+        sched.override_plan(name, [dict(block)])
+        assert sched.conflicts == []
+    assert annotated == [[name] for name in names[:3]]
+
+    sched.override_plan(names[3], [dict(block)])
+    assert sched.conflicts
+    assert {record.room for record in sched.conflicts} == {'Counseling'}
+    starts = sorted(sched.daily_plan[name][0].start_tick for name in names)
+    assert starts[:3] == [14 * 60] * 3
+    assert starts[3] >= 15 * 60
+
+
+def test_override_follows_staggered_blocks_into_neighbouring_windows():
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+    sched = ScheduleSystem(grid, str(Path('config') / 'schedules' / 'npc_assignments.yaml'))
+    names = [npc.name for npc in sched.npcs]
+    assert len(names) >= 7
+    early = {'start': '14:00', 'activity': 'study', 'room': 'Counseling', 'duration': '01:00'}
+    late = dict(early, start='15:00')
+    for name in names[:3]:
+        sched.override_plan(name, [dict(early)])
+    for name in names[3:6]:
+        sched.override_plan(name, [dict(late)])
+
+    sched.override_plan(names[6], [dict(early)])
+
+    flat = [block for blocks in sched.daily_plan.values() for block in blocks]
+    assert detect_room_capacity_conflicts(flat, {'Counseling': grid.rooms['Counseling']}) == []
+    for npc in sched.npcs:
+        assert npc.schedule == sched._build_schedule(sched.daily_plan[npc.name])
+
+
+def test_roster_selects_optimizing_conflict_resolver(tmp_path):
+    import yaml
+
+    schedules_dir = (Path('config') / 'schedules').resolve()
+    roster = yaml.safe_load((schedules_dir / 'npc_assignments.yaml').read_text(encoding='utf-8'))
+    roster['activities_file'] = str(schedules_dir / 'activities.yaml')
+    roster['templates_file'] = str(schedules_dir / 'student_templates.yaml')
+    roster['conflict_resolution'] = {'strategy': 'optimize', 'time_budget_seconds': None}
+    roster_path = tmp_path / 'roster.yaml'
+    roster_path.write_text(yaml.safe_dump(roster), encoding='utf-8')
+    grid = MapGrid(str(Path('data') / 'campus_map_v1.json'))
+
+    optimized = ScheduleSystem(grid, str(roster_path))
+    greedy = ScheduleSystem(grid, str(Path('config') / 'schedules' / 'npc_assignments.yaml'))
+
+    assert optimized.conflict_resolution.strategy == 'optimize'
+    flat = [block for blocks in optimized.daily_plan.values() for block in blocks]
+    assert detect_room_capacity_conflicts(flat, grid.rooms) == []
+    assert sum(record.shift_minutes for record in optimized.conflicts) <= sum(
+        record.shift_minutes for record in greedy.conflicts
+    )
+
+    roster['conflict_resolution'] = 'fastest'
+    roster_path.write_text(yaml.safe_dump(roster), encoding='utf-8')
+    with pytest.raises(ValueError):
+        ScheduleSystem(grid, str(roster_path))
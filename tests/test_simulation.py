@@ -89,3 +89,113 @@ def test_campus_map_alias_uses_latest_layout():
     expected = project_root / 'data' / 'campus_map_v1.json'
     resolved = resolve_map_file('campus_map', 'data/campus_map_v1.json')
     assert resolved == expected
+
+
+def test_snapshot_delta_reports_only_changes():
+    simulation = Simulation(CFG)
+    full = simulation.snapshot_delta()
+    assert full['full'] is True
+    assert set(full['npc_states']) == {npc.name for npc in simulation.npcs}
+    version = full['version']
+
+    assert simulation.snapshot_delta(since=version)['npc_states'] == {}
+
+    simulation.tick()
+    delta = simulation.snapshot_delta(since=version)
+    assert delta['full'] is False
+    assert delta['version'] > version
+    moved = {npc.name for npc in simulation.npcs if npc.state == NPCState.MOVING}
+    assert moved <= set(delta['npc_states'])
+
+    alert = simulation.alert_bus.publish(
+        'Overcapacity',
+        minute_stamp=480,
+        severity='medium',
+        message='Delta test',
+        room_id='Library',
+        npc_ids=['Alice'],
+    )
+    latest = delta['version']
+    simulation.tick()
+    follow_up = simulation.snapshot_delta(since=latest)
+    assert alert.id in {entry['id'] for entry in follow_up['alerts']}
+    assert simulation.snapshot_delta(since=follow_up['version'])['alerts'] == []
+
+
+def test_snapshot_delta_tracks_movement_activity_and_evicted_alerts():
+    simulation = Simulation(CFG)
+    version = simulation.snapshot_version
+    npc = simulation.npcs[0]
+    simulation.movement_system._relocate(npc, (npc.x, npc.y))
+    simulation._record_changes()
+    assert simulation.snapshot_version == version
+
+    simulation.movement_system._set_state(
+        npc, NPCState.PERFORMING_TASK if npc.state != NPCState.PERFORMING_TASK else NPCState.IDLE
+    )
+    simulation._record_changes()
+    assert list(simulation.snapshot_delta(since=version)['npc_states']) == [npc.name]
+
+    version = simulation.snapshot_version
+    simulation.alert_bus = bus = type(simulation.alert_bus)(history_limit=1)
+    bus.subscribe(simulation._on_alert)
+    first = bus.publish('Overcapacity', minute_stamp=480, severity='medium', message='a', room_id='Library')
+    bus.acknowledge(first.id, minute_stamp=481)
+    bus.publish('Overcapacity', minute_stamp=482, severity='medium', message='b', room_id='Gymnasium')
+    simulation._record_changes()
+    alerts = simulation.snapshot_delta(since=version)['alerts']
+    assert {'id': first.id, 'removed': True} in alerts
+
+
+def test_level_of_detail_npcs_still_reach_class():
+    simulation = Simulation(CFG)
+    simulation.set_level_of_detail(True)
+    steps = []
+    original_step = simulation.movement_system.step
+
+    def _counting_step(*args, **kwargs):
+        steps.append(args[0].name)
+        return original_step(*args, **kwargs)
+
+    simulation.movement_system.step = _counting_step
+    _advance(simulation, 120)
+
+    assert not steps
+    class_rect = simulation.grid.rooms['Classroom_STEM'].rect
+    assert any(_position_in_room((npc.x, npc.y), class_rect) for npc in simulation.npcs)
+    assert any(getattr(npc.current_activity, 'name', None) == 'class' for npc in simulation.npcs)
+
+
+def test_level_of_detail_materializes_observed_travellers():
+    simulation = Simulation(CFG)
+    simulation.set_level_of_detail(True)
+    simulation.advance(3)
+    traveller = next(npc for npc in simulation.npcs if simulation.movement_system.is_abstract(npc))
+
+    simulation.set_level_of_detail(True, viewport=(0, 0, simulation.grid.width, simulation.grid.height))
+    simulation.tick()
+    assert not simulation.movement_system.is_abstract(traveller)
+    assert traveller.path or traveller.target is None
+
+
+def test_materialize_waits_when_every_tile_back_to_origin_is_taken():
+    from game.core.pathfinding import astar
+
+    simulation = Simulation(CFG)
+    movement = simulation.movement_system
+    npc = simulation.npcs[0]
+    origin = (npc.x, npc.y)
+    destination = simulation.grid.room_center('Library')
+    npc.set_target(*destination)
+    movement.travel_abstractly(npc, 5)
+    for _ in range(3):
+        movement.step_abstract(npc)
+    path = astar(simulation.grid, origin, destination)
+
+    movement.materialize(npc, occupied=set(path[:4]))
+    assert movement.is_abstract(npc)
+    assert (npc.x, npc.y) == origin
+
+    movement.materialize(npc, occupied=set(path[1:4]))
+    assert not movement.is_abstract(npc)
+    assert (npc.x, npc.y) == origin and npc.path == list(path[1:])
@@ -0,0 +1,66 @@
+import time
+
+from game.config import load_config
+from game.simulation import Simulation
+from game.simulation.runner import SimulationRunner
+
+CFG = load_config()
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_runner_bounds_catch_up_ticks():
+    simulation = Simulation(CFG)
+    clock = _FakeClock()
+    runner = SimulationRunner(simulation, tick_rate_hz=10, max_catchup_ticks=3, clock=clock)
+    runner.run_pending(0.0)
+
+    assert runner.run_pending(0.25) == 2
+    assert runner.run_pending(5.0) == 3
+    assert runner.dropped_ticks > 0
+    assert runner.run_pending(5.05) == 0
+    assert runner.run_pending(5.12) == 1
+
+
+def test_runner_interpolates_between_frames():
+    simulation = Simulation(CFG)
+    clock = _FakeClock()
+    runner = SimulationRunner(simulation, tick_rate_hz=10, clock=clock)
+    runner.run_pending(0.0)
+    runner.run_pending(0.1)
+    runner.run_pending(0.2)
+    previous, current = runner.frames()
+    moved = [
+        name
+        for name, pos in current.positions.items()
+        if previous.positions.get(name) not in (None, pos)
+    ]
+    assert moved
+    name = moved[0]
+    halfway = runner.interpolated_positions(current.time + runner.tick_interval / 2)[name]
+    start, end = previous.positions[name], current.positions[name]
+    assert halfway == ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
+    assert runner.interpolated_positions(current.time + 1.0)[name] == tuple(map(float, end))
+    assert current.states[name] == simulation.get_npc(name).state.value
+    assert current.clock_text == simulation.clock.get_time_str()
+
+
+def test_runner_thread_advances_simulation():
+    simulation = Simulation(CFG)
+    runner = SimulationRunner(simulation, tick_rate_hz=200)
+    start_minute = simulation.clock.minute
+    runner.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while simulation.clock.minute == start_minute and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        runner.stop()
+    assert not runner.running
+    assert simulation.clock.minute != start_minute
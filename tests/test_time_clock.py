@@ -1,3 +1,6 @@
 from game.core.time_clock import GameClock
 def test_clock_wraps_day():
  c=GameClock(60,24*60,23*60); c.tick(); assert c.get_time_str()=='00:00'
+def test_clock_reports_integer_minute_of_day():
+ c=GameClock(0.2,24*60,8*60+59.9); assert c.minute_of_day==539; c.tick(); assert c.minute_of_day==540
+ assert c.minutes_until(9*60+30)==30.0 and c.minutes_until('09:30')==30.0